@@ -5,6 +5,7 @@ from PyQt5.QtGui import QPalette, QColor
 from PyQt5.QtCore import Qt
 
 from smart_project_manager.ui.main_window import MainWindow
+from smart_project_manager.ui.theme import apply_theme
 
 
 def main():
@@ -30,6 +31,7 @@ def main():
     dark_palette.setColor(QPalette.Disabled, QPalette.ButtonText, QColor(150, 150, 150))
 
     app.setPalette(dark_palette)
+    apply_theme(app)
 
     window = MainWindow()
     window.show()
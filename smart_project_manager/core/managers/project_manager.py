@@ -1,80 +1,534 @@
 # Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import bisect
+import gc
 import os
-from typing import Dict, List, Optional
+import threading
+from contextlib import contextmanager
+from datetime import date, timedelta
+from itertools import chain
+from typing import AbstractSet, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
 
 from smart_project_manager.core.models.label import Label
 from smart_project_manager.core.models.project import Project
 from smart_project_manager.core.models.subtask import SubTask
 from smart_project_manager.core.models.task import Task
+from smart_project_manager.core.services.due_index import DueIndex
 from smart_project_manager.core.services.import_export_service import ImportExportService
-from smart_project_manager.core.utils import load_json, save_json, format_datetime
+from smart_project_manager.core.services.search_index import SearchIndex
+from smart_project_manager.core.storage.coalescing_writer import CoalescingWriter
+from smart_project_manager.core.storage.json_storage import JsonStorage
+from smart_project_manager.core.storage.sharded_storage import ShardedStorage
+from smart_project_manager.core.storage.sqlite_storage import SQLiteStorage
+from smart_project_manager.core.storage.storage_backend import StorageBackend
+from smart_project_manager.core.utils import calculate_progress, format_datetime, rank_between, rank_sequence
 
 
 class ProjectManager:
 
-    def __init__(self, data_dir: str = "~/.smart_project_manager"):
+    MAX_RANK_LENGTH = 32
+    LOAD_PROGRESS_STEP = 2000
+    # resident tasks + subtasks a sharded store may hold before least recently used projects are dropped
+    SHARD_BUDGET = 50000
+    # every backup from the last 30 days; keep_last, keep_daily and keep_weekly can also keep older ones
+    BACKUP_RETENTION = {'days_to_keep': 30}
+
+    QUERY_ORDERS = {
+        'priority': lambda item: item.priority,
+        'due_date': lambda item: (not item.due_date, item.due_date or ""),
+        'title': lambda item: item.title.casefold(),
+        'created_at': lambda item: item.created_at or "",
+    }
+
+    def __init__(self, data_dir: str = "~/.smart_project_manager", storage: str = "json",
+                 use_journal: bool = True, flush_interval: float = 0.0, autoload: bool = True):
         self.data_dir = os.path.expanduser(data_dir)
         self.data_file = os.path.join(self.data_dir, "projects.json")
 
-        self._ensure_data_file_exists()
+        # opened by the first load, so a backend migration runs on the thread that loads the store
+        self._storage_kind = storage
+        self._use_journal = use_journal
+        self._storage: Optional[StorageBackend] = None
+        self.writer = CoalescingWriter(None, self._collect_data, flush_interval)
 
         self.projects: Dict[str, Project] = {}
         self.tasks: Dict[str, Task] = {}
         self.subtasks: Dict[str, SubTask] = {}
         self.labels: Dict[str, Label] = {}
 
-        self.load_data()
-
-    def _ensure_data_file_exists(self):
-        os.makedirs(os.path.dirname(self.data_file), exist_ok=True)
-
-        if not os.path.exists(self.data_file):
-            empty_data = {
-                'labels': {},
-                'projects': {},
-                'tasks': {},
-                'subtasks': {}
-            }
-            save_json(self.data_file, empty_data)
-            print(f"Created new data file: {self.data_file}")
-
-    def load_data(self):
-        data = load_json(self.data_file)
-
-        self.labels = {}
-        for label_data in data.get('labels', {}).values():
-            label = Label.from_dict(label_data)
-            self.labels[label.id] = label
-
-        self.projects = {}
-        for project_data in data.get('projects', {}).values():
-            project = Project.from_dict(project_data)
-            self.projects[project.id] = project
-
-        self.tasks = {}
-        for task_data in data.get('tasks', {}).values():
-            task = Task.from_dict(task_data)
+        self._project_tasks: Dict[str, Dict[str, None]] = {}
+        self._task_subtasks: Dict[str, Dict[str, None]] = {}
+        self._label_tasks: Dict[str, Dict[str, None]] = {}
+        self._priority_tasks: Dict[Tuple[str, int], Dict[str, None]] = {}
+        self._project_ranks: Dict[str, List[Tuple[str, str]]] = {}
+        self._label_subtasks: Dict[str, Dict[str, None]] = {}
+        self._project_done_tasks: Dict[str, Dict[str, None]] = {}
+        self._task_done_subtasks: Dict[str, Dict[str, None]] = {}
+        # [subtasks, completed subtasks] of the tasks in each project
+        self._project_subtask_counts: Dict[str, List[int]] = {}
+        self._completed_tasks = 0
+        self._completed_subtasks = 0
+        self._search_index: Optional[SearchIndex] = None
+        self._search_lock = threading.Lock()
+        self._task_due = DueIndex()
+        self._subtask_due = DueIndex()
+
+        self._label_listeners: List[Callable[[Optional[str]], None]] = []
+
+        # loaded projects in least recently used order; None when the storage is not sharded
+        self._resident: Optional[Dict[str, None]] = None
+        self._shard_counts: Dict[str, Dict] = {}
+
+        self._batch_depth = 0
+        self._batch_changes: List[Tuple] = []
+        self._batch_completions: Dict[str, None] = {}
+        self._batch_state: Optional[Tuple] = None
+        self._batch_shards: Optional[Tuple] = None
+        self._undo: Dict[Tuple[str, str], Optional[Dict]] = {}
+
+        self.loaded = False
+        if autoload:
+            self.load_data()
+
+    @property
+    def storage(self) -> StorageBackend:
+        if self._storage is None:
+            with self.writer.lock:
+                if self._storage is None:
+                    self._storage = self.writer.storage = self._create_storage(self._storage_kind,
+                                                                               self._use_journal)
+        return self._storage
+
+    def _create_storage(self, storage: str, use_journal: bool) -> StorageBackend:
+        journal_file = os.path.join(self.data_dir, "projects.journal") if use_journal else None
+        json_storage = JsonStorage(self.data_file, journal_file)
+
+        if storage == "json":
+            return json_storage
+        if storage == "sqlite":
+            return SQLiteStorage(os.path.join(self.data_dir, "projects.db"), json_storage)
+        if storage == "sharded":
+            return ShardedStorage(os.path.join(self.data_dir, "shards"), json_storage)
+        raise ValueError(f"Unknown storage backend: {storage}")
+
+    def load_data(self, progress: Optional[Callable[[int, int], None]] = None):
+        self.flush()
+        # building every model at once only triggers collections that find nothing to free
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            with self.writer.lock:
+                data = self.storage.load()
+
+            if self._batch_depth:
+                if self._batch_state is None:
+                    self._batch_state = (self.labels, self.projects, self.tasks, self.subtasks, self._undo,
+                                         self._resident, self._shard_counts)
+                self._batch_changes = []
+                self._batch_completions = {}
+                self._undo = {}
+
+            sections = [data.get(section, {}) for section in StorageBackend.SECTIONS]
+            total = sum(map(len, sections))
+            done = 0
+            if progress:
+                progress(done, total)
+
+            models = {'labels': Label, 'projects': Project, 'tasks': Task, 'subtasks': SubTask}
+            for section, items in zip(StorageBackend.SECTIONS, sections):
+                built = {}
+                model = models[section]
+                for item_data in items.values():
+                    item = model.from_dict(item_data)
+                    built[item.id] = item
+                    done += 1
+                    if progress and not done % self.LOAD_PROGRESS_STEP:
+                        progress(done, total)
+                setattr(self, section, built)
+
+            self._resident = {} if self.storage.sharded else None
+            self._shard_counts = data.get('counters', {})
+            self._rebuild_indexes()
+            self._assign_missing_ranks()
+            if progress:
+                progress(total, total)
+        finally:
+            if gc_enabled:
+                gc.enable()
+        self.loaded = True
+        self._notify_labels(None)
+
+    def _rebuild_indexes(self):
+        self._project_tasks = {}
+        self._label_tasks = {}
+        self._priority_tasks = {}
+        with self._search_lock:
+            self._search_index = None
+        self._task_due.clear()
+        self._project_ranks = {}
+        self._task_subtasks = {}
+        self._label_subtasks = {}
+        self._subtask_due.clear()
+        self._project_done_tasks = {}
+        self._task_done_subtasks = {}
+        self._project_subtask_counts = {}
+        self._completed_tasks = 0
+        self._completed_subtasks = 0
+        self._index_items(self.tasks.values(), self.subtasks.values())
+
+    def _index_items(self, tasks: Iterable[Task], subtasks: Iterable[SubTask]):
+        ranked = set()
+        for task in tasks:
+            self._index_add(self._project_tasks, task.project_id, task.id)
+            self._project_ranks.setdefault(task.project_id, []).append((task.rank or "", task.id))
+            ranked.add(task.project_id)
+            self._index_add(self._priority_tasks, (task.project_id, task.priority), task.id)
+            self._index_labels(self._label_tasks, task)
+            self._task_due.add(task.id, task.project_id, task.due_date)
+            self._completed_tasks += self._index_done(self._project_done_tasks, task.project_id, task)
+
+        for project_id in ranked:
+            self._project_ranks[project_id].sort()
+
+        for subtask in subtasks:
+            self._index_add(self._task_subtasks, subtask.task_id, subtask.id)
+            self._index_labels(self._label_subtasks, subtask)
+            self._subtask_due.add(subtask.id, subtask.task_id, subtask.due_date)
+            self._count_subtasks(subtask.task_id, 1, self._index_done(self._task_done_subtasks, subtask.task_id,
+                                                                      subtask))
+
+    def _load_shard(self, project_id: Optional[str], keep: Iterable[str] = ()):
+        if self._resident is None or project_id is None:
+            return
+        if project_id in self._resident:
+            # move to the most recently used end
+            self._resident[project_id] = self._resident.pop(project_id)
+            return
+
+        self._read_shard(project_id)
+        self._evict_shards({project_id, *keep})
+
+    def _load_all_shards(self):
+        if self._resident is not None:
+            for project_id in list(self.projects):
+                if project_id not in self._resident:
+                    self._read_shard(project_id)
+
+    def _read_shard(self, project_id: str):
+        with self.writer.lock:
+            data = self.storage.load_shard(project_id)
+
+        tasks = [Task.from_dict(task_data) for task_data in data['tasks'].values()]
+        for task in tasks:
             self.tasks[task.id] = task
-
-        self.subtasks = {}
-        for subtask_data in data.get('subtasks', {}).values():
+        subtasks = []
+        for subtask_data in data['subtasks'].values():
             subtask = SubTask.from_dict(subtask_data)
-            self.subtasks[subtask.id] = subtask
+            # subtasks whose task is gone stay on disk only, like the task index would ignore them
+            if subtask.task_id in self.tasks:
+                self.subtasks[subtask.id] = subtask
+                subtasks.append(subtask)
+
+        self._resident[project_id] = None
+        self._shard_counts.pop(project_id, None)
+        self._index_items(tasks, subtasks)
+        for task in tasks:
+            self._index_search(task)
+        self._assign_missing_ranks([project_id])
+
+    def _evict_shards(self, keep: AbstractSet[str]):
+        if self._batch_depth or len(self.tasks) + len(self.subtasks) <= self.SHARD_BUDGET:
+            return
+
+        # evicted items must be on disk before a later load reads their shard back
+        self.flush()
+        for project_id in list(self._resident):
+            if len(self.tasks) + len(self.subtasks) <= self.SHARD_BUDGET:
+                break
+            if project_id not in keep:
+                self._unload_shard(project_id)
+
+    def _unload_shard(self, project_id: str):
+        self._shard_counts[project_id] = self.get_project_counts(project_id)
+        del self._resident[project_id]
+
+        task_ids = list(self._project_tasks.pop(project_id, {}))
+        for task_id in task_ids:
+            task = self.tasks.pop(task_id)
+            self._index_remove(self._priority_tasks, (project_id, task.priority), task_id)
+            self._unindex_labels(self._label_tasks, task)
+            self._task_due.remove(task_id)
+            for subtask_id in self._task_subtasks.pop(task_id, {}):
+                subtask = self.subtasks.pop(subtask_id)
+                self._unindex_labels(self._label_subtasks, subtask)
+                self._subtask_due.remove(subtask_id)
+            self._completed_subtasks -= len(self._task_done_subtasks.pop(task_id, {}))
+
+        self._project_ranks.pop(project_id, None)
+        self._project_subtask_counts.pop(project_id, None)
+        self._completed_tasks -= len(self._project_done_tasks.pop(project_id, {}))
+        with self._search_lock:
+            if self._search_index is not None:
+                for task_id in task_ids:
+                    self._search_index.remove(task_id)
+
+    def _assign_missing_ranks(self, project_ids: Optional[Iterable[str]] = None):
+        # data written before tasks carried ranks is ordered by Project.task_order, then creation order
+        changes = []
+        for project_id in list(self._project_ranks if project_ids is None else project_ids):
+            entries = self._project_ranks.get(project_id)
+            if not entries or entries[0][0]:
+                continue
+
+            task_ids = self._project_tasks[project_id]
+            project = self.get_project(project_id)
+            ordered = [task_id for task_id in (project.task_order if project else ()) if task_id in task_ids]
+            seen = set(ordered)
+            ordered.extend(task_id for task_id in task_ids if task_id not in seen)
+            changes.extend(self._rerank(project_id, ordered))
+
+        if changes:
+            self._commit(changes)
+
+    def _rerank(self, project_id: str, task_ids: List[str]) -> List[Tuple]:
+        changes = []
+        entries = []
+        for task_id, rank in zip(task_ids, rank_sequence(len(task_ids))):
+            task = self.tasks[task_id]
+            self._track('tasks', task)
+            task.rank = rank
+            entries.append((rank, task_id))
+            changes.append(self._put('tasks', task))
+        self._project_ranks[project_id] = entries
+        return changes
+
+    def _rank_add(self, project_id: str, rank: str, task_id: str):
+        bisect.insort(self._project_ranks.setdefault(project_id, []), (rank, task_id))
+
+    def _rank_remove(self, project_id: str, rank: str, task_id: str):
+        entries = self._project_ranks.get(project_id)
+        if entries is not None:
+            position = bisect.bisect_left(entries, (rank, task_id))
+            if position < len(entries) and entries[position][1] == task_id:
+                del entries[position]
+            if not entries:
+                del self._project_ranks[project_id]
+
+    def _last_rank(self, project_id: str) -> Optional[str]:
+        entries = self._project_ranks.get(project_id)
+        return entries[-1][0] if entries else None
+
+    def _build_done_indexes(self) -> Tuple[Dict[str, Dict[str, None]], Dict[str, Dict[str, None]],
+                                           Dict[str, List[int]]]:
+        project_done_tasks = {}
+        for task in self.tasks.values():
+            self._index_done(project_done_tasks, task.project_id, task)
 
-    def save_data(self):
-        data = {
-            'labels': {label_id: label.to_dict() for label_id, label in self.labels.items()},
-            'projects': {project_id: project.to_dict() for project_id, project in self.projects.items()},
-            'tasks': {task_id: task.to_dict() for task_id, task in self.tasks.items()},
-            'subtasks': {subtask_id: subtask.to_dict() for subtask_id, subtask in self.subtasks.items()}
+        task_done_subtasks = {}
+        project_subtask_counts = {}
+        for subtask in self.subtasks.values():
+            self._index_done(task_done_subtasks, subtask.task_id, subtask)
+            task = self.tasks.get(subtask.task_id)
+            if task is not None:
+                counts = project_subtask_counts.setdefault(task.project_id, [0, 0])
+                counts[0] += 1
+                counts[1] += subtask.completed
+
+        return project_done_tasks, task_done_subtasks, project_subtask_counts
+
+    def verify_progress(self) -> bool:
+        return (
+            self._build_done_indexes() == (self._project_done_tasks, self._task_done_subtasks,
+                                           self._project_subtask_counts)
+            and self._completed_tasks == sum(1 for task in self.tasks.values() if task.completed)
+            and self._completed_subtasks == sum(1 for subtask in self.subtasks.values() if subtask.completed)
+        )
+
+    @staticmethod
+    def _index_add(index: Dict[str, Dict[str, None]], key: str, item_id: str):
+        index.setdefault(key, {})[item_id] = None
+
+    @staticmethod
+    def _index_remove(index: Dict[str, Dict[str, None]], key: str, item_id: str):
+        bucket = index.get(key)
+        if bucket is not None:
+            bucket.pop(item_id, None)
+            if not bucket:
+                del index[key]
+
+    def _index_done(self, index: Dict[str, Dict[str, None]], key: str, item) -> int:
+        bucket = index.get(key)
+        was_done = bucket is not None and item.id in bucket
+        if item.completed:
+            self._index_add(index, key, item.id)
+        else:
+            self._index_remove(index, key, item.id)
+        return int(item.completed) - int(was_done)
+
+    def _unindex_done(self, index: Dict[str, Dict[str, None]], key: str, item_id: str) -> int:
+        bucket = index.get(key)
+        if bucket is not None and item_id in bucket:
+            self._index_remove(index, key, item_id)
+            return -1
+        return 0
+
+    def _count_subtasks(self, task_id: str, total: int, completed: int):
+        self._completed_subtasks += completed
+        task = self.tasks.get(task_id)
+        if task is not None:
+            self._count_project_subtasks(task.project_id, total, completed)
+
+    def _count_project_subtasks(self, project_id: str, total: int, completed: int):
+        counts = self._project_subtask_counts.setdefault(project_id, [0, 0])
+        counts[0] += total
+        counts[1] += completed
+        if not counts[0]:
+            del self._project_subtask_counts[project_id]
+
+    def _index_labels(self, index: Dict[str, Dict[str, None]], item):
+        for label_id in item.labels:
+            self._index_add(index, label_id, item.id)
+
+    def _unindex_labels(self, index: Dict[str, Dict[str, None]], item):
+        for label_id in item.labels:
+            self._index_remove(index, label_id, item.id)
+
+    def _collect_data(self) -> Dict:
+        # copy the values first: a background flush must not iterate dicts the GUI thread mutates
+        return {
+            'labels': {label.id: label.to_dict() for label in list(self.labels.values())},
+            'projects': {project.id: project.to_dict() for project in list(self.projects.values())},
+            'tasks': {task.id: task.to_dict() for task in list(self.tasks.values())},
+            'subtasks': {subtask.id: subtask.to_dict() for subtask in list(self.subtasks.values())}
         }
-        save_json(self.data_file, data)
+
+    @property
+    def dirty(self) -> bool:
+        return self.writer.dirty
+
+    def save_data(self):
+        with self.writer.lock:
+            self.writer.discard()
+            # save_all replaces everything, so a sharded store needs every project in memory first
+            self._load_all_shards()
+            self.storage.save_all(self._collect_data())
+
+    def flush(self):
+        self.writer.flush()
+
+    def checkpoint(self):
+        with self.writer.lock:
+            self.flush()
+            if self._storage is not None and self.storage.snapshot_stale():
+                self.storage.write_snapshot(self._collect_data())
+
+    def close(self):
+        with self.writer.lock:
+            self.flush()
+            if self._storage is not None:
+                self.storage.close()
+
+    @contextmanager
+    def batch(self):
+        if not self._batch_depth and self._resident is not None:
+            self._batch_shards = (dict(self._resident), dict(self._shard_counts))
+        self._batch_depth += 1
+        try:
+            yield self
+        except BaseException:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self._rollback_batch()
+            raise
+        else:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self._finish_batch()
+
+    def _finish_batch(self):
+        changes = self._batch_changes
+        for task_id in self._batch_completions:
+            task = self.get_task(task_id)
+            if task:
+                self._apply_completion(task)
+                changes.append(self._put('tasks', task))
+
+        self._reset_batch()
+        self.writer.submit(changes)
+
+    def _rollback_batch(self):
+        reloaded = self._batch_state is not None
+        if reloaded:
+            (self.labels, self.projects, self.tasks, self.subtasks, self._undo,
+             self._resident, self._shard_counts) = self._batch_state
+        elif self._batch_shards is not None:
+            # restored items belong to shards that were loaded before the batch or read during it
+            resident, shard_counts = self._batch_shards
+            resident.update(self._resident)
+            self._resident = resident
+            self._shard_counts = {project_id: counts for project_id, counts in shard_counts.items()
+                                  if project_id not in resident}
+
+        models = {'labels': Label, 'projects': Project, 'tasks': Task, 'subtasks': SubTask}
+        for (section, item_id), data in self._undo.items():
+            items = getattr(self, section)
+            if data is None:
+                items.pop(item_id, None)
+            else:
+                items[item_id] = models[section].from_dict(data)
+
+        self._reset_batch()
+        self._rebuild_indexes()
+        self._notify_labels(None)
+        if reloaded:
+            self.save_data()
+
+    def _reset_batch(self):
+        self._batch_changes = []
+        self._batch_completions = {}
+        self._batch_state = None
+        self._batch_shards = None
+        self._undo = {}
+
+    def _track(self, section: str, item):
+        if self._batch_depth and (section, item.id) not in self._undo:
+            self._undo[(section, item.id)] = item.to_dict()
+
+    def _track_new(self, section: str, item_id: str):
+        if self._batch_depth:
+            self._undo.setdefault((section, item_id), None)
+
+    def _update_completion(self, task: Task):
+        if self._batch_depth:
+            self._batch_completions[task.id] = None
+        else:
+            self._apply_completion(task)
+
+    def _apply_completion(self, task: Task):
+        total = len(self._task_subtasks.get(task.id, ()))
+        if total:
+            task.set_completed(len(self._task_done_subtasks.get(task.id, ())) == total)
+            self._completed_tasks += self._index_done(self._project_done_tasks, task.project_id, task)
+
+    def _commit(self, changes: List[Tuple]):
+        if self._batch_depth:
+            self._batch_changes.extend(changes)
+        else:
+            self.writer.submit(changes)
+
+    @staticmethod
+    def _put(section: str, item) -> Tuple:
+        return section, item.id, item
+
+    @staticmethod
+    def _delete(section: str, item_id: str) -> Tuple:
+        return section, item_id, None
 
     def create_project(self, name: str, version: str = "1.0.0",
                       description: Optional[str] = None, github_url: str = "") -> Project:
         project = Project(name=name, version=version, description=description, github_url=github_url)
+        self._track_new('projects', project.id)
         self.projects[project.id] = project
-        self.save_data()
+        self._commit([self._put('projects', project)])
         return project
 
     def get_project(self, project_id: str) -> Optional[Project]:
@@ -83,20 +537,24 @@ class ProjectManager:
     def update_project(self, project_id: str, **kwargs):
         project = self.get_project(project_id)
         if project:
+            self._track('projects', project)
             for key, value in kwargs.items():
                 if hasattr(project, key):
                     setattr(project, key, value)
             project.updated_at = format_datetime()
-            self.save_data()
+            self._commit([self._put('projects', project)])
 
     def delete_project(self, project_id: str):
         project = self.get_project(project_id)
         if project:
-            for task_id in list(project.tasks):
-                self.delete_task(task_id)
+            self._load_shard(project_id)
+            with self.batch():
+                for task_id in list(self._project_tasks.get(project_id, ())):
+                    self.delete_task(task_id)
 
-            del self.projects[project_id]
-            self.save_data()
+                self._track('projects', project)
+                del self.projects[project_id]
+                self._commit([self._delete('projects', project_id)])
 
     def get_all_projects(self) -> List[Project]:
         return list(self.projects.values())
@@ -104,8 +562,10 @@ class ProjectManager:
     def create_task(self, title: str, project_id: str, priority: int = 3,
                     description: Optional[str] = None, due_date: Optional[str] = None,
                     labels: Optional[List[str]] = None) -> Task:
+        self._load_shard(project_id)
         task = Task(title=title, project_id=project_id, priority=priority,
                     description=description, due_date=due_date)
+        task.rank = rank_between(self._last_rank(project_id), None)
 
         if labels:
             for label_id in labels:
@@ -113,13 +573,23 @@ class ProjectManager:
                 if label:
                     task.add_label(label_id)
 
+        self._track_new('tasks', task.id)
         self.tasks[task.id] = task
+        self._index_add(self._project_tasks, project_id, task.id)
+        self._index_add(self._priority_tasks, (project_id, priority), task.id)
+        self._rank_add(project_id, task.rank, task.id)
+        self._index_labels(self._label_tasks, task)
+        self._index_search(task)
+        self._task_due.add(task.id, project_id, due_date)
+        changes = [self._put('tasks', task)]
 
         project = self.get_project(project_id)
         if project:
+            self._track('projects', project)
             project.add_task(task.id)
+            changes.append(self._put('projects', project))
 
-        self.save_data()
+        self._commit(changes)
         return task
 
     def create_subtask(
@@ -131,6 +601,7 @@ class ProjectManager:
             due_date: Optional[str] = None,
             labels: Optional[List[str]] = None
     ) -> SubTask:
+        self._load_shard(project_id)
         subtask = SubTask(
             title=title,
             task_id=task_id,
@@ -146,14 +617,22 @@ class ProjectManager:
                 if label:
                     subtask.add_label(label_id)
 
+        self._track_new('subtasks', subtask.id)
         self.subtasks[subtask.id] = subtask
+        self._index_add(self._task_subtasks, task_id, subtask.id)
+        self._count_subtasks(task_id, 1, 0)
+        self._index_labels(self._label_subtasks, subtask)
+        self._subtask_due.add(subtask.id, task_id, due_date)
+        changes = [self._put('subtasks', subtask)]
 
         task = self.get_task(task_id)
         if task:
+            self._track('tasks', task)
             task.add_subtask(subtask.id)
-            task.update_completion(self.subtasks)
+            self._update_completion(task)
+            changes.append(self._put('tasks', task))
 
-        self.save_data()
+        self._commit(changes)
         return subtask
 
     def get_task(self, task_id: str) -> Optional[Task]:
@@ -162,35 +641,314 @@ class ProjectManager:
     def update_task(self, task_id: str, **kwargs):
         task = self.get_task(task_id)
         if task:
+            self._track('tasks', task)
             if 'labels' in kwargs:
                 labels = kwargs.pop('labels')
+                self._unindex_labels(self._label_tasks, task)
                 task.labels.clear()
                 for label_id in labels:
                     label = self.get_label(label_id)
                     if label:
                         task.add_label(label_id)
+                self._index_labels(self._label_tasks, task)
 
+            old_project_id = task.project_id
+            old_priority = task.priority
+            kwargs.pop('rank', None)
+            if kwargs.get('project_id', old_project_id) != old_project_id:
+                self._load_shard(kwargs['project_id'], keep=(old_project_id,))
             for key, value in kwargs.items():
                 if hasattr(task, key):
                     setattr(task, key, value)
             task.updated_at = format_datetime()
-            self.save_data()
+            changes = [self._put('tasks', task)]
+
+            if (task.project_id, task.priority) != (old_project_id, old_priority):
+                self._index_remove(self._priority_tasks, (old_project_id, old_priority), task_id)
+                self._index_add(self._priority_tasks, (task.project_id, task.priority), task_id)
+
+            if task.project_id != old_project_id:
+                self._rank_remove(old_project_id, task.rank, task_id)
+                task.rank = rank_between(self._last_rank(task.project_id), None)
+                self._rank_add(task.project_id, task.rank, task_id)
+                self._index_remove(self._project_tasks, old_project_id, task_id)
+                self._completed_tasks += self._unindex_done(self._project_done_tasks, old_project_id, task_id)
+                self._index_add(self._project_tasks, task.project_id, task_id)
+                total, completed = self.get_task_counts(task_id)
+                if total:
+                    self._count_project_subtasks(old_project_id, -total, -completed)
+                    self._count_project_subtasks(task.project_id, total, completed)
+                for subtask_id in self._task_subtasks.get(task_id, ()):
+                    # subtasks follow their task, which also moves them to its shard
+                    subtask = self.subtasks[subtask_id]
+                    self._track('subtasks', subtask)
+                    subtask.project_id = task.project_id
+                    changes.append(self._put('subtasks', subtask))
+
+                old_project = self.get_project(old_project_id)
+                if old_project:
+                    self._track('projects', old_project)
+                    old_project.remove_task(task_id)
+                    changes.append(self._put('projects', old_project))
+
+                new_project = self.get_project(task.project_id)
+                if new_project:
+                    self._track('projects', new_project)
+                    new_project.add_task(task_id)
+                    changes.append(self._put('projects', new_project))
+
+            self._completed_tasks += self._index_done(self._project_done_tasks, task.project_id, task)
+            if kwargs.keys() & {'title', 'description', 'project_id'}:
+                self._index_search(task)
+            if kwargs.keys() & {'due_date', 'project_id'}:
+                self._task_due.add(task_id, task.project_id, task.due_date)
+            self._commit(changes)
 
     def delete_task(self, task_id: str):
         task = self.get_task(task_id)
         if task:
-            for subtask_id in list(task.subtasks):
-                self.delete_subtask(subtask_id)
-
-            project = self.get_project(task.project_id)
-            if project:
-                project.remove_task(task_id)
-
-            del self.tasks[task_id]
-            self.save_data()
+            with self.batch():
+                for subtask_id in list(self._task_subtasks.get(task_id, ())):
+                    self.delete_subtask(subtask_id)
+
+                self._track('tasks', task)
+                changes = [self._delete('tasks', task_id)]
+
+                project = self.get_project(task.project_id)
+                if project:
+                    self._track('projects', project)
+                    project.remove_task(task_id)
+                    changes.append(self._put('projects', project))
+
+                del self.tasks[task_id]
+                self._index_remove(self._project_tasks, task.project_id, task_id)
+                self._index_remove(self._priority_tasks, (task.project_id, task.priority), task_id)
+                self._rank_remove(task.project_id, task.rank, task_id)
+                self._completed_tasks += self._unindex_done(self._project_done_tasks, task.project_id, task_id)
+                self._unindex_labels(self._label_tasks, task)
+                self._task_due.remove(task_id)
+                with self._search_lock:
+                    if self._search_index is not None:
+                        self._search_index.remove(task_id)
+                self._commit(changes)
 
     def get_tasks_by_project(self, project_id: str) -> List[Task]:
-        return [task for task in self.tasks.values() if task.project_id == project_id]
+        self._load_shard(project_id)
+        return [self.tasks[task_id] for task_id in self._project_tasks.get(project_id, ())]
+
+    def _index_search(self, task: Task):
+        with self._search_lock:
+            if self._search_index is not None:
+                self._search_index.add(task.id, task.project_id, task.title, task.description)
+
+    def search_tasks(self, project_id: str, text: str) -> Set[str]:
+        # may run on a worker thread, so the index is only touched under _search_lock
+        with self._search_lock:
+            if self._search_index is None:
+                # built on first use so startup does not pay for projects that are never searched
+                index = SearchIndex()
+                for task in list(self.tasks.values()):
+                    index.add(task.id, task.project_id, task.title, task.description)
+                self._search_index = index
+            return self._search_index.search(project_id, text)
+
+    def query(self, project: Optional[str] = None, priorities: Optional[Iterable[int]] = None,
+              labels_all: Optional[Iterable[str]] = None, labels_any: Optional[Iterable[str]] = None,
+              due_before: Union[date, str, None] = None, due_after: Union[date, str, None] = None,
+              completed: Optional[bool] = None, text: Optional[str] = None,
+              ids: Optional[AbstractSet[str]] = None, order_by: Optional[str] = None) -> Iterator[Task]:
+        if project is None:
+            # a query across projects needs every shard in memory
+            self._load_all_shards()
+            scope = self.tasks
+            ordered = self.tasks
+        else:
+            self._load_shard(project)
+            scope = self._project_tasks.get(project, {})
+            ordered = self._project_order(project)
+
+        sources = []
+        predicates = []
+        if project is not None:
+            predicates.append(lambda task: task.project_id == project)
+            if completed:
+                done = self._project_done_tasks.get(project, {})
+                sources.append((len(done), done))
+
+        if priorities is not None:
+            priorities = set(priorities)
+            predicates.append(lambda task: task.priority in priorities)
+            if project is not None:
+                buckets = [self._priority_tasks.get((project, priority), {}) for priority in priorities]
+                sources.append((sum(map(len, buckets)), chain.from_iterable(buckets)))
+
+        if text:
+            if project is not None:
+                matches = self.search_tasks(project, text)
+                sources.append((len(matches), matches))
+                predicates.append(lambda task: task.id in matches)
+            else:
+                query = text.casefold()
+                predicates.append(lambda task: query in SearchIndex.normalize(task.title, task.description))
+
+        self._add_query_filters(sources, predicates, self._label_tasks, self._task_due, project,
+                                labels_all, labels_any, due_before, due_after, completed, ids)
+        return self._run_query(self.tasks, scope, ordered, sources, predicates, order_by)
+
+    def query_subtasks(self, task: Optional[str] = None, project: Optional[str] = None,
+                       priorities: Optional[Iterable[int]] = None, labels_all: Optional[Iterable[str]] = None,
+                       labels_any: Optional[Iterable[str]] = None, due_before: Union[date, str, None] = None,
+                       due_after: Union[date, str, None] = None, completed: Optional[bool] = None,
+                       text: Optional[str] = None, ids: Optional[AbstractSet[str]] = None,
+                       order_by: Optional[str] = None) -> Iterator[SubTask]:
+        if project is not None:
+            self._load_shard(project)
+        elif task is None or task not in self.tasks:
+            # without a loaded task or a project to go by, every shard has to be searched
+            self._load_all_shards()
+        if task is None:
+            scope = ordered = self.subtasks
+        else:
+            scope = ordered = self._task_subtasks.get(task, {})
+
+        sources = []
+        predicates = []
+        if task is not None:
+            predicates.append(lambda subtask: subtask.task_id == task)
+            if completed:
+                done = self._task_done_subtasks.get(task, {})
+                sources.append((len(done), done))
+        if project is not None:
+            predicates.append(lambda subtask: subtask.project_id == project)
+        if priorities is not None:
+            priorities = set(priorities)
+            predicates.append(lambda subtask: subtask.priority in priorities)
+        if text:
+            query = text.casefold()
+            predicates.append(lambda subtask: query in SearchIndex.normalize(subtask.title, subtask.description))
+
+        self._add_query_filters(sources, predicates, self._label_subtasks, self._subtask_due, task,
+                                labels_all, labels_any, due_before, due_after, completed, ids)
+        return self._run_query(self.subtasks, scope, ordered, sources, predicates, order_by)
+
+    @staticmethod
+    def _add_query_filters(sources: List[Tuple[int, Iterable[str]]], predicates: List[Callable],
+                           label_index: Dict[str, Dict[str, None]], due_index: DueIndex, scope: Optional[str],
+                           labels_all: Optional[Iterable[str]], labels_any: Optional[Iterable[str]],
+                           due_before: Union[date, str, None], due_after: Union[date, str, None],
+                           completed: Optional[bool], ids: Optional[AbstractSet[str]]):
+        if labels_all is not None:
+            labels_all = list(labels_all)
+            for label_id in labels_all:
+                bucket = label_index.get(label_id, {})
+                sources.append((len(bucket), bucket))
+            predicates.append(lambda item: all(label_id in item.labels for label_id in labels_all))
+
+        if labels_any is not None:
+            labels_any = list(labels_any)
+            buckets = [label_index.get(label_id, {}) for label_id in labels_any]
+            sources.append((sum(map(len, buckets)), chain.from_iterable(buckets)))
+            predicates.append(lambda item: any(label_id in item.labels for label_id in labels_any))
+
+        before = DueIndex.parse(due_before)
+        after = DueIndex.parse(due_after)
+        if before or after:
+            if scope is not None:
+                due = due_index.between(scope, after and after + timedelta(days=1), before)
+                sources.append((len(due), due))
+            if before:
+                predicates.append(lambda item: (due_index.date_of(item.id) or date.max) < before)
+            if after:
+                predicates.append(lambda item: (due_index.date_of(item.id) or date.min) > after)
+
+        if completed is not None:
+            predicates.append(lambda item: item.completed == completed)
+
+        if ids is not None:
+            sources.append((len(ids), ids))
+            predicates.append(lambda item: item.id in ids)
+
+    @staticmethod
+    def _run_query(items: Dict, scope: Dict[str, None], ordered: Iterable[str],
+                   sources: List[Tuple[int, Iterable[str]]], predicates: List[Callable],
+                   order_by: Optional[str]) -> Iterator:
+        def matches(item_ids):
+            for item_id in item_ids:
+                item = items.get(item_id)
+                if item is not None and all(predicate(item) for predicate in predicates):
+                    yield item
+
+        size, candidates = min(sources, key=lambda source: source[0], default=(len(scope), None))
+        if candidates is None or size >= len(scope):
+            if order_by is None:
+                # walking the scope in display order keeps the result lazy
+                return matches(ordered)
+            candidates = scope
+
+        # a smaller index drives the scan; only its matches are ordered
+        found = list(matches(dict.fromkeys(candidates)))
+        if order_by is None:
+            position = {item_id: index for index, item_id in enumerate(ordered)}
+            found.sort(key=lambda item: position.get(item.id, len(position)))
+        else:
+            found.sort(key=ProjectManager.QUERY_ORDERS[order_by])
+        return iter(found)
+
+    def get_task_due_status(self, task_id: str) -> Optional[str]:
+        return self._task_due.status(task_id)
+
+    def get_subtask_due_status(self, subtask_id: str) -> Optional[str]:
+        return self._subtask_due.status(subtask_id)
+
+    def _pending_due_tasks(self, project_id: str, start: Optional[date], end: Optional[date]) -> List[Task]:
+        self._load_shard(project_id)
+        tasks = (self.tasks[task_id] for task_id in self._task_due.between(project_id, start, end))
+        return [task for task in tasks if not task.completed]
+
+    def get_overdue_tasks(self, project_id: str) -> List[Task]:
+        return self._pending_due_tasks(project_id, None, date.today())
+
+    def get_tasks_due_today(self, project_id: str) -> List[Task]:
+        today = date.today()
+        return self._pending_due_tasks(project_id, today, today + timedelta(days=1))
+
+    def get_tasks_due_within(self, project_id: str, days: int) -> List[Task]:
+        today = date.today()
+        return self._pending_due_tasks(project_id, today, today + timedelta(days=days + 1))
+
+    def _project_order(self, project_id: str) -> Iterator[str]:
+        return (task_id for _, task_id in self._project_ranks.get(project_id, ()))
+
+    def move_task(self, task_id: str, previous_id: Optional[str] = None, next_id: Optional[str] = None):
+        task = self.get_task(task_id)
+        if not task:
+            return
+
+        previous_task = self.get_task(previous_id) if previous_id else None
+        next_task = self.get_task(next_id) if next_id else None
+        changes = []
+        if previous_task and next_task:
+            if (previous_task.rank, previous_task.id) > (next_task.rank, next_task.id):
+                # the neighbours are not in rank order, e.g. taken from a view sorted by another column
+                return
+            if previous_task.rank == next_task.rank:
+                # the neighbours share a rank, so spread the whole project out again first;
+                # reranking updates both neighbours, which are read again below
+                changes = self._rerank(task.project_id, list(self._project_order(task.project_id)))
+
+        # the new rank is worked out before the index is touched, so a failure leaves the task in place
+        rank = rank_between(previous_task.rank if previous_task else None,
+                            next_task.rank if next_task else None)
+        self._track('tasks', task)
+        self._rank_remove(task.project_id, task.rank, task_id)
+        task.rank = rank
+        self._rank_add(task.project_id, task.rank, task_id)
+
+        if len(task.rank) > self.MAX_RANK_LENGTH:
+            changes = self._rerank(task.project_id, list(self._project_order(task.project_id)))
+        elif not changes:
+            changes = [self._put('tasks', task)]
+        self._commit(changes)
 
     def get_subtask(self, subtask_id: str) -> Optional[SubTask]:
         return self.subtasks.get(subtask_id)
@@ -198,43 +956,86 @@ class ProjectManager:
     def update_subtask(self, subtask_id: str, **kwargs):
         subtask = self.get_subtask(subtask_id)
         if subtask:
+            self._track('subtasks', subtask)
             if 'labels' in kwargs:
                 labels = kwargs.pop('labels')
+                self._unindex_labels(self._label_subtasks, subtask)
                 subtask.labels.clear()
                 for label_id in labels:
                     label = self.get_label(label_id)
                     if label:
                         subtask.add_label(label_id)
+                self._index_labels(self._label_subtasks, subtask)
 
+            old_task_id = subtask.task_id
             for key, value in kwargs.items():
                 if hasattr(subtask, key):
                     setattr(subtask, key, value)
             subtask.updated_at = format_datetime()
-
+            changes = [self._put('subtasks', subtask)]
+
+            if subtask.task_id != old_task_id:
+                new_task = self.get_task(subtask.task_id)
+                if new_task:
+                    # like a moved task's subtasks, the subtask belongs to its task's project and shard
+                    subtask.project_id = new_task.project_id
+                self._index_remove(self._task_subtasks, old_task_id, subtask_id)
+                self._count_subtasks(old_task_id, -1, self._unindex_done(self._task_done_subtasks, old_task_id,
+                                                                         subtask_id))
+                self._index_add(self._task_subtasks, subtask.task_id, subtask_id)
+                self._count_subtasks(subtask.task_id, 1, 0)
+
+                old_task = self.get_task(old_task_id)
+                if old_task:
+                    self._track('tasks', old_task)
+                    old_task.remove_subtask(subtask_id)
+                    self._update_completion(old_task)
+                    changes.append(self._put('tasks', old_task))
+
+            self._count_subtasks(subtask.task_id, 0, self._index_done(self._task_done_subtasks, subtask.task_id,
+                                                                      subtask))
+            if kwargs.keys() & {'due_date', 'task_id'}:
+                self._subtask_due.add(subtask_id, subtask.task_id, subtask.due_date)
             task = self.get_task(subtask.task_id)
             if task:
-                task.update_completion(self.subtasks)
+                self._track('tasks', task)
+                task.add_subtask(subtask_id)
+                self._update_completion(task)
+                changes.append(self._put('tasks', task))
 
-            self.save_data()
+            self._commit(changes)
 
     def delete_subtask(self, subtask_id: str):
         subtask = self.get_subtask(subtask_id)
         if subtask:
+            self._track('subtasks', subtask)
+            changes = [self._delete('subtasks', subtask_id)]
+
             task = self.get_task(subtask.task_id)
             if task:
+                self._track('tasks', task)
                 task.remove_subtask(subtask_id)
+                changes.append(self._put('tasks', task))
 
             del self.subtasks[subtask_id]
-            self.save_data()
+            self._index_remove(self._task_subtasks, subtask.task_id, subtask_id)
+            self._count_subtasks(subtask.task_id, -1, self._unindex_done(self._task_done_subtasks, subtask.task_id,
+                                                                         subtask_id))
+            self._unindex_labels(self._label_subtasks, subtask)
+            self._subtask_due.remove(subtask_id)
+            if task:
+                self._update_completion(task)
+            self._commit(changes)
 
     def get_subtasks_by_task(self, task_id: str) -> List[SubTask]:
-        return [subtask for subtask in self.subtasks.values() if subtask.task_id == task_id]
+        return [self.subtasks[subtask_id] for subtask_id in self._task_subtasks.get(task_id, ())]
 
     def create_label(self, name: str, color: str = "#3498db", text_color: str = "#ffffff",
                      description: Optional[str] = None) -> Label:
         label = Label(name=name, color=color, text_color=text_color,description=description)
+        self._track_new('labels', label.id)
         self.labels[label.id] = label
-        self.save_data()
+        self._commit([self._put('labels', label)])
         return label
 
     def get_label(self, label_id: str) -> Optional[Label]:
@@ -243,62 +1044,129 @@ class ProjectManager:
     def update_label(self, label_id: str, **kwargs):
         label = self.get_label(label_id)
         if label:
+            self._track('labels', label)
             for key, value in kwargs.items():
                 if hasattr(label, key):
                     setattr(label, key, value)
-            self.save_data()
+            self._commit([self._put('labels', label)])
+            self._notify_labels(label_id)
 
     def delete_label(self, label_id: str):
-        for task in self.tasks.values():
-            if label_id in task.labels:
-                task.labels.remove(label_id)
-
-        for subtask in self.subtasks.values():
-            if label_id in subtask.labels:
-                subtask.labels.remove(label_id)
-
-        del self.labels[label_id]
-        self.save_data()
+        with self.batch():
+            # the label has to come off tasks in every project, not only the loaded ones
+            self._load_all_shards()
+            changes = []
+            for task_id in self._label_tasks.pop(label_id, {}):
+                task = self.tasks[task_id]
+                self._track('tasks', task)
+                del task.labels[label_id]
+                changes.append(self._put('tasks', task))
+
+            for subtask_id in self._label_subtasks.pop(label_id, {}):
+                subtask = self.subtasks[subtask_id]
+                self._track('subtasks', subtask)
+                del subtask.labels[label_id]
+                changes.append(self._put('subtasks', subtask))
+
+            self._track('labels', self.labels[label_id])
+            del self.labels[label_id]
+            changes.append(self._delete('labels', label_id))
+            self._commit(changes)
+        self._notify_labels(label_id)
+
+    def add_label_listener(self, callback: Callable[[Optional[str]], None]):
+        self._label_listeners.append(callback)
+
+    def _notify_labels(self, label_id: Optional[str]):
+        # None means every label may have changed (reload, rollback)
+        for callback in self._label_listeners:
+            callback(label_id)
 
     def get_all_labels(self) -> List[Label]:
         return list(self.labels.values())
 
+    def get_task_ids_by_label(self, label_id: str) -> AbstractSet[str]:
+        self._load_all_shards()
+        return self._label_tasks.get(label_id, {}).keys()
+
+    def get_subtask_ids_by_label(self, label_id: str) -> AbstractSet[str]:
+        self._load_all_shards()
+        return self._label_subtasks.get(label_id, {}).keys()
+
+    def get_tasks_by_label(self, label_id: str) -> List[Task]:
+        return [self.tasks[task_id] for task_id in self.get_task_ids_by_label(label_id)]
+
+    def get_subtasks_by_label(self, label_id: str) -> List[SubTask]:
+        return [self.subtasks[subtask_id] for subtask_id in self.get_subtask_ids_by_label(label_id)]
+
     def add_label_to_task(self, task_id: str, label_id: str):
         task = self.get_task(task_id)
         label = self.get_label(label_id)
         if task and label:
+            self._track('tasks', task)
             task.add_label(label_id)
-            self.save_data()
+            self._index_add(self._label_tasks, label_id, task_id)
+            self._commit([self._put('tasks', task)])
 
     def remove_label_from_task(self, task_id: str, label_id: str):
         task = self.get_task(task_id)
         if task:
+            self._track('tasks', task)
             task.remove_label(label_id)
-            self.save_data()
+            self._index_remove(self._label_tasks, label_id, task_id)
+            self._commit([self._put('tasks', task)])
 
     def add_label_to_subtask(self, subtask_id: str, label_id: str):
         subtask = self.get_subtask(subtask_id)
         label = self.get_label(label_id)
         if subtask and label:
+            self._track('subtasks', subtask)
             subtask.add_label(label_id)
-            self.save_data()
+            self._index_add(self._label_subtasks, label_id, subtask_id)
+            self._commit([self._put('subtasks', subtask)])
 
     def remove_label_from_subtask(self, subtask_id: str, label_id: str):
         subtask = self.get_subtask(subtask_id)
         if subtask:
+            self._track('subtasks', subtask)
             subtask.remove_label(label_id)
-            self.save_data()
+            self._index_remove(self._label_subtasks, label_id, subtask_id)
+            self._commit([self._put('subtasks', subtask)])
+
+    def get_task_counts(self, task_id: str) -> Tuple[int, int]:
+        return (len(self._task_subtasks.get(task_id, ())),
+                len(self._task_done_subtasks.get(task_id, ())))
+
+    def get_project_counts(self, project_id: str) -> Dict:
+        counts = self._shard_counts.get(project_id)
+        if counts is not None:
+            return dict(counts)
+
+        total_subtasks, completed_subtasks = self._project_subtask_counts.get(project_id, (0, 0))
+        return {
+            'tasks': len(self._project_tasks.get(project_id, ())),
+            'completed_tasks': len(self._project_done_tasks.get(project_id, ())),
+            'subtasks': total_subtasks,
+            'completed_subtasks': completed_subtasks
+        }
 
     def get_project_progress(self, project_id: str) -> float:
-        project = self.get_project(project_id)
-        if project:
-            return project.get_progress(self.tasks)
+        if project_id in self.projects:
+            counts = self._shard_counts.get(project_id)
+            if counts is not None:
+                return calculate_progress(counts['tasks'], counts['completed_tasks'])
+            total = len(self._project_tasks.get(project_id, ()))
+            if total:
+                return calculate_progress(total, len(self._project_done_tasks.get(project_id, ())))
         return 0.0
 
     def get_task_progress(self, task_id: str) -> float:
         task = self.get_task(task_id)
         if task:
-            return task.get_progress(self.subtasks)
+            total, completed = self.get_task_counts(task_id)
+            if not total:
+                return 100.0 if task.completed else 0.0
+            return calculate_progress(total, completed)
         return 0.0
 
     def get_statistics(self) -> Dict:
@@ -307,8 +1175,13 @@ class ProjectManager:
         total_subtasks = len(self.subtasks)
         total_labels = len(self.labels)
 
-        completed_tasks = sum(1 for task in self.tasks.values() if task.completed)
-        completed_subtasks = sum(1 for subtask in self.subtasks.values() if subtask.completed)
+        completed_tasks = self._completed_tasks
+        completed_subtasks = self._completed_subtasks
+        for counts in self._shard_counts.values():
+            total_tasks += counts['tasks']
+            total_subtasks += counts['subtasks']
+            completed_tasks += counts['completed_tasks']
+            completed_subtasks += counts['completed_subtasks']
 
         return {
             'projects': total_projects,
@@ -322,17 +1195,66 @@ class ProjectManager:
         }
 
     def import_data(self, import_path: str) -> Dict:
-        return ImportExportService.import_data(self.data_file, import_path)
+        if import_path.endswith(ImportExportService.MANIFEST_EXTENSION):
+            return self.restore_backup(import_path)
+        return self._replace_data(ImportExportService.import_data, import_path)
+
+    def restore_backup(self, backup_path: str) -> Dict:
+        return self._replace_data(ImportExportService.restore_backup, backup_path)
+
+    def _replace_data(self, replace: Callable[[str, str], Dict], source_path: str) -> Dict:
+        with self.batch():
+            with self.writer.lock:
+                self.checkpoint()
+                result = replace(self.data_file, source_path)
+                if result['success']:
+                    self.storage.adopt_data_file()
+
+            if result['success']:
+                self.load_data()
+            return result
+
+    def _iter_sections(self) -> Iterator[Tuple[str, Iterator[Tuple[str, Dict]]]]:
+        return ((section, self._iter_items(section)) for section in StorageBackend.SECTIONS)
+
+    def _iter_items(self, section: str) -> Iterator[Tuple[str, Dict]]:
+        # encoded one item at a time as the export is written, never as a second copy of the store
+        for item in list(getattr(self, section).values()):
+            yield item.id, item.to_dict()
+
+        if self._resident is not None and section in ShardedStorage.SHARD_SECTIONS:
+            for project_id in list(self.projects):
+                if project_id not in self._resident:
+                    yield from self.storage.load_shard(project_id)[section].items()
+
+    def _iter_backup_groups(self) -> Iterator[Tuple[str, Iterator[Tuple[str, Dict]]]]:
+        # tasks and subtasks are grouped per project, so a backup's chunks only change with their project
+        yield 'labels', self._iter_items('labels')
+        yield 'projects', self._iter_items('projects')
+
+        for section in ShardedStorage.SHARD_SECTIONS:
+            groups: Dict[str, List] = {}
+            for item in list(getattr(self, section).values()):
+                groups.setdefault(item.project_id, []).append(item)
+            for items in groups.values():
+                yield section, ((item.id, item.to_dict()) for item in items)
+
+            if self._resident is not None:
+                for project_id in list(self.projects):
+                    if project_id not in self._resident:
+                        yield section, iter(self.storage.load_shard(project_id)[section].items())
 
     def export_data(self, export_path: str) -> Dict:
-        return ImportExportService.export_data(self.data_file, export_path)
+        with self.writer.lock:
+            return ImportExportService.export_data(export_path, self._iter_sections())
 
     def create_backup(self) -> str:
-        return ImportExportService.create_backup(self.data_file)
+        with self.writer.lock:
+            return ImportExportService.create_backup(self.data_file, self._iter_backup_groups(), self.BACKUP_RETENTION)
 
-    def cleanup_old_backups(self, days_to_keep: int = 30) -> Dict:
+    def cleanup_old_backups(self, **retention) -> Dict:
         backup_dir = os.path.join(self.data_dir, 'backups')
-        return ImportExportService.cleanup_old_backups(backup_dir, days_to_keep)
+        return ImportExportService.cleanup_old_backups(backup_dir, **dict(self.BACKUP_RETENTION, **retention))
 
     def get_backup_info(self) -> Dict:
         backup_dir = os.path.join(self.data_dir, 'backups')
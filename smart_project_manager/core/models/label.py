@@ -1,4 +1,5 @@
 # Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import sys
 from typing import Dict, Optional
 from dataclasses import dataclass
 
@@ -7,12 +8,14 @@ from smart_project_manager.core.utils import generate_id
 
 @dataclass
 class Label:
+    __slots__ = ('id', 'name', 'color', 'text_color', 'description', 'created_at')
+
     id: str
     name: str
     color: str
     text_color: str
-    description: Optional[str] = None
-    created_at: Optional[str] = None
+    description: Optional[str]
+    created_at: Optional[str]
 
     def __init__(self,
                  name: str,
@@ -41,12 +44,11 @@ class Label:
 
     @classmethod
     def from_dict(cls, data: Dict) -> 'Label':
-        text_color = data.get('text_color', '')
-        return cls(
-            id=data['id'],
-            name=data['name'],
-            color=data['color'],
-            text_color=text_color,
-            description=data.get('description'),
-            created_at=data.get('created_at')
-        )
+        label = cls.__new__(cls)
+        label.id = sys.intern(data['id'])
+        label.name = data['name']
+        label.color = data['color']
+        label.text_color = data.get('text_color', '')
+        label.description = data.get('description')
+        label.created_at = data.get('created_at')
+        return label
@@ -1,21 +1,24 @@
+import sys
 from typing import Dict, List, Optional
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 
-from smart_project_manager.core.models.task import Task
-from smart_project_manager.core.utils import generate_id, format_datetime, calculate_progress
+from smart_project_manager.core.utils import generate_id, format_datetime
 
 
 @dataclass
 class Project:
+    __slots__ = ('id', 'name', 'github_url', 'version', 'description', 'tasks', 'task_order',
+                 'created_at', 'updated_at')
+
     id: str
     name: str
     github_url: str
     version: str
-    description: Optional[str] = None
-    tasks: List[str] = field(default_factory=list)
-    task_order: List[str] = field(default_factory=list)
-    created_at: Optional[str] = None
-    updated_at: Optional[str] = None
+    description: Optional[str]
+    tasks: List[str]
+    task_order: List[str]
+    created_at: Optional[str]
+    updated_at: Optional[str]
 
     def __init__(
             self,
@@ -54,18 +57,6 @@ class Project:
                 self.task_order.remove(task_id)
             self.updated_at = format_datetime()
 
-    def get_progress(self, all_tasks: Dict[str, Task]) -> float:
-        if not self.tasks:
-            return 0.0
-
-        completed = 0
-        for task_id in self.tasks:
-            task = all_tasks.get(task_id)
-            if task and task.completed:
-                completed += 1
-
-        return calculate_progress(len(self.tasks), completed)
-
     def to_dict(self) -> Dict:
         return {
             "id": self.id,
@@ -73,25 +64,22 @@ class Project:
             "github_url": self.github_url,
             "version": self.version,
             "description": self.description,
-            "tasks": self.tasks,
-            "task_order": self.task_order,
+            "tasks": list(self.tasks),
+            "task_order": list(self.task_order),
             "created_at": self.created_at,
             "updated_at": self.updated_at
         }
 
     @classmethod
     def from_dict(cls, data: Dict) -> 'Project':
-        github_url = data.get('github_url', '')
-
-        project = cls(
-            id=data['id'],
-            name=data['name'],
-            github_url=github_url,
-            version=data['version'],
-            description=data.get('description'),
-            task_order=data.get('task_order', [])
-        )
-        project.tasks = data.get('tasks', [])
+        project = cls.__new__(cls)
+        project.id = sys.intern(data['id'])
+        project.name = data['name']
+        project.github_url = data.get('github_url', '')
+        project.version = data['version']
+        project.description = data.get('description')
+        project.tasks = list(map(sys.intern, data.get('tasks') or ()))
+        project.task_order = list(map(sys.intern, data.get('task_order') or ()))
         project.created_at = data.get('created_at')
         project.updated_at = data.get('updated_at')
         return project
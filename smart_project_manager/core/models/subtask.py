@@ -1,24 +1,28 @@
 # Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import sys
 from typing import Dict, List, Optional
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 
 from smart_project_manager.core.utils import generate_id, format_datetime
 
 
 @dataclass
 class SubTask:
+    __slots__ = ('id', 'title', 'completed', 'task_id', 'project_id', 'priority', 'description',
+                 'labels', 'due_date', 'completed_at', 'created_at', 'updated_at')
+
     id: str
     title: str
     completed: bool
     task_id: str
     project_id: str
-    priority: int = 3
-    description: Optional[str] = None
-    labels: List[str] = field(default_factory=list)
-    due_date: Optional[str] = None
-    completed_at: Optional[str] = None
-    created_at: Optional[str] = None
-    updated_at: Optional[str] = None
+    priority: int
+    description: Optional[str]
+    labels: Dict[str, None]
+    due_date: Optional[str]
+    completed_at: Optional[str]
+    created_at: Optional[str]
+    updated_at: Optional[str]
 
     def __init__(
             self,
@@ -37,7 +41,7 @@ class SubTask:
         self.project_id = project_id
         self.priority = priority
         self.description = description
-        self.labels = labels or []
+        self.labels = dict.fromkeys(labels or [])
         self.due_date = due_date
         self.completed = False
         self.created_at = format_datetime()
@@ -63,12 +67,12 @@ class SubTask:
 
     def add_label(self, label_id: str):
         if label_id not in self.labels:
-            self.labels.append(label_id)
+            self.labels[label_id] = None
             self.updated_at = format_datetime()
 
     def remove_label(self, label_id: str):
         if label_id in self.labels:
-            self.labels.remove(label_id)
+            del self.labels[label_id]
             self.updated_at = format_datetime()
 
     def to_dict(self) -> Dict:
@@ -80,7 +84,7 @@ class SubTask:
             "completed": self.completed,
             "task_id": self.task_id,
             "project_id": self.project_id,
-            "labels": self.labels,
+            "labels": list(self.labels),
             "due_date": self.due_date,
             "completed_at": self.completed_at,
             "created_at": self.created_at,
@@ -89,16 +93,15 @@ class SubTask:
 
     @classmethod
     def from_dict(cls, data: Dict) -> 'SubTask':
-        subtask = cls(
-            id=data['id'],
-            title=data['title'],
-            task_id=data['task_id'],
-            project_id=data['project_id'],
-            priority=data['priority'],
-            description=data.get('description'),
-            labels=data.get('labels', []),
-            due_date=data.get('due_date')
-        )
+        subtask = cls.__new__(cls)
+        subtask.id = sys.intern(data['id'])
+        subtask.title = data['title']
+        subtask.task_id = sys.intern(data['task_id'])
+        subtask.project_id = sys.intern(data['project_id'])
+        subtask.priority = data['priority']
+        subtask.description = data.get('description')
+        subtask.labels = dict.fromkeys(map(sys.intern, data.get('labels') or ()))
+        subtask.due_date = data.get('due_date')
         subtask.completed = data['completed']
         subtask.created_at = data.get('created_at')
         subtask.updated_at = data.get('updated_at')
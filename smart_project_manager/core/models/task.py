@@ -1,25 +1,29 @@
 # Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import sys
 from typing import Dict, List, Optional
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 
-from smart_project_manager.core.models.subtask import SubTask
-from smart_project_manager.core.utils import generate_id, format_datetime, calculate_progress
+from smart_project_manager.core.utils import generate_id, format_datetime
 
 
 @dataclass
 class Task:
+    __slots__ = ('id', 'title', 'project_id', 'priority', 'description', 'completed', 'labels',
+                 'subtasks', 'due_date', 'rank', 'completed_at', 'created_at', 'updated_at')
+
     id: str
     title: str
     project_id: str
-    priority: int = 3
-    description: Optional[str] = None
-    completed: bool = False
-    labels: List[str] = field(default_factory=list)
-    subtasks: List[str] = field(default_factory=list)
-    due_date: Optional[str] = None
-    completed_at: Optional[str] = None
-    created_at: Optional[str] = None
-    updated_at: Optional[str] = None
+    priority: int
+    description: Optional[str]
+    completed: bool
+    labels: Dict[str, None]
+    subtasks: List[str]
+    due_date: Optional[str]
+    rank: Optional[str]
+    completed_at: Optional[str]
+    created_at: Optional[str]
+    updated_at: Optional[str]
 
     def __init__(
             self, title: str,
@@ -35,21 +39,26 @@ class Task:
         self.project_id = project_id
         self.priority = priority
         self.description = description
-        self.labels = labels or []
+        self.labels = dict.fromkeys(labels or [])
         self.subtasks = []
         self.due_date = due_date
+        self.rank = None
         self.completed = False
         self.created_at = format_datetime()
         self.updated_at = self.created_at
         self.completed_at = None
 
     def toggle_complete(self):
-        self.completed = not self.completed
-        self.updated_at = format_datetime()
-        if self.completed:
-            self.completed_at = self.updated_at
-        else:
-            self.completed_at = None
+        self.set_completed(not self.completed)
+
+    def set_completed(self, completed: bool):
+        if completed != self.completed:
+            self.completed = completed
+            self.updated_at = format_datetime()
+            if self.completed:
+                self.completed_at = self.updated_at
+            else:
+                self.completed_at = None
 
     def update(self, **kwargs):
         for key, value in kwargs.items():
@@ -72,53 +81,14 @@ class Task:
 
     def add_label(self, label_id: str):
         if label_id not in self.labels:
-            self.labels.append(label_id)
+            self.labels[label_id] = None
             self.updated_at = format_datetime()
 
     def remove_label(self, label_id: str):
         if label_id in self.labels:
-            self.labels.remove(label_id)
+            del self.labels[label_id]
             self.updated_at = format_datetime()
 
-    def check_completion(self, all_subtasks: Dict[str, SubTask]) -> bool:
-        if not self.subtasks:
-            return self.completed
-
-        for subtask_id in self.subtasks:
-            subtask = all_subtasks.get(subtask_id)
-            if subtask and not subtask.completed:
-                return False
-        return True
-
-    def update_completion(self, all_subtasks: Dict[str, SubTask]):
-        if self.subtasks:
-            all_completed = True
-            for subtask_id in self.subtasks:
-                subtask = all_subtasks.get(subtask_id)
-                if subtask and not subtask.completed:
-                    all_completed = False
-                    break
-
-            if all_completed != self.completed:
-                self.completed = all_completed
-                self.updated_at = format_datetime()
-                if self.completed:
-                    self.completed_at = self.updated_at
-                else:
-                    self.completed_at = None
-
-    def get_progress(self, all_subtasks: Dict[str, SubTask]) -> float:
-        if not self.subtasks:
-            return 100.0 if self.completed else 0.0
-
-        completed = 0
-        for subtask_id in self.subtasks:
-            subtask = all_subtasks.get(subtask_id)
-            if subtask and subtask.completed:
-                completed += 1
-
-        return calculate_progress(len(self.subtasks), completed)
-
     def to_dict(self) -> Dict:
         return {
             "id": self.id,
@@ -127,9 +97,10 @@ class Task:
             "priority": self.priority,
             "completed": self.completed,
             "project_id": self.project_id,
-            "labels": self.labels,
-            "subtasks": self.subtasks,
+            "labels": list(self.labels),
+            "subtasks": list(self.subtasks),
             "due_date": self.due_date,
+            "rank": self.rank,
             "completed_at": self.completed_at,
             "created_at": self.created_at,
             "updated_at": self.updated_at
@@ -137,17 +108,17 @@ class Task:
 
     @classmethod
     def from_dict(cls, data: Dict) -> 'Task':
-        task = cls(
-            id=data['id'],
-            title=data['title'],
-            project_id=data['project_id'],
-            priority=data['priority'],
-            description=data.get('description'),
-            labels=data.get('labels', []),
-            due_date=data.get('due_date')
-        )
+        task = cls.__new__(cls)
+        task.id = sys.intern(data['id'])
+        task.title = data['title']
+        task.project_id = sys.intern(data['project_id'])
+        task.priority = data['priority']
+        task.description = data.get('description')
+        task.labels = dict.fromkeys(map(sys.intern, data.get('labels') or ()))
+        task.due_date = data.get('due_date')
+        task.rank = data.get('rank')
         task.completed = data['completed']
-        task.subtasks = data.get('subtasks', [])
+        task.subtasks = list(map(sys.intern, data.get('subtasks') or ()))
         task.created_at = data.get('created_at')
         task.updated_at = data.get('updated_at')
         task.completed_at = data.get('completed_at')
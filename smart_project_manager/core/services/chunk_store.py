@@ -0,0 +1,87 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import gzip
+import hashlib
+import os
+import shutil
+from typing import AbstractSet, Optional
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+class ChunkStore:
+
+    SUFFIXES = ('.zst', '.gz')
+
+    def __init__(self, chunk_dir: str):
+        self.chunk_dir = chunk_dir
+
+    @staticmethod
+    def digest(raw: bytes) -> str:
+        return hashlib.sha256(raw).hexdigest()
+
+    def find(self, digest: str) -> Optional[str]:
+        for suffix in self.SUFFIXES:
+            path = os.path.join(self.chunk_dir, digest + suffix)
+            if os.path.exists(path):
+                return path
+        return None
+
+    def put(self, raw: bytes) -> str:
+        # chunks are named by the hash of their uncompressed content, so an unchanged one is stored once
+        digest = self.digest(raw)
+        if self.find(digest) is not None:
+            return digest
+
+        os.makedirs(self.chunk_dir, exist_ok=True)
+        if zstandard is not None:
+            path = os.path.join(self.chunk_dir, digest + '.zst')
+            compressed = zstandard.ZstdCompressor().compress(raw)
+        else:
+            path = os.path.join(self.chunk_dir, digest + '.gz')
+            compressed = gzip.compress(raw, mtime=0)
+
+        temp_path = f"{path}.tmp"
+        with open(temp_path, 'wb') as f:
+            f.write(compressed)
+        os.replace(temp_path, path)
+        return digest
+
+    def get(self, digest: str) -> bytes:
+        path = self.find(digest)
+        if path is None:
+            raise FileNotFoundError(f"Backup chunk {digest} is missing")
+
+        with open(path, 'rb') as f:
+            compressed = f.read()
+
+        if path.endswith('.zst'):
+            if zstandard is None:
+                raise RuntimeError(f"Reading {path} requires the zstandard package")
+            return zstandard.ZstdDecompressor().decompress(compressed)
+        return gzip.decompress(compressed)
+
+    def size(self) -> int:
+        if not os.path.exists(self.chunk_dir):
+            return 0
+
+        with os.scandir(self.chunk_dir) as entries:
+            return sum(entry.stat().st_size for entry in entries if entry.is_file())
+
+    def remove_unreferenced(self, referenced: AbstractSet[str]) -> int:
+        if not os.path.exists(self.chunk_dir):
+            return 0
+
+        removed = 0
+        with os.scandir(self.chunk_dir) as entries:
+            for entry in entries:
+                if entry.name.split('.', 1)[0] not in referenced:
+                    os.remove(entry.path)
+                    removed += 1
+        return removed
+
+    def clear(self):
+        if os.path.exists(self.chunk_dir):
+            shutil.rmtree(self.chunk_dir)
@@ -0,0 +1,91 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import bisect
+from datetime import date, datetime
+from typing import Dict, List, Optional, Tuple, Union
+
+
+class DueIndex:
+
+    OVERDUE = 'overdue'
+    TODAY = 'today'
+    UPCOMING = 'upcoming'
+
+    def __init__(self):
+        self._dates: Dict[str, date] = {}
+        self._scopes: Dict[str, str] = {}
+        self._sorted: Dict[str, List[Tuple[date, str]]] = {}
+        self._status: Dict[str, str] = {}
+        self._status_day: Optional[date] = None
+
+    @staticmethod
+    def parse(value: Union[date, str, None]) -> Optional[date]:
+        if not value:
+            return None
+        if isinstance(value, datetime):
+            return value.date()
+        if isinstance(value, date):
+            return value
+        try:
+            return datetime.fromisoformat(value).date()
+        except (ValueError, TypeError):
+            return None
+
+    def clear(self):
+        self._dates = {}
+        self._scopes = {}
+        self._sorted = {}
+        self._status = {}
+
+    def add(self, item_id: str, scope: str, due_date: Optional[str]):
+        self.remove(item_id)
+
+        parsed = self.parse(due_date)
+        if parsed is None:
+            return
+
+        self._dates[item_id] = parsed
+        self._scopes[item_id] = scope
+        bisect.insort(self._sorted.setdefault(scope, []), (parsed, item_id))
+
+    def remove(self, item_id: str):
+        parsed = self._dates.pop(item_id, None)
+        if parsed is None:
+            return
+
+        scope = self._scopes.pop(item_id)
+        entries = self._sorted[scope]
+        del entries[bisect.bisect_left(entries, (parsed, item_id))]
+        if not entries:
+            del self._sorted[scope]
+        self._status.pop(item_id, None)
+
+    def date_of(self, item_id: str) -> Optional[date]:
+        return self._dates.get(item_id)
+
+    def between(self, scope: str, start: Optional[date] = None, end: Optional[date] = None) -> List[str]:
+        entries = self._sorted.get(scope, [])
+        low = bisect.bisect_left(entries, (start,)) if start else 0
+        high = bisect.bisect_left(entries, (end,)) if end else len(entries)
+        return [item_id for _, item_id in entries[low:high]]
+
+    def status(self, item_id: str, today: Optional[date] = None) -> Optional[str]:
+        parsed = self._dates.get(item_id)
+        if parsed is None:
+            return None
+
+        today = today or date.today()
+        if today != self._status_day:
+            # classifications only change when the day does
+            self._status = {}
+            self._status_day = today
+
+        status = self._status.get(item_id)
+        if status is None:
+            if parsed < today:
+                status = self.OVERDUE
+            elif parsed == today:
+                status = self.TODAY
+            else:
+                status = self.UPCOMING
+            self._status[item_id] = status
+        return status
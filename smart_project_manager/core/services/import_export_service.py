@@ -1,37 +1,41 @@
 # Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import fnmatch
 import os
 import shutil
-import glob
-import json
 import tempfile
+import threading
 from datetime import datetime, timedelta
-from typing import Dict
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from smart_project_manager.core.services.chunk_store import ChunkStore
+from smart_project_manager.core.storage.storage_backend import StorageBackend
+from smart_project_manager.core.utils import JSON_DECODE_ERRORS, dumps_json, loads_json, save_json, write_json_stream
 
 
 class ImportExportService:
 
+    # new backups are a small manifest listing compressed chunks shared between backups;
+    # backups from before that are complete .json data files
+    BACKUP_PATTERNS = ('backup_*.manifest', 'backup_*.json')
+    BACKUP_NAME_FORMAT = 'backup_%Y%m%d_%H%M%S'
+    MANIFEST_EXTENSION = '.manifest'
+    CHUNK_DIR = 'chunks'
+    CHUNK_ITEMS = 2000
+
+    # creating a backup and collecting unreferenced chunks must not interleave
+    _backup_lock = threading.RLock()
+
     @staticmethod
-    def export_data(data_file: str, export_path: str) -> Dict:
+    def export_data(export_path: str, sections: Iterable[Tuple[str, Iterable[Tuple[str, Dict]]]]) -> Dict:
         try:
-            if not os.path.exists(data_file):
-                return {
-                    'success': False,
-                    'error': f'Source file {data_file} does not exist'
+            header = {
+                '_export_info': {
+                    'export_date': datetime.now().isoformat(),
+                    'export_app': 'Smart Project Manager',
+                    'version': '1.0'
                 }
-
-            shutil.copy2(data_file, export_path)
-
-            with open(export_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-
-            data['_export_info'] = {
-                'export_date': datetime.now().isoformat(),
-                'export_app': 'Smart Project Manager',
-                'version': '1.0'
             }
-
-            with open(export_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=4, ensure_ascii=False)
+            write_json_stream(export_path, header, sections, pretty=True)
 
             return {
                 'success': True,
@@ -49,8 +53,8 @@ class ImportExportService:
         try:
             backup_path = ImportExportService._create_temp_backup(data_file)
 
-            with open(import_path, 'r', encoding='utf-8') as f:
-                import_data = json.load(f)
+            with open(import_path, 'rb') as f:
+                import_data = loads_json(f.read())
 
             import_data.pop('_export_info', None)
             import_data.pop('_backup_info', None)
@@ -63,8 +67,8 @@ class ImportExportService:
                     'error': 'Invalid import data format'
                 }
 
-            with open(data_file, 'w', encoding='utf-8') as f:
-                json.dump(import_data, f, indent=4, ensure_ascii=False)
+            with open(data_file, 'wb') as f:
+                f.write(dumps_json(import_data))
 
             if backup_path and os.path.exists(backup_path):
                 os.remove(backup_path)
@@ -131,113 +135,222 @@ class ImportExportService:
         }
 
     @staticmethod
-    def create_backup(data_file: str) -> str:
-        if not os.path.exists(data_file):
-            raise FileNotFoundError(f"Cannot create backup: {data_file} does not exist")
-
+    def create_backup(data_file: str, groups: Iterable[Tuple[str, Iterable[Tuple[str, Dict]]]],
+                      retention: Optional[Dict] = None) -> str:
         backup_dir = os.path.join(os.path.dirname(data_file), 'backups')
-        os.makedirs(backup_dir, exist_ok=True)
+        chunk_store = ChunkStore(os.path.join(backup_dir, ImportExportService.CHUNK_DIR))
+        backup_date = datetime.now()
+        backup_path = os.path.join(
+            backup_dir, backup_date.strftime(ImportExportService.BACKUP_NAME_FORMAT) + ImportExportService.MANIFEST_EXTENSION
+        )
+
+        with ImportExportService._backup_lock:
+            chunks = []
+            for section, items in groups:
+                batch = {}
+                for item_id, item in items:
+                    batch[item_id] = item
+                    if len(batch) >= ImportExportService.CHUNK_ITEMS:
+                        chunks.append(ImportExportService._put_chunk(chunk_store, section, batch))
+                        batch = {}
+                if batch:
+                    chunks.append(ImportExportService._put_chunk(chunk_store, section, batch))
+
+            manifest = {
+                '_backup_info': {
+                    'backup_date': backup_date.isoformat(),
+                    'original_file': data_file,
+                    'logical_size': sum(chunk['size'] for chunk in chunks)
+                },
+                'chunks': chunks
+            }
+            save_json(backup_path, manifest, pretty=True)
 
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        backup_path = os.path.join(backup_dir, f'backup_{timestamp}.json')
+            ImportExportService.cleanup_old_backups(backup_dir, **(retention or {}))
 
-        shutil.copy2(data_file, backup_path)
+        return backup_path
 
-        with open(backup_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+    @staticmethod
+    def _put_chunk(chunk_store: ChunkStore, section: str, batch: Dict) -> Dict:
+        raw = dumps_json(batch)
+        return {'section': section, 'digest': chunk_store.put(raw), 'items': len(batch), 'size': len(raw)}
 
-        data['_backup_info'] = {
-            'backup_date': datetime.now().isoformat(),
-            'original_file': data_file
-        }
+    @staticmethod
+    def restore_backup(data_file: str, backup_path: str) -> Dict:
+        if not backup_path.endswith(ImportExportService.MANIFEST_EXTENSION):
+            # backups from before chunking are complete data files
+            return ImportExportService.import_data(data_file, backup_path)
 
-        with open(backup_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=4, ensure_ascii=False)
+        try:
+            with open(backup_path, 'rb') as f:
+                chunks = loads_json(f.read())['chunks']
+            chunk_store = ChunkStore(os.path.join(os.path.dirname(backup_path), ImportExportService.CHUNK_DIR))
 
-        ImportExportService.cleanup_old_backups(backup_dir)
+            missing = [chunk['digest'] for chunk in chunks if chunk_store.find(chunk['digest']) is None]
+            if missing:
+                return {
+                    'success': False,
+                    'error': f'{len(missing)} backup chunks are missing'
+                }
 
-        return backup_path
+            def section_items(section):
+                for chunk in chunks:
+                    if chunk['section'] == section:
+                        yield from loads_json(chunk_store.get(chunk['digest'])).items()
+
+            # chunks are decompressed one at a time straight into the data file
+            write_json_stream(data_file, {}, ((section, section_items(section)) for section in StorageBackend.SECTIONS))
+
+            imported_items = dict.fromkeys(StorageBackend.SECTIONS, 0)
+            for chunk in chunks:
+                imported_items[chunk['section']] += chunk['items']
+
+            return {
+                'success': True,
+                'imported_items': imported_items
+            }
+        except Exception as e:
+            return {
+                'success': False,
+                'error': str(e)
+            }
 
     @staticmethod
-    def cleanup_old_backups(backup_dir: str, days_to_keep: int = 30) -> Dict:
+    def backup_date(filename: str, mtime: float) -> datetime:
+        # the timestamp in the name is the backup date; only files renamed by hand fall back to mtime
+        try:
+            return datetime.strptime(os.path.splitext(filename)[0], ImportExportService.BACKUP_NAME_FORMAT)
+        except ValueError:
+            return datetime.fromtimestamp(mtime)
+
+    @staticmethod
+    def list_backups(backup_dir: str) -> List[Dict]:
         if not os.path.exists(backup_dir):
-            return {'deleted': 0, 'kept': 0}
+            return []
 
-        cutoff_date = datetime.now() - timedelta(days=days_to_keep)
-        deleted = 0
-        kept = 0
+        backups = []
+        with os.scandir(backup_dir) as entries:
+            for entry in entries:
+                if not entry.is_file() or not any(
+                        fnmatch.fnmatch(entry.name, pattern) for pattern in ImportExportService.BACKUP_PATTERNS):
+                    continue
+                stat = entry.stat()
+                backups.append({
+                    'path': entry.path,
+                    'filename': entry.name,
+                    'date': ImportExportService.backup_date(entry.name, stat.st_mtime),
+                    'size': stat.st_size,
+                    'chunked': entry.name.endswith(ImportExportService.MANIFEST_EXTENSION)
+                })
 
-        backup_files = glob.glob(os.path.join(backup_dir, 'backup_*.json'))
+        backups.sort(key=lambda backup: backup['date'], reverse=True)
+        return backups
 
-        for backup_file in backup_files:
-            try:
-                with open(backup_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+    @staticmethod
+    def _read_manifest(backup: Dict) -> Dict:
+        try:
+            with open(backup['path'], 'rb') as f:
+                return loads_json(f.read())
+        except JSON_DECODE_ERRORS + (IOError,):
+            return {}
 
-                backup_date_str = data.get('_backup_info', {}).get('backup_date')
-                if backup_date_str:
-                    backup_date = datetime.fromisoformat(backup_date_str)
+    @staticmethod
+    def select_backups_to_keep(backups: List[Dict], now: Optional[datetime] = None,
+                               days_to_keep: int = 30, keep_last: int = 0,
+                               keep_daily: int = 0, keep_weekly: int = 0) -> Set[str]:
+        # backups are newest first, so the first one seen on a day or in a week is the one kept for it
+        now = now or datetime.now()
+        cutoff_date = now - timedelta(days=days_to_keep) if days_to_keep else None
+        keep = set()
+        days = set()
+        weeks = set()
+
+        for index, backup in enumerate(backups):
+            backup_date = backup['date']
+            if index < keep_last or (cutoff_date is not None and backup_date >= cutoff_date):
+                keep.add(backup['path'])
+
+            day = backup_date.date()
+            if day not in days and len(days) < keep_daily:
+                days.add(day)
+                keep.add(backup['path'])
+
+            week = backup_date.isocalendar()[:2]
+            if week not in weeks and len(weeks) < keep_weekly:
+                weeks.add(week)
+                keep.add(backup['path'])
+
+        return keep
+
+    @staticmethod
+    def cleanup_old_backups(backup_dir: str, days_to_keep: int = 30, keep_last: int = 0,
+                            keep_daily: int = 0, keep_weekly: int = 0) -> Dict:
+        if not os.path.exists(backup_dir):
+            return {'deleted': 0, 'kept': 0}
 
-                    if backup_date < cutoff_date:
-                        os.remove(backup_file)
-                        deleted += 1
-                    else:
-                        kept += 1
-                else:
+        with ImportExportService._backup_lock:
+            now = datetime.now()
+            backups = ImportExportService.list_backups(backup_dir)
+            keep = ImportExportService.select_backups_to_keep(
+                backups, now, days_to_keep, keep_last, keep_daily, keep_weekly
+            )
+            deleted = 0
+            kept = 0
+
+            for backup in backups:
+                if backup['path'] in keep:
                     kept += 1
+                    continue
 
-            except Exception as e:
-                print(e)
-                kept += 1
-                continue
+                try:
+                    os.remove(backup['path'])
+                    deleted += 1
+                except Exception as e:
+                    print(e)
+                    kept += 1
+
+            if deleted:
+                # only chunks no remaining manifest refers to can go; the manifests are small to read
+                referenced = {
+                    chunk['digest']
+                    for backup in backups if backup['chunked'] and backup['path'] in keep
+                    for chunk in ImportExportService._read_manifest(backup).get('chunks', [])
+                }
+                ChunkStore(os.path.join(backup_dir, ImportExportService.CHUNK_DIR)).remove_unreferenced(referenced)
 
         return {
             'deleted': deleted,
             'kept': kept,
-            'cutoff_date': cutoff_date.strftime('%Y-%m-%d')
+            'cutoff_date': (now - timedelta(days=days_to_keep)).strftime('%Y-%m-%d') if days_to_keep else None
         }
 
     @staticmethod
     def get_backup_info(backup_dir: str) -> Dict:
-        if not os.path.exists(backup_dir):
-            return {'total': 0, 'total_size_mb': 0, 'backups': []}
-
-        backup_files = glob.glob(os.path.join(backup_dir, 'backup_*.json'))
-        backups = []
-        total_size = 0
-
-        for backup_file in backup_files:
-            try:
-                size = os.path.getsize(backup_file)
-                total_size += size
-
-                with open(backup_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-
-                backup_date_str = data.get('_backup_info', {}).get('backup_date')
-                if backup_date_str:
-                    backup_date = datetime.fromisoformat(backup_date_str)
-                    date_str = backup_date.strftime('%Y-%m-%d %H:%M:%S')
-                else:
-                    date_str = "Unknown date"
-
-                backups.append({
-                    'path': backup_file,
-                    'filename': os.path.basename(backup_file),
-                    'date': date_str,
-                    'size_mb': size / (1024 * 1024)
-                })
+        backups = ImportExportService.list_backups(backup_dir)
+        for backup in backups:
+            if backup['chunked']:
+                backup['logical_size'] = ImportExportService._read_manifest(backup).get(
+                    '_backup_info', {}).get('logical_size', 0)
+            else:
+                backup['logical_size'] = backup['size']
 
-            except Exception as e:
-                print(e)
-                continue
-
-        backups.sort(key=lambda x: x['filename'], reverse=True)
+        physical_size = sum(backup['size'] for backup in backups)
+        physical_size += ChunkStore(os.path.join(backup_dir, ImportExportService.CHUNK_DIR)).size()
 
         return {
-            'total': len(backup_files),
-            'total_size_mb': total_size / (1024 * 1024),
-            'backups': backups[:10]
+            'total': len(backups),
+            'total_size_mb': physical_size / (1024 * 1024),
+            'logical_size_mb': sum(backup['logical_size'] for backup in backups) / (1024 * 1024),
+            'physical_size_mb': physical_size / (1024 * 1024),
+            'backups': [
+                {
+                    'path': backup['path'],
+                    'filename': backup['filename'],
+                    'date': backup['date'].strftime('%Y-%m-%d %H:%M:%S'),
+                    'size_mb': backup['logical_size'] / (1024 * 1024)
+                }
+                for backup in backups[:10]
+            ]
         }
 
     @staticmethod
@@ -245,26 +358,28 @@ class ImportExportService:
         if not os.path.exists(backup_dir):
             return {'deleted': 0, 'total_size_mb': 0}
 
-        backup_files = glob.glob(os.path.join(backup_dir, 'backup_*.json'))
+        with ImportExportService._backup_lock:
+            backups = ImportExportService.list_backups(backup_dir)
 
-        if not backup_files:
-            return {'deleted': 0, 'total_size_mb': 0}
+            if not backups:
+                return {'deleted': 0, 'total_size_mb': 0}
 
-        total_size = 0
-        for backup_file in backup_files:
-            total_size += os.path.getsize(backup_file)
+            chunk_store = ChunkStore(os.path.join(backup_dir, ImportExportService.CHUNK_DIR))
+            total_size = sum(backup['size'] for backup in backups) + chunk_store.size()
+
+            deleted_count = 0
+            for backup in backups:
+                try:
+                    os.remove(backup['path'])
+                    deleted_count += 1
+                except Exception as e:
+                    print(e)
+                    continue
 
-        deleted_count = 0
-        for backup_file in backup_files:
-            try:
-                os.remove(backup_file)
-                deleted_count += 1
-            except Exception as e:
-                print(e)
-                continue
+            chunk_store.clear()
 
         return {
             'deleted': deleted_count,
             'total_size_mb': total_size / (1024 * 1024),
-            'total_files': len(backup_files)
+            'total_files': len(backups)
         }
@@ -0,0 +1,76 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import os
+from typing import Dict, Iterable
+
+from smart_project_manager.core.utils import JSON_DECODE_ERRORS, dumps_json, loads_json
+
+
+class JournalService:
+
+    def __init__(self, journal_file: str, checkpoint_size: int = 4 * 1024 * 1024):
+        self.journal_file = journal_file
+        self.checkpoint_size = checkpoint_size
+
+    def append(self, records: Iterable[Dict]):
+        lines = b''.join(dumps_json(record) + b'\n' for record in records)
+        if not lines:
+            return
+
+        with open(self.journal_file, 'ab') as f:
+            f.write(lines)
+
+    def replay(self, data: Dict) -> int:
+        if not os.path.exists(self.journal_file):
+            return 0
+
+        applied = 0
+        valid_size = 0
+        with open(self.journal_file, 'rb') as f:
+            for line in f:
+                try:
+                    record = loads_json(line)
+                except JSON_DECODE_ERRORS:
+                    # a crash while appending can leave a partial last line
+                    break
+
+                section = data.setdefault(record['section'], {})
+                if record['op'] == 'put':
+                    section[record['data']['id']] = record['data']
+                elif record['op'] == 'del':
+                    section.pop(record['id'], None)
+                applied += 1
+                valid_size += len(line)
+            else:
+                if valid_size == self.size() and self._ends_with_newline(f, valid_size):
+                    return applied
+
+        self._repair(valid_size)
+        return applied
+
+    @staticmethod
+    def _ends_with_newline(f, size: int) -> bool:
+        if not size:
+            return True
+        f.seek(size - 1)
+        return f.read(1) == b'\n'
+
+    def _repair(self, valid_size: int):
+        # later appends would otherwise be glued onto the damaged line and lost with it on the next replay
+        with open(self.journal_file, 'r+b') as f:
+            f.truncate(valid_size)
+            if valid_size and not self._ends_with_newline(f, valid_size):
+                f.seek(valid_size)
+                f.write(b'\n')
+
+    def size(self) -> int:
+        try:
+            return os.path.getsize(self.journal_file)
+        except OSError:
+            return 0
+
+    def needs_checkpoint(self) -> bool:
+        return self.size() >= self.checkpoint_size
+
+    def clear(self):
+        if os.path.exists(self.journal_file):
+            os.remove(self.journal_file)
@@ -0,0 +1,75 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+from typing import Dict, Optional, Set
+
+
+class SearchIndex:
+
+    def __init__(self):
+        self._texts: Dict[str, str] = {}
+        self._task_projects: Dict[str, str] = {}
+        self._project_tasks: Dict[str, Dict[str, None]] = {}
+        self._postings: Dict[str, Dict[str, Dict[str, None]]] = {}
+
+    @staticmethod
+    def normalize(title: str, description: Optional[str] = None) -> str:
+        if description:
+            return f"{title}\n{description}".casefold()
+        return title.casefold()
+
+    @staticmethod
+    def trigrams(text: str) -> Set[str]:
+        return {text[i:i + 3] for i in range(len(text) - 2)}
+
+    def clear(self):
+        self._texts = {}
+        self._task_projects = {}
+        self._project_tasks = {}
+        self._postings = {}
+
+    def add(self, task_id: str, project_id: str, title: str, description: Optional[str] = None):
+        if task_id in self._texts:
+            self.remove(task_id)
+
+        text = self.normalize(title, description)
+        self._texts[task_id] = text
+        self._task_projects[task_id] = project_id
+        self._project_tasks.setdefault(project_id, {})[task_id] = None
+
+        postings = self._postings.setdefault(project_id, {})
+        for gram in self.trigrams(text):
+            postings.setdefault(gram, {})[task_id] = None
+
+    def remove(self, task_id: str):
+        text = self._texts.pop(task_id, None)
+        if text is None:
+            return
+
+        project_id = self._task_projects.pop(task_id)
+        tasks = self._project_tasks[project_id]
+        del tasks[task_id]
+        if not tasks:
+            del self._project_tasks[project_id]
+
+        postings = self._postings.get(project_id, {})
+        for gram in self.trigrams(text):
+            bucket = postings[gram]
+            del bucket[task_id]
+            if not bucket:
+                del postings[gram]
+        if not postings:
+            self._postings.pop(project_id, None)
+
+    def search(self, project_id: str, text: str) -> Set[str]:
+        task_ids = self._project_tasks.get(project_id, {})
+        query = text.casefold()
+        if not query:
+            return set(task_ids)
+
+        grams = self.trigrams(query)
+        if not grams:
+            return {task_id for task_id in task_ids if query in self._texts[task_id]}
+
+        postings = self._postings.get(project_id, {})
+        candidates = min((postings.get(gram, {}) for gram in grams), key=len)
+        # the rarest trigram narrows the candidates; the substring check on the cached text decides
+        return {task_id for task_id in candidates if query in self._texts[task_id]}
@@ -0,0 +1,88 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import threading
+from typing import Callable, Dict, Optional, Tuple
+
+from smart_project_manager.core.storage.storage_backend import StorageBackend
+
+
+class CoalescingWriter:
+
+    def __init__(self, storage: Optional[StorageBackend], snapshot: Callable[[], Dict], interval: float = 0.0):
+        self.storage = storage
+        self.snapshot = snapshot
+        self.interval = interval
+        self.lock = threading.RLock()
+
+        self._pending: Dict[Tuple[str, str], Optional[Dict]] = {}
+        self._pending_lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+
+    @property
+    def dirty(self) -> bool:
+        return bool(self._pending)
+
+    def submit(self, changes):
+        latest = {}
+        for section, item_id, item in changes:
+            latest.pop((section, item_id), None)
+            latest[(section, item_id)] = item
+        # encoded now, on the caller's thread: the timer must not read an item while it is being edited
+        encoded = {key: None if item is None else item.to_dict() for key, item in latest.items()}
+
+        with self._pending_lock:
+            for key, data in encoded.items():
+                self._pending.pop(key, None)
+                self._pending[key] = data
+
+            if self.interval > 0 and self._timer is None:
+                self._timer = threading.Timer(self.interval, self._flush_later)
+                self._timer.start()
+
+        if self.interval <= 0:
+            self.flush()
+
+    def discard(self):
+        with self._pending_lock:
+            self._pending = {}
+            self._cancel_timer()
+
+    def _cancel_timer(self):
+        if self._timer is not None:
+            if self._timer is not threading.current_thread():
+                self._timer.cancel()
+            self._timer = None
+
+    def _flush_later(self):
+        # nothing waits on the timer thread, so a failure is reported here; the pending records stay queued
+        try:
+            self.flush()
+        except Exception as e:
+            print(f"Background save error: {e}")
+
+    def flush(self):
+        with self.lock:
+            with self._pending_lock:
+                pending = self._pending
+                self._pending = {}
+                self._cancel_timer()
+
+            if not pending:
+                return
+
+            records = []
+            for (section, item_id), data in pending.items():
+                if data is None:
+                    records.append(StorageBackend.delete_record(section, item_id))
+                else:
+                    records.append(StorageBackend.put_record(section, data))
+
+            try:
+                self.storage.write(records)
+                if self.storage.needs_checkpoint():
+                    # an item caught mid-edit here is written again by the submit that edit ends with
+                    self.storage.save_all(self.snapshot())
+            except Exception:
+                with self._pending_lock:
+                    for key, data in pending.items():
+                        self._pending.setdefault(key, data)
+                raise
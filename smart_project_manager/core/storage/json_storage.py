@@ -0,0 +1,51 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import os
+from typing import Dict, List, Optional
+
+from smart_project_manager.core.services.journal_service import JournalService
+from smart_project_manager.core.storage.storage_backend import StorageBackend
+from smart_project_manager.core.utils import load_json, save_json
+
+
+class JsonStorage(StorageBackend):
+
+    def __init__(self, data_file: str, journal_file: Optional[str] = None):
+        super().__init__(data_file)
+        self.journal = JournalService(journal_file) if journal_file else None
+
+        self._ensure_data_file_exists()
+
+    def _ensure_data_file_exists(self):
+        os.makedirs(os.path.dirname(self.data_file), exist_ok=True)
+
+        if not os.path.exists(self.data_file):
+            save_json(self.data_file, self.empty_data())
+            print(f"Created new data file: {self.data_file}")
+
+    def load(self) -> Dict:
+        data = load_json(self.data_file)
+        if self.journal:
+            self.journal.replay(data)
+        return data
+
+    def write(self, records: List[Dict]):
+        if self.journal:
+            self.journal.append(records)
+
+    def save_all(self, data: Dict):
+        save_json(self.data_file, data)
+        if self.journal:
+            self.journal.clear()
+
+    def needs_checkpoint(self) -> bool:
+        return not self.journal or self.journal.needs_checkpoint()
+
+    def snapshot_stale(self) -> bool:
+        return bool(self.journal) and self.journal.size() > 0
+
+    def write_snapshot(self, data: Dict):
+        self.save_all(data)
+
+    def adopt_data_file(self):
+        if self.journal:
+            self.journal.clear()
@@ -0,0 +1,222 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import os
+from typing import Dict, Iterator, List, Tuple
+
+from smart_project_manager.core.services.journal_service import JournalService
+from smart_project_manager.core.storage.json_storage import JsonStorage
+from smart_project_manager.core.storage.storage_backend import StorageBackend
+from smart_project_manager.core.utils import load_json, save_json, write_json_stream
+
+
+class ShardedStorage(StorageBackend):
+
+    sharded = True
+
+    MANIFEST_SECTIONS = ('labels', 'projects')
+    SHARD_SECTIONS = ('tasks', 'subtasks')
+    # a shard is small, so its journal is folded back much sooner than the single-file one
+    SHARD_JOURNAL_SIZE = 256 * 1024
+
+    def __init__(self, shard_dir: str, json_storage: JsonStorage):
+        super().__init__(json_storage.data_file)
+        self.shard_dir = shard_dir
+        self.manifest_file = os.path.join(shard_dir, "manifest.json")
+        self.manifest_journal = JournalService(os.path.join(shard_dir, "manifest.journal"))
+        self.json_storage = json_storage
+        self._snapshot_stale = True
+        # shard and completion of each task and subtask this session has seen, so deletes can be
+        # routed and the manifest counters kept without reading the shard back
+        self._owners: Dict[Tuple[str, str], Tuple[str, bool]] = {}
+
+        os.makedirs(shard_dir, exist_ok=True)
+        if os.path.exists(self.manifest_file):
+            self._manifest = load_json(self.manifest_file)
+            self.manifest_journal.replay(self._manifest)
+            for counts in self._manifest.setdefault('counters', {}).values():
+                counts.pop('id', None)
+        else:
+            self._migrate_from_json()
+
+    def _migrate_from_json(self):
+        data = self.json_storage.load()
+        self.save_all(data)
+        self.json_storage.save_all(data)
+        self._snapshot_stale = False
+        print(f"Migrated {self.data_file} to {self.shard_dir}")
+
+    def _shard_file(self, project_id: str) -> str:
+        return os.path.join(self.shard_dir, f"{project_id}.json")
+
+    def _shard_journal(self, project_id: str) -> JournalService:
+        return JournalService(os.path.join(self.shard_dir, f"{project_id}.journal"), self.SHARD_JOURNAL_SIZE)
+
+    @staticmethod
+    def _empty_shard() -> Dict:
+        return {section: {} for section in ShardedStorage.SHARD_SECTIONS}
+
+    @staticmethod
+    def count(shard: Dict) -> Dict:
+        tasks = shard.get('tasks', {}).values()
+        subtasks = shard.get('subtasks', {}).values()
+        return {
+            'tasks': len(tasks),
+            'completed_tasks': sum(1 for task in tasks if task.get('completed')),
+            'subtasks': len(subtasks),
+            'completed_subtasks': sum(1 for subtask in subtasks if subtask.get('completed'))
+        }
+
+    def load(self) -> Dict:
+        data = {section: dict(self._manifest.get(section, {})) for section in self.MANIFEST_SECTIONS}
+        data.update(self._empty_shard())
+        data['counters'] = {project_id: dict(counts) for project_id, counts in self._manifest['counters'].items()}
+        return data
+
+    def _read_shard(self, project_id: str) -> Dict:
+        shard = load_json(self._shard_file(project_id)) or self._empty_shard()
+        self._shard_journal(project_id).replay(shard)
+        for section in self.SHARD_SECTIONS:
+            shard.setdefault(section, {})
+        return shard
+
+    def load_shard(self, project_id: str) -> Dict:
+        shard = self._read_shard(project_id)
+        for section in self.SHARD_SECTIONS:
+            for item_id, item in shard[section].items():
+                self._owners[(section, item_id)] = (project_id, bool(item.get('completed')))
+
+        # the counters are journaled after the shard, so a crash in between is corrected here
+        counts = self.count(shard)
+        if self._manifest['counters'].get(project_id, counts) != counts:
+            self._manifest['counters'][project_id] = counts
+            self._write_manifest([self.put_record('counters', dict(counts, id=project_id))])
+        return shard
+
+    def _iter_section(self, section: str) -> Iterator[Tuple[str, Dict]]:
+        if section in self.MANIFEST_SECTIONS:
+            yield from list(self._manifest.get(section, {}).items())
+            return
+
+        # one shard in memory at a time
+        for project_id in list(self._manifest.get('projects', {})):
+            yield from self._read_shard(project_id)[section].items()
+
+    def _count(self, project_id: str, section: str, items: int, completed: int):
+        counts = self._manifest['counters'].setdefault(project_id, self.count({}))
+        counts[section] += items
+        counts[f'completed_{section}'] += completed
+
+    def write(self, records: List[Dict]):
+        if not records:
+            return
+
+        shards: Dict[str, List[Dict]] = {}
+        manifest_records = []
+        deleted_projects = []
+        for record in records:
+            section = record['section']
+            if section in self.MANIFEST_SECTIONS:
+                items = self._manifest.setdefault(section, {})
+                if record['op'] == 'put':
+                    items[record['data']['id']] = record['data']
+                else:
+                    items.pop(record['id'], None)
+                    if section == 'projects':
+                        deleted_projects.append(record['id'])
+                manifest_records.append(record)
+                continue
+
+            if record['op'] == 'put':
+                key = (section, record['data']['id'])
+                # subtasks carry their task's project, so every record is routed by its own data
+                project_id = record['data'].get('project_id')
+                previous = self._owners.get(key)
+                if previous is not None:
+                    self._count(previous[0], section, -1, -previous[1])
+                    if previous[0] != project_id:
+                        # moved to another project: drop the copy left in the old shard
+                        shards.setdefault(previous[0], []).append(self.delete_record(section, key[1]))
+                completed = bool(record['data'].get('completed'))
+                self._owners[key] = (project_id, completed)
+                self._count(project_id, section, 1, completed)
+            else:
+                previous = self._owners.pop((section, record['id']), None)
+                if previous is None:
+                    continue
+                project_id = previous[0]
+                self._count(project_id, section, -1, -previous[1])
+            shards.setdefault(project_id, []).append(record)
+
+        # only the changed records are appended; a shard file is rewritten once its journal grows
+        for project_id, shard_records in shards.items():
+            journal = self._shard_journal(project_id)
+            journal.append(shard_records)
+            if journal.needs_checkpoint():
+                self._merge_shard(project_id)
+            if project_id not in deleted_projects:
+                manifest_records.append(self.put_record('counters', dict(self._manifest['counters'][project_id],
+                                                                         id=project_id)))
+
+        for project_id in deleted_projects:
+            self._manifest['counters'].pop(project_id, None)
+            manifest_records.append(self.delete_record('counters', project_id))
+            for path in (self._shard_file(project_id), self._shard_journal(project_id).journal_file):
+                if os.path.exists(path):
+                    os.remove(path)
+
+        self._write_manifest(manifest_records)
+        self._snapshot_stale = True
+
+    def _write_manifest(self, records: List[Dict]):
+        self.manifest_journal.append(records)
+        if self.manifest_journal.needs_checkpoint():
+            save_json(self.manifest_file, self._manifest)
+            self.manifest_journal.clear()
+
+    def _merge_shard(self, project_id: str):
+        save_json(self._shard_file(project_id), self._read_shard(project_id))
+        self._shard_journal(project_id).clear()
+
+    def save_all(self, data: Dict):
+        shards: Dict[str, Dict] = {}
+        tasks = data.get('tasks', {})
+        for task in tasks.values():
+            shards.setdefault(task.get('project_id'), self._empty_shard())['tasks'][task['id']] = task
+        for subtask in data.get('subtasks', {}).values():
+            task = tasks.get(subtask.get('task_id'))
+            if task is not None:
+                # subtasks live with their task, whatever project they were created under
+                subtask = dict(subtask, project_id=task.get('project_id'))
+            shards.setdefault(subtask.get('project_id'), self._empty_shard())['subtasks'][subtask['id']] = subtask
+
+        for name in os.listdir(self.shard_dir):
+            if name.endswith((".json", ".journal")):
+                os.remove(os.path.join(self.shard_dir, name))
+
+        self._owners = {}
+        counters = {}
+        for project_id, shard in shards.items():
+            if project_id is None:
+                continue
+            save_json(self._shard_file(project_id), shard)
+            counters[project_id] = self.count(shard)
+            for section in self.SHARD_SECTIONS:
+                for item_id, item in shard[section].items():
+                    self._owners[(section, item_id)] = (project_id, bool(item.get('completed')))
+
+        self._manifest = {section: dict(data.get(section, {})) for section in self.MANIFEST_SECTIONS}
+        self._manifest['counters'] = counters
+        save_json(self.manifest_file, self._manifest)
+        self._snapshot_stale = True
+
+    def snapshot_stale(self) -> bool:
+        return self._snapshot_stale
+
+    def write_snapshot(self, data: Dict):
+        # the manager only holds the shards it has loaded, so the snapshot is streamed from disk
+        write_json_stream(self.data_file, {}, ((section, self._iter_section(section)) for section in self.SECTIONS))
+        self._snapshot_stale = False
+
+    def adopt_data_file(self):
+        self.json_storage.adopt_data_file()
+        self.save_all(self.json_storage.load())
+        self._snapshot_stale = False
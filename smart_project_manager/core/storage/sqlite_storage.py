@@ -0,0 +1,162 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import os
+import sqlite3
+from typing import Dict, List
+
+from smart_project_manager.core.storage.json_storage import JsonStorage
+from smart_project_manager.core.storage.storage_backend import StorageBackend
+from smart_project_manager.core.utils import dumps_json, loads_json, save_json
+
+
+class SQLiteStorage(StorageBackend):
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS labels (
+            id TEXT PRIMARY KEY,
+            data TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS projects (
+            id TEXT PRIMARY KEY,
+            data TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS tasks (
+            id TEXT PRIMARY KEY,
+            project_id TEXT,
+            data TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_tasks_project_id ON tasks (project_id);
+        CREATE TABLE IF NOT EXISTS subtasks (
+            id TEXT PRIMARY KEY,
+            task_id TEXT,
+            project_id TEXT,
+            data TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_subtasks_task_id ON subtasks (task_id);
+        CREATE TABLE IF NOT EXISTS task_labels (
+            task_id TEXT NOT NULL,
+            label_id TEXT NOT NULL,
+            PRIMARY KEY (task_id, label_id)
+        );
+        CREATE INDEX IF NOT EXISTS idx_task_labels_label_id ON task_labels (label_id);
+        CREATE TABLE IF NOT EXISTS subtask_labels (
+            subtask_id TEXT NOT NULL,
+            label_id TEXT NOT NULL,
+            PRIMARY KEY (subtask_id, label_id)
+        );
+        CREATE INDEX IF NOT EXISTS idx_subtask_labels_label_id ON subtask_labels (label_id);
+    """
+
+    LABEL_TABLES = {
+        'tasks': ('task_labels', 'task_id'),
+        'subtasks': ('subtask_labels', 'subtask_id'),
+    }
+
+    def __init__(self, db_file: str, json_storage: JsonStorage):
+        super().__init__(json_storage.data_file)
+        self.db_file = db_file
+        self.json_storage = json_storage
+        self._snapshot_stale = True
+
+        is_new = not os.path.exists(db_file)
+        self.connection = sqlite3.connect(db_file, check_same_thread=False)
+        self.connection.execute('PRAGMA journal_mode=WAL')
+        self.connection.execute('PRAGMA synchronous=NORMAL')
+        self.connection.executescript(self.SCHEMA)
+
+        if is_new:
+            self._migrate_from_json()
+
+    def _migrate_from_json(self):
+        data = self.json_storage.load()
+        self.save_all(data)
+        self.json_storage.save_all(data)
+        self._snapshot_stale = False
+        print(f"Migrated {self.data_file} to {self.db_file}")
+
+    def load(self) -> Dict:
+        data = {}
+        for section in self.SECTIONS:
+            rows = self.connection.execute(f'SELECT id, data FROM {section}')
+            data[section] = {item_id: loads_json(raw) for item_id, raw in rows}
+        return data
+
+    def _upsert(self, section: str, item: Dict):
+        item_id = item['id']
+        raw = dumps_json(item).decode('utf-8')
+
+        if section == 'tasks':
+            self.connection.execute(
+                'INSERT INTO tasks (id, project_id, data) VALUES (?, ?, ?) '
+                'ON CONFLICT(id) DO UPDATE SET project_id = excluded.project_id, data = excluded.data',
+                (item_id, item.get('project_id'), raw)
+            )
+        elif section == 'subtasks':
+            self.connection.execute(
+                'INSERT INTO subtasks (id, task_id, project_id, data) VALUES (?, ?, ?, ?) '
+                'ON CONFLICT(id) DO UPDATE SET task_id = excluded.task_id, '
+                'project_id = excluded.project_id, data = excluded.data',
+                (item_id, item.get('task_id'), item.get('project_id'), raw)
+            )
+        else:
+            self.connection.execute(
+                f'INSERT INTO {section} (id, data) VALUES (?, ?) '
+                f'ON CONFLICT(id) DO UPDATE SET data = excluded.data',
+                (item_id, raw)
+            )
+
+        if section in self.LABEL_TABLES:
+            table, column = self.LABEL_TABLES[section]
+            self.connection.execute(f'DELETE FROM {table} WHERE {column} = ?', (item_id,))
+            self.connection.executemany(
+                f'INSERT OR IGNORE INTO {table} ({column}, label_id) VALUES (?, ?)',
+                [(item_id, label_id) for label_id in item.get('labels', [])]
+            )
+
+    def _delete(self, section: str, item_id: str):
+        self.connection.execute(f'DELETE FROM {section} WHERE id = ?', (item_id,))
+
+        if section in self.LABEL_TABLES:
+            table, column = self.LABEL_TABLES[section]
+            self.connection.execute(f'DELETE FROM {table} WHERE {column} = ?', (item_id,))
+        elif section == 'labels':
+            for table, _ in self.LABEL_TABLES.values():
+                self.connection.execute(f'DELETE FROM {table} WHERE label_id = ?', (item_id,))
+
+    def write(self, records: List[Dict]):
+        if not records:
+            return
+
+        with self.connection:
+            for record in records:
+                if record['op'] == 'put':
+                    self._upsert(record['section'], record['data'])
+                elif record['op'] == 'del':
+                    self._delete(record['section'], record['id'])
+        self._snapshot_stale = True
+
+    def save_all(self, data: Dict):
+        with self.connection:
+            for section in self.SECTIONS:
+                self.connection.execute(f'DELETE FROM {section}')
+            for table, _ in self.LABEL_TABLES.values():
+                self.connection.execute(f'DELETE FROM {table}')
+
+            for section in self.SECTIONS:
+                for item in data.get(section, {}).values():
+                    self._upsert(section, item)
+        self._snapshot_stale = True
+
+    def snapshot_stale(self) -> bool:
+        return self._snapshot_stale
+
+    def write_snapshot(self, data: Dict):
+        save_json(self.data_file, data)
+        self._snapshot_stale = False
+
+    def adopt_data_file(self):
+        self.json_storage.adopt_data_file()
+        self.save_all(self.json_storage.load())
+        self._snapshot_stale = False
+
+    def close(self):
+        self.connection.close()
@@ -0,0 +1,59 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+from abc import ABC, abstractmethod
+from typing import Dict, List
+
+
+class StorageBackend(ABC):
+
+    SECTIONS = ('labels', 'projects', 'tasks', 'subtasks')
+
+    # sharded backends load only labels and projects up front; tasks come per project from load_shard
+    sharded = False
+
+    def __init__(self, data_file: str):
+        self.data_file = data_file
+
+    @staticmethod
+    def put_record(section: str, data: Dict) -> Dict:
+        return {'op': 'put', 'section': section, 'data': data}
+
+    @staticmethod
+    def delete_record(section: str, item_id: str) -> Dict:
+        return {'op': 'del', 'section': section, 'id': item_id}
+
+    @staticmethod
+    def empty_data() -> Dict:
+        return {section: {} for section in StorageBackend.SECTIONS}
+
+    @abstractmethod
+    def load(self) -> Dict:
+        pass
+
+    @abstractmethod
+    def write(self, records: List[Dict]):
+        pass
+
+    @abstractmethod
+    def save_all(self, data: Dict):
+        pass
+
+    def load_shard(self, project_id: str) -> Dict:
+        raise NotImplementedError
+
+    def needs_checkpoint(self) -> bool:
+        return False
+
+    @abstractmethod
+    def snapshot_stale(self) -> bool:
+        pass
+
+    @abstractmethod
+    def write_snapshot(self, data: Dict):
+        pass
+
+    @abstractmethod
+    def adopt_data_file(self):
+        pass
+
+    def close(self):
+        pass
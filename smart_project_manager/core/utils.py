@@ -2,9 +2,24 @@
 import json
 import os
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 import uuid
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+
+JSON_DECODE_ERRORS = (ValueError,) + ((msgspec.DecodeError,) if msgspec is not None else ())
+
+RANK_DIGITS = "0123456789abcdefghijklmnopqrstuvwxyz"
+
 
 def generate_id() -> str:
     return str(uuid.uuid4())
@@ -24,23 +39,131 @@ def ensure_directory(path: str):
     os.makedirs(os.path.dirname(path), exist_ok=True)
 
 
+def dumps_json(data: Any, pretty: bool = False) -> bytes:
+    if pretty:
+        if orjson is not None:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+        return json.dumps(data, indent=4, ensure_ascii=False, sort_keys=True).encode('utf-8')
+
+    if orjson is not None:
+        return orjson.dumps(data)
+    if msgspec is not None:
+        return msgspec.json.encode(data)
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def loads_json(raw: Union[bytes, str]) -> Any:
+    if orjson is not None:
+        return orjson.loads(raw)
+    if msgspec is not None:
+        return msgspec.json.decode(raw)
+    return json.loads(raw)
+
+
 def load_json(filepath: str) -> Dict[str, Any]:
     if os.path.exists(filepath):
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError):
+            with open(filepath, 'rb') as f:
+                return loads_json(f.read())
+        except JSON_DECODE_ERRORS + (IOError,):
             return {}
     return {}
 
 
-def save_json(filepath: str, data: Dict[str, Any]):
+def save_json(filepath: str, data: Dict[str, Any], pretty: bool = False):
+    ensure_directory(filepath)
+    temp_path = f"{filepath}.tmp"
+    with open(temp_path, 'wb') as f:
+        f.write(dumps_json(data, pretty=pretty))
+    os.replace(temp_path, filepath)
+
+
+def write_json_stream(filepath: str, header: Dict[str, Any],
+                      sections: Iterable[Tuple[str, Iterable[Tuple[str, Any]]]], pretty: bool = False):
+    # written in one pass: only the item being encoded is held in memory, and the file appears by rename
     ensure_directory(filepath)
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=4, ensure_ascii=False, sort_keys=True)
+    unit = (b'  ' if orjson is not None else b'    ') if pretty else b''
+    newline = b'\n' if pretty else b''
+    colon = b': ' if pretty else b':'
+
+    def encode(value: Any, depth: int) -> bytes:
+        raw = dumps_json(value, pretty=pretty)
+        return raw.replace(b'\n', b'\n' + unit * depth) if pretty else raw
+
+    temp_path = f"{filepath}.tmp"
+    try:
+        with open(temp_path, 'wb') as f:
+            f.write(b'{')
+            separator = b''
+            for key, value in header.items():
+                f.write(separator + newline + unit + dumps_json(key) + colon + encode(value, 1))
+                separator = b','
+
+            for section, items in sections:
+                f.write(separator + newline + unit + dumps_json(section) + colon + b'{')
+                item_separator = b''
+                for item_id, item in items:
+                    f.write(item_separator + newline + unit * 2 + dumps_json(item_id) + colon + encode(item, 2))
+                    item_separator = b','
+                f.write((newline + unit if item_separator else b'') + b'}')
+                separator = b','
+
+            f.write(newline + b'}')
+        os.replace(temp_path, filepath)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
 
 
 def calculate_progress(total: int, completed: int) -> float:
     if total == 0:
         return 0.0
     return (completed / total) * 100
+
+
+def rank_between(before: Optional[str] = None, after: Optional[str] = None) -> str:
+    # ranks are base-36 fractions compared as plain strings; results never end in "0",
+    # so there is always room for another rank below them
+    if before is not None and after is not None and before >= after:
+        raise ValueError(f"No rank between {before!r} and {after!r}")
+    base = len(RANK_DIGITS)
+    # with one side open, step right next to the given bound so repeated inserts at either end grow keys slowly
+    appending = before is not None and after is None
+    prepending = before is None and after is not None
+    result = []
+    position = 0
+    while True:
+        low = RANK_DIGITS.index(before[position]) if before and position < len(before) else 0
+        high = RANK_DIGITS.index(after[position]) if after is not None else base
+        if high - low > 1:
+            if appending:
+                digit = low + 1
+            elif prepending:
+                digit = high - 1
+            else:
+                digit = (low + high) // 2
+            result.append(RANK_DIGITS[digit])
+            return "".join(result)
+        result.append(RANK_DIGITS[low])
+        if high - low == 1:
+            after = None
+        position += 1
+
+
+def rank_sequence(count: int) -> List[str]:
+    base = len(RANK_DIGITS)
+    width = 1
+    while base ** width < (count + 1) * base:
+        width += 1
+    step = base ** width // (count + 1)
+
+    ranks = []
+    for position in range(1, count + 1):
+        value = position * step
+        digits = []
+        for _ in range(width):
+            value, digit = divmod(value, base)
+            digits.append(RANK_DIGITS[digit])
+        ranks.append("".join(reversed(digits)).rstrip("0"))
+    return ranks
@@ -0,0 +1 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
@@ -0,0 +1,321 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+from PyQt5.QtWidgets import QStyledItemDelegate, QStyle
+from PyQt5.QtGui import QColor, QPainter, QBrush, QPen, QFont, QFontMetrics, QPalette
+from PyQt5.QtCore import Qt, QEvent, QRect, QRectF, QSize, pyqtSignal
+
+from smart_project_manager.ui.label_chips import label_chips
+from smart_project_manager.ui.models.task_table_model import TaskTableModel
+
+
+PRIORITY_COLORS = {1: "#ff6b6b", 2: "#ffd166", 3: "#8ac926"}
+
+
+class DragHandleDelegate(QStyledItemDelegate):
+
+    def paint(self, painter, option, index):
+        self.initStyleOption(option, index)
+        option.widget.style().drawPrimitive(QStyle.PE_PanelItemViewItem, option, painter, option.widget)
+
+        painter.save()
+        painter.setPen(QColor("#888"))
+        painter.setFont(QFont("Arial", 14, QFont.Bold))
+        center = option.rect.center()
+        for offset in (-5, 5):
+            line_rect = QRect(option.rect.left(), center.y() + offset - 8, option.rect.width(), 16)
+            painter.drawText(line_rect, Qt.AlignCenter, "—")
+        painter.restore()
+
+    def sizeHint(self, option, index):
+        return QSize(30, 40)
+
+
+class ButtonDelegate(QStyledItemDelegate):
+    clicked = pyqtSignal(str)
+
+    BUTTON_SIZE = 30
+
+    def __init__(self, color: str, parent=None, border_width: int = 1):
+        super().__init__(parent)
+        self.color = QColor(color)
+        self.border_width = border_width
+
+    def button_style(self, index):
+        return self.color, self.border_width
+
+    def button_rect(self, rect: QRect) -> QRect:
+        size = self.BUTTON_SIZE
+        return QRect(rect.center().x() - size // 2 + 1, rect.center().y() - size // 2 + 1, size, size)
+
+    def paint(self, painter, option, index):
+        self.initStyleOption(option, index)
+        option.widget.style().drawPrimitive(QStyle.PE_PanelItemViewItem, option, painter, option.widget)
+
+        color, border_width = self.button_style(index)
+        rect = self.button_rect(option.rect)
+
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        if option.state & QStyle.State_MouseOver:
+            hover = QColor(color)
+            hover.setAlphaF(0.1)
+            painter.setBrush(QBrush(hover))
+        else:
+            painter.setBrush(Qt.NoBrush)
+        painter.setPen(QPen(color, border_width))
+        painter.drawRoundedRect(QRectF(rect).adjusted(0.5, 0.5, -0.5, -0.5), 4, 4)
+
+        font = QFont(option.font)
+        font.setPixelSize(14)
+        painter.setFont(font)
+        painter.setPen(color)
+        painter.drawText(rect, Qt.AlignCenter, index.data(Qt.DisplayRole) or "")
+        painter.restore()
+
+    def sizeHint(self, option, index):
+        return QSize(self.BUTTON_SIZE + 10, 40)
+
+    def editorEvent(self, event, model, option, index):
+        if event.type() == QEvent.MouseButtonRelease and event.button() == Qt.LeftButton:
+            if self.button_rect(option.rect).contains(event.pos()):
+                task_id = index.data(TaskTableModel.TaskIdRole)
+                if task_id:
+                    self.clicked.emit(task_id)
+                return True
+        return super().editorEvent(event, model, option, index)
+
+
+class StatusButtonDelegate(ButtonDelegate):
+
+    def __init__(self, parent=None):
+        super().__init__("#ff9800", parent, border_width=2)
+        self.completed_color = QColor("#2e7d32")
+
+    def button_style(self, index):
+        if index.data(TaskTableModel.CompletedRole):
+            return self.completed_color, 1
+        return self.color, self.border_width
+
+
+class PillButtonDelegate(ButtonDelegate):
+
+    MARGIN = 6
+
+    def __init__(self, color: str, parent=None, checked_color: str = None, min_width: int = 80):
+        super().__init__(color, parent)
+        self.checked_color = QColor(checked_color) if checked_color else None
+        self.min_width = min_width
+
+    def button_style(self, index):
+        if self.checked_color is not None and index.data(TaskTableModel.CompletedRole):
+            return self.checked_color, 0
+        return self.color, 0
+
+    def button_rect(self, rect: QRect) -> QRect:
+        return rect.adjusted(self.MARGIN, self.MARGIN, -self.MARGIN, -self.MARGIN)
+
+    def paint(self, painter, option, index):
+        self.initStyleOption(option, index)
+        option.widget.style().drawPrimitive(QStyle.PE_PanelItemViewItem, option, painter, option.widget)
+
+        color, _ = self.button_style(index)
+        if option.state & QStyle.State_MouseOver:
+            color = color.darker(110)
+        rect = self.button_rect(option.rect)
+
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QBrush(color))
+        painter.drawRoundedRect(QRectF(rect), 3, 3)
+
+        painter.setFont(option.font)
+        painter.setPen(Qt.white)
+        painter.drawText(rect, Qt.AlignCenter, index.data(Qt.DisplayRole) or "")
+        painter.restore()
+
+    def sizeHint(self, option, index):
+        width = option.fontMetrics.horizontalAdvance(index.data(Qt.DisplayRole) or "") + 20
+        return QSize(max(self.min_width, width) + 2 * self.MARGIN, 40)
+
+
+class TitleDelegate(QStyledItemDelegate):
+
+    def __init__(self, description_role: int, parent=None):
+        super().__init__(parent)
+        self.description_role = description_role
+
+    def paint(self, painter, option, index):
+        description = index.data(self.description_role)
+        if not description:
+            super().paint(painter, option, index)
+            return
+
+        self.initStyleOption(option, index)
+        option.text = ""
+        option.widget.style().drawControl(QStyle.CE_ItemViewItem, option, painter, option.widget)
+
+        rect = option.rect.adjusted(5, 2, -5, -2)
+        title_rect = QRect(rect.left(), rect.top(), rect.width(), rect.height() // 2 + 2)
+        description_rect = QRect(rect.left(), title_rect.bottom(), rect.width(), rect.bottom() - title_rect.bottom())
+
+        painter.save()
+        painter.setFont(option.font)
+        painter.setPen(option.palette.color(QPalette.Text))
+        painter.drawText(title_rect, Qt.AlignLeft | Qt.AlignBottom,
+                         option.fontMetrics.elidedText(index.data(Qt.DisplayRole) or "", Qt.ElideRight, rect.width()))
+
+        font = QFont(option.font)
+        font.setStrikeOut(False)
+        font.setPixelSize(10)
+        painter.setFont(font)
+        painter.setPen(QColor("#888"))
+        painter.drawText(description_rect, Qt.AlignLeft | Qt.AlignTop, description)
+        painter.restore()
+
+
+class PriorityDelegate(QStyledItemDelegate):
+
+    def paint(self, painter, option, index):
+        self.initStyleOption(option, index)
+        option.text = ""
+        option.widget.style().drawControl(QStyle.CE_ItemViewItem, option, painter, option.widget)
+
+        priority = index.data(TaskTableModel.PriorityRole)
+        rect = option.rect.adjusted(5, 0, -5, 0)
+
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setBrush(QBrush(QColor(PRIORITY_COLORS.get(priority, PRIORITY_COLORS[3]))))
+        painter.setPen(QPen(QColor(255, 255, 255, 100), 1))
+        painter.drawEllipse(rect.left() + 2, rect.center().y() - 5, 10, 10)
+
+        font = QFont(option.font)
+        font.setPixelSize(11)
+        font.setBold(True)
+        painter.setFont(font)
+        painter.setPen(Qt.white)
+        painter.drawText(rect.adjusted(20, 0, 0, 0), Qt.AlignLeft | Qt.AlignVCenter, index.data(Qt.DisplayRole) or "")
+        painter.restore()
+
+    def sizeHint(self, option, index):
+        return QSize(90, 40)
+
+
+class ProgressDelegate(QStyledItemDelegate):
+
+    def paint(self, painter, option, index):
+        self.initStyleOption(option, index)
+        option.text = ""
+        option.widget.style().drawControl(QStyle.CE_ItemViewItem, option, painter, option.widget)
+
+        progress = index.data(TaskTableModel.ProgressRole) or 0.0
+        rect = QRect(option.rect.left() + 4, option.rect.center().y() - 9, option.rect.width() - 8, 20)
+
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(QPen(QColor("#444"), 1))
+        painter.setBrush(Qt.NoBrush)
+        painter.drawRoundedRect(QRectF(rect).adjusted(0.5, 0.5, -0.5, -0.5), 3, 3)
+
+        if progress > 0:
+            chunk = QRectF(rect.adjusted(1, 1, -1, -1))
+            chunk.setWidth(chunk.width() * min(progress, 100.0) / 100)
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(QColor("#2a82da"))
+            painter.drawRoundedRect(chunk, 3, 3)
+
+        font = QFont(option.font)
+        font.setPixelSize(10)
+        painter.setFont(font)
+        painter.setPen(Qt.white)
+        painter.drawText(rect, Qt.AlignCenter, index.data(Qt.DisplayRole) or "")
+        painter.restore()
+
+    def sizeHint(self, option, index):
+        return QSize(100, 40)
+
+
+class LabelsDelegate(QStyledItemDelegate):
+
+    CHIP_HEIGHT = 24
+    CHIP_MIN_WIDTH = 60
+    SPACING = 5
+
+    def __init__(self, parent=None, max_labels: int = None, placeholder: str = None):
+        super().__init__(parent)
+        self.max_labels = max_labels
+        self.placeholder = placeholder
+        self.font = QFont("Arial", 9)
+        self.font.setBold(True)
+        self.metrics = QFontMetrics(self.font)
+        self.small_font = QFont("Arial")
+        self.small_font.setPixelSize(10)
+        self.small_metrics = QFontMetrics(self.small_font)
+
+    def chip_width(self, label) -> int:
+        return max(self.CHIP_MIN_WIDTH, self.metrics.horizontalAdvance(label.name) + 16)
+
+    def split_labels(self, labels):
+        if self.max_labels is None or len(labels) <= self.max_labels:
+            return labels, 0
+        return labels[:self.max_labels], len(labels) - self.max_labels
+
+    def more_width(self, hidden: int) -> int:
+        return self.small_metrics.horizontalAdvance(f"+{hidden}") + 8
+
+    def paint_placeholder(self, painter, option):
+        font = QFont(self.small_font)
+        font.setItalic(True)
+        painter.save()
+        painter.setFont(font)
+        painter.setPen(QColor("#666"))
+        painter.drawText(option.rect.adjusted(self.SPACING, 0, 0, 0), Qt.AlignLeft | Qt.AlignVCenter,
+                         self.placeholder)
+        painter.restore()
+
+    def paint_more(self, painter, x: int, option, hidden: int):
+        rect = QRect(x, option.rect.center().y() - 9, self.more_width(hidden), 18)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QColor("#3a3a3a"))
+        painter.drawRoundedRect(QRectF(rect), 3, 3)
+        painter.setFont(self.small_font)
+        painter.setPen(QColor("#888"))
+        painter.drawText(rect, Qt.AlignCenter, f"+{hidden}")
+
+    def paint(self, painter, option, index):
+        self.initStyleOption(option, index)
+        option.widget.style().drawPrimitive(QStyle.PE_PanelItemViewItem, option, painter, option.widget)
+
+        labels = index.data(TaskTableModel.LabelsRole) or []
+        if not labels:
+            if self.placeholder:
+                self.paint_placeholder(painter, option)
+            return
+
+        labels, hidden = self.split_labels(labels)
+        ratio = painter.device().devicePixelRatioF()
+
+        painter.save()
+        painter.setClipRect(option.rect)
+
+        x = option.rect.left() + self.SPACING
+        y = option.rect.center().y() - self.CHIP_HEIGHT // 2
+        for label in labels:
+            width = self.chip_width(label)
+            painter.drawPixmap(x, y, label_chips.chip(label.name, label.color, label.text_color,
+                                                      width, self.CHIP_HEIGHT, ratio, label.id))
+            x += width + self.SPACING
+            if x > option.rect.right():
+                break
+        else:
+            if hidden:
+                self.paint_more(painter, x, option, hidden)
+        painter.restore()
+
+    def sizeHint(self, option, index):
+        labels, hidden = self.split_labels(index.data(TaskTableModel.LabelsRole) or [])
+        width = sum(self.chip_width(label) + self.SPACING for label in labels) + self.SPACING
+        if hidden:
+            width += self.more_width(hidden) + self.SPACING
+        return QSize(width, 40)
@@ -224,14 +224,14 @@ class LabelManagerDialog(QDialog):
             layout.setSpacing(15)
 
             text_color = getattr(label, 'text_color', "#ffffff")
-            label_widget = LabelWidget(label.name, label.color, text_color)
+            label_widget = LabelWidget(label.name, label.color, text_color, label_id=label.id)
             label_widget.setMinimumHeight(40)
             label_widget.setMinimumWidth(120)
             layout.addWidget(label_widget)
 
             if label.description:
                 desc_label = QLabel(label.description)
-                desc_label.setStyleSheet("color: #aaa; font-size: 12px;")
+                desc_label.setObjectName("labelDescription")
                 desc_label.setWordWrap(True)
                 layout.addWidget(desc_label, 1)
 
@@ -242,11 +242,11 @@ class LabelManagerDialog(QDialog):
             colors_layout.setSpacing(2)
 
             bg_color_label = QLabel()
-            bg_color_label.setStyleSheet("color: #888; font-size: 11px; font-family: monospace;")
+            bg_color_label.setObjectName("labelColorCode")
             colors_layout.addWidget(bg_color_label)
 
             text_color_label = QLabel()
-            text_color_label.setStyleSheet("color: #888; font-size: 11px; font-family: monospace;")
+            text_color_label.setObjectName("labelColorCode")
             colors_layout.addWidget(text_color_label)
 
             layout.addWidget(colors_widget)
@@ -169,7 +169,7 @@ class SubTaskDialog(QDialog):
 
         self.selected_label_ids = []
         if subtask:
-            self.selected_label_ids = subtask.labels.copy()
+            self.selected_label_ids = list(subtask.labels)
             self.update_selected_labels_display()
 
         button_layout = QHBoxLayout()
@@ -273,7 +273,7 @@ class SubTaskDialog(QDialog):
             for label_id in self.selected_label_ids:
                 label = self.manager.get_label(label_id)
                 if label:
-                    label_widget = LabelWidget(label.name, label.color, label.text_color)
+                    label_widget = LabelWidget(label.name, label.color, label.text_color, label_id=label.id)
 
                     remove_btn = QPushButton('×')
                     remove_btn.setFixedSize(20, 20)
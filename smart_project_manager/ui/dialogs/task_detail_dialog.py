@@ -2,8 +2,9 @@ from PyQt5.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QTextEdit, QPushButton,
     QFrame, QScrollArea, QWidget
 )
-from datetime import datetime
 
+from smart_project_manager.core.services.due_index import DueIndex
+from smart_project_manager.ui.theme import set_style_state
 from smart_project_manager.ui.widgets.label_widget import LabelWidget
 
 
@@ -201,8 +202,8 @@ class TaskDetailsDialog(QDialog):
 
         if self.task.due_date:
             due_widget = self._create_info_row("Due Date:", self.task.due_date)
-            if not self.task.completed and self._is_overdue(self.task.due_date):
-                due_widget.findChild(QLabel, "value_label").setStyleSheet("color: #e74c3c; font-weight: bold;")
+            if not self.task.completed and self.manager.get_task_due_status(self.task.id) == DueIndex.OVERDUE:
+                set_style_state(due_widget.findChild(QLabel, "value_label"), "overdue", True)
             dates_layout.addWidget(due_widget)
 
         dates_layout.addStretch()
@@ -235,7 +236,7 @@ class TaskDetailsDialog(QDialog):
         for label_id in self.task.labels:
             label = self.manager.get_label(label_id)
             if label:
-                label_widget = LabelWidget(label.name, label.color)
+                label_widget = LabelWidget(label.name, label.color, label_id=label.id)
                 label_widget.setMinimumHeight(24)
                 label_widget.setMinimumWidth(70)
                 labels_container_layout.addWidget(label_widget)
@@ -279,12 +280,11 @@ class TaskDetailsDialog(QDialog):
         layout.setContentsMargins(0, 0, 0, 0)
 
         label_widget = QLabel(label)
-        label_widget.setStyleSheet("color: #aaa; font-size: 13px; min-width: 80px;")
+        label_widget.setObjectName("infoKey")
         layout.addWidget(label_widget)
 
         value_widget = QLabel(value)
         value_widget.setObjectName("value_label")
-        value_widget.setStyleSheet("color: white; font-size: 13px;")
         layout.addWidget(value_widget)
 
         layout.addStretch()
@@ -293,67 +293,39 @@ class TaskDetailsDialog(QDialog):
     def _create_subtask_row(self, subtask) -> QWidget:
         widget = QFrame()
         widget.setFrameStyle(QFrame.NoFrame)
-        widget.setStyleSheet("""
-            QFrame {
-                background-color: #353535;
-                padding: 8px;
-                border-radius: 3px;
-            }
-        """)
+        widget.setObjectName("subtaskRow")
 
         layout = QHBoxLayout(widget)
         layout.setContentsMargins(10, 5, 10, 5)
         layout.setSpacing(10)
 
         status_label = QLabel("✓" if subtask.completed else "○")
-        status_label.setStyleSheet("""
-            QLabel {
-                font-size: 14px;
-                min-width: 20px;
-            }
-        """)
-        if subtask.completed:
-            status_label.setStyleSheet("color: #2ecc71; font-size: 14px; min-width: 20px;")
+        status_label.setObjectName("subtaskStatus")
+        status_label.setProperty("completed", subtask.completed)
         layout.addWidget(status_label)
 
         title_label = QLabel(subtask.title)
-        if subtask.completed:
-            title_label.setStyleSheet("color: #888; font-size: 13px; text-decoration: line-through;")
-        else:
-            title_label.setStyleSheet("color: white; font-size: 13px;")
+        title_label.setObjectName("subtaskTitle")
+        title_label.setProperty("completed", subtask.completed)
         layout.addWidget(title_label, 1)
 
         if subtask.description:
             desc_label = QLabel(subtask.description)
-            desc_label.setStyleSheet("color: #aaa; font-size: 11px;")
+            desc_label.setObjectName("subtaskDescription")
             desc_label.setWordWrap(True)
             layout.addWidget(desc_label, 2)
 
         if subtask.due_date:
             due_label = QLabel(f"Due: {subtask.due_date}")
-            if not subtask.completed and self._is_overdue(subtask.due_date):
-                due_label.setStyleSheet("color: #e74c3c; font-size: 11px;")
-            else:
-                due_label.setStyleSheet("color: #888; font-size: 11px;")
+            due_label.setObjectName("subtaskDue")
+            due_label.setProperty(
+                "overdue", not subtask.completed and self.manager.get_subtask_due_status(subtask.id) == DueIndex.OVERDUE
+            )
             layout.addWidget(due_label)
 
         priority_label = QLabel(["High", "Med", "Low"][subtask.priority - 1])
-        priority_colors = ["#e74c3c", "#f39c12", "#3498db"]
-        priority_label.setStyleSheet(f"""
-            QLabel {{
-                color: {priority_colors[subtask.priority - 1]};
-                font-size: 11px;
-                font-weight: bold;
-                min-width: 30px;
-            }}
-        """)
+        priority_label.setObjectName("subtaskPriority")
+        priority_label.setProperty("priority", subtask.priority)
         layout.addWidget(priority_label)
 
         return widget
-
-    def _is_overdue(self, due_date_str: str) -> bool:
-        try:
-            due_date = datetime.fromisoformat(due_date_str).date()
-            return due_date < datetime.now().date()
-        except:
-            return False
@@ -192,7 +192,7 @@ class TaskDialog(QDialog):
 
         self.selected_label_ids = []
         if self.task:
-            self.selected_label_ids = self.task.labels.copy()
+            self.selected_label_ids = list(self.task.labels)
             self.update_selected_labels_display()
 
         layout.addStretch()
@@ -279,7 +279,7 @@ class TaskDialog(QDialog):
             for label_id in self.selected_label_ids:
                 label = self.manager.get_label(label_id)
                 if label:
-                    label_widget = LabelWidget(label.name, label.color, label.text_color)
+                    label_widget = LabelWidget(label.name, label.color, label.text_color, label_id=label.id)
 
                     remove_btn = QPushButton('×')
                     remove_btn.setFixedSize(20, 20)
@@ -0,0 +1,77 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+from typing import Dict, Optional, Set, Tuple
+
+from PyQt5.QtGui import QColor, QFont, QPainter, QPixmap
+from PyQt5.QtCore import Qt, QRectF
+
+
+class LabelChipCache:
+
+    MAX_CHIPS = 512
+
+    def __init__(self):
+        self._chips: Dict[Tuple, QPixmap] = {}
+        self._label_keys: Dict[str, Set[Tuple]] = {}
+        self._font: Optional[QFont] = None
+
+    def chip(self, name: str, color: str, text_color: str, width: int, height: int,
+             ratio: float = 1.0, label_id: Optional[str] = None) -> QPixmap:
+        key = (name, color, text_color, width, height, ratio, label_id)
+        pixmap = self._chips.pop(key, None)
+        if pixmap is None:
+            pixmap = self._render(name, color, text_color, width, height, ratio)
+            if len(self._chips) >= self.MAX_CHIPS:
+                self._evict(next(iter(self._chips)))
+            if label_id is not None:
+                self._label_keys.setdefault(label_id, set()).add(key)
+        # re-inserting keeps the dict in least-recently-used order
+        self._chips[key] = pixmap
+        return pixmap
+
+    def _evict(self, key: Tuple):
+        del self._chips[key]
+        label_id = key[-1]
+        keys = self._label_keys.get(label_id)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._label_keys[label_id]
+
+    def invalidate(self, label_id: Optional[str] = None):
+        if label_id is None:
+            self._chips = {}
+            self._label_keys = {}
+            return
+
+        for key in self._label_keys.pop(label_id, ()):
+            self._chips.pop(key, None)
+
+    def _render(self, name: str, color: str, text_color: str, width: int, height: int, ratio: float) -> QPixmap:
+        pixmap = QPixmap(round(width * ratio), round(height * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
+
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        rect = QRectF(0, 0, width, height)
+
+        painter.setBrush(QColor(color))
+        painter.setPen(Qt.NoPen)
+        painter.drawRoundedRect(rect, 4, 4)
+
+        painter.setBrush(Qt.NoBrush)
+        painter.setPen(QColor(255, 255, 255, 50))
+        painter.drawRoundedRect(rect, 4, 4)
+
+        if self._font is None:
+            # created on first render: fonts need the QApplication this module is imported before
+            self._font = QFont("Arial", 9)
+            self._font.setBold(True)
+        painter.setFont(self._font)
+        painter.setPen(QColor(text_color))
+        painter.drawText(rect, Qt.AlignCenter, name)
+        painter.end()
+        return pixmap
+
+
+label_chips = LabelChipCache()
@@ -1,7 +1,7 @@
 # Copyright (©) 2026, Alexander Suvorov. All rights reserved.
 import os
 import sys
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional
 
@@ -10,10 +10,10 @@ from PyQt5.QtWidgets import (
     QWidget, QLabel, QPushButton, QVBoxLayout, QMessageBox, QDialog,
     QHBoxLayout, QMenu, QAction, QDesktopWidget, QStatusBar, QFileDialog,
     QMainWindow, QLineEdit, QComboBox, QCheckBox, QFrame, QTextBrowser,
-    QScrollArea, QSizePolicy, QTableWidget
+    QScrollArea, QSizePolicy, QTableWidget, QProgressBar
 )
 from PyQt5.QtGui import QFont, QDesktopServices, QIcon
-from PyQt5.QtCore import Qt, QUrl
+from PyQt5.QtCore import Qt, QUrl, QThread, QTimer, pyqtSignal
 
 from smart_project_manager.core.managers.project_manager import ProjectManager
 from smart_project_manager.core.managers.sound_manager import SoundManager
@@ -21,23 +21,35 @@ from smart_project_manager.ui.dialogs.label_manager_dialog import LabelManagerDi
 from smart_project_manager.ui.dialogs.project_dialog import ProjectDialog
 from smart_project_manager.ui.dialogs.task_detail_dialog import TaskDetailsDialog
 from smart_project_manager.ui.dialogs.task_dialog import TaskDialog
+from smart_project_manager.ui.label_chips import label_chips
 from smart_project_manager.ui.widgets.project_progress_widget import ProjectProgressWidget
 from smart_project_manager.ui.widgets.project_tree_widget import ProjectsTreeWidget
 from smart_project_manager.ui.widgets.statistic_widget import StatisticsWidget
 from smart_project_manager.ui.widgets.task_table_widget import TaskTableWidget
 from smart_project_manager.ui.widgets.subtask_panel_widget import SubtaskPanelWidget
+from smart_project_manager.ui.workers.backup_worker import BackupCleanupWorker
+from smart_project_manager.ui.workers.load_worker import LoadWorker
+from smart_project_manager.ui.workers.search_worker import SearchWorker
 
 from smart_project_manager import __version__ as ver
 
 
 class MainWindow(QMainWindow):
+    search_requested = pyqtSignal(int, str, str)
+    load_requested = pyqtSignal()
+
+    SEARCH_DEBOUNCE_MS = 150
+
     def __init__(self):
         super().__init__()
-        self.manager = ProjectManager()
+        # the store is parsed on a worker thread after the window is up, see setup_load_worker
+        self.manager = ProjectManager(storage="sharded", flush_interval=1.0, autoload=False)
+        self.manager.add_label_listener(label_chips.invalidate)
         self.current_project_id: Optional[str] = None
         self.selected_project_item = None
         self.last_selected_project_id = None
         self.selected_task_id = None
+        self.cleanup_thread: Optional[QThread] = None
 
         self.click_sound = QSound("data/sounds/click.wav")
         self.about_sound = QSound("data/sounds/about.wav")
@@ -56,22 +68,15 @@ class MainWindow(QMainWindow):
         self.show_completed = True
         self.stats_visible = False
 
+        self.setup_search_worker()
+        self.setup_day_timer()
+
         self.setWindowTitle(f'Smart Project Manager {ver}')
         self.setMinimumSize(800, 600)
         self.resize(830, 600)
 
         self.setup_application_icon()
 
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #2d2d2d;
-            }
-            QWidget {
-                color: #ffffff;
-                font-family: Arial;
-            }
-        """)
-
         self.central_widget = QWidget()
         self.setCentralWidget(self.central_widget)
 
@@ -84,13 +89,12 @@ class MainWindow(QMainWindow):
 
         self.update_sound_button_style()
 
-        self.load_projects()
-        self.cleanup_old_backups_on_start()
-
         self.show_readme_mode()
 
         self.center_window()
 
+        self.setup_load_worker()
+
     def setup_application_icon(self):
         icon_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "data", "icons", "icon.png")
 
@@ -696,6 +700,9 @@ class MainWindow(QMainWindow):
         self.tasks_table.setContextMenuPolicy(Qt.CustomContextMenu)
         self.tasks_table.customContextMenuRequested.connect(self.show_task_context_menu)
         self.tasks_table.task_double_clicked.connect(self.on_task_double_clicked)
+        self.tasks_table.status_clicked.connect(self.toggle_task_status)
+        self.tasks_table.edit_clicked.connect(self.edit_task)
+        self.tasks_table.delete_clicked.connect(self.delete_task)
 
         self.tasks_table.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         self.tasks_table.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
@@ -918,6 +925,53 @@ class MainWindow(QMainWindow):
         self.setStatusBar(self.status_bar)
         self.status_bar.showMessage('Ready')
 
+        self.load_progress = QProgressBar()
+        self.load_progress.setMaximumWidth(200)
+        self.load_progress.setMaximumHeight(16)
+        self.load_progress.setTextVisible(False)
+        self.load_progress.hide()
+        self.status_bar.addPermanentWidget(self.load_progress)
+
+    def setup_load_worker(self):
+        self.central_widget.setEnabled(False)
+        self.menuBar().setEnabled(False)
+        self.status_bar.showMessage('Loading projects...')
+        # busy indicator until the first progress report gives a total
+        self.load_progress.setRange(0, 0)
+        self.load_progress.show()
+
+        self.load_thread = QThread(self)
+        self.load_worker = LoadWorker(self.manager)
+        self.load_worker.moveToThread(self.load_thread)
+        self.load_requested.connect(self.load_worker.load)
+        self.load_worker.progress.connect(self.on_load_progress)
+        self.load_worker.finished.connect(self.on_data_loaded)
+        self.load_worker.failed.connect(self.on_load_failed)
+        self.load_thread.start()
+        self.load_requested.emit()
+
+    def on_load_progress(self, done, total):
+        if total:
+            self.load_progress.setRange(0, total)
+            self.load_progress.setValue(done)
+
+    def on_data_loaded(self):
+        self.load_thread.quit()
+        self.load_progress.hide()
+        self.central_widget.setEnabled(True)
+        self.menuBar().setEnabled(True)
+        self.status_bar.showMessage('Ready')
+
+        self.load_projects()
+        self.cleanup_old_backups_on_start()
+
+    def on_load_failed(self, error):
+        self.load_thread.quit()
+        self.load_progress.hide()
+        # the window stays disabled: editing an empty manager would overwrite the unread store
+        self.status_bar.showMessage(f'Failed to load projects: {error}')
+        QMessageBox.critical(self, "Load Error", f"Failed to load projects:\n\n{error}")
+
     def load_projects(self):
         if self.current_project_id:
             self.last_selected_project_id = self.current_project_id
@@ -979,13 +1033,13 @@ class MainWindow(QMainWindow):
                 self.btn_open_url.setEnabled(False)
         self.reset_filters()
 
-    def on_subtask_updated(self):
+    def on_subtask_updated(self, task_id):
         if self.current_project_id:
             project = self.manager.get_project(self.current_project_id)
             if project:
                 self.project_progress_widget.update_progress(project, self.manager)
 
-            self.apply_filters()
+            self.apply_filters(changed_task_ids=(task_id,))
 
             self.update_statistics()
 
@@ -997,77 +1051,13 @@ class MainWindow(QMainWindow):
     def get_task_id_from_row(self, row: int) -> Optional[str]:
         if not self.current_project_id:
             return None
+        return self.tasks_table.task_id_at(row)
 
-        all_tasks = self.manager.get_tasks_by_project(self.current_project_id)
-        project = self.manager.get_project(self.current_project_id)
-
-        if project and project.task_order:
-            tasks_dict = {task.id: task for task in all_tasks}
-            ordered_tasks = []
-            for task_id in project.task_order:
-                if task_id in tasks_dict:
-                    ordered_tasks.append(tasks_dict.pop(task_id))
-            ordered_tasks.extend(tasks_dict.values())
-        else:
-            ordered_tasks = all_tasks
-
-        filtered_tasks = []
-        PRIORITY_MAP = {"Low": 3, "Medium": 2, "High": 1}
-        all_labels = self.manager.get_all_labels()
-        label_name_to_id = {label.name: label.id for label in all_labels}
-
-        for task in ordered_tasks:
-            search_ok = True
-            if self.search_text:
-                search_in_title = self.search_text in task.title.lower()
-                search_in_desc = task.description and self.search_text in task.description.lower()
-                search_ok = search_in_title or search_in_desc
-
-            priority_ok = True
-            if self.priority_filter != "All":
-                expected_priority = PRIORITY_MAP.get(self.priority_filter)
-                if expected_priority is not None:
-                    priority_ok = (task.priority == expected_priority)
-
-            label_ok = True
-            if self.label_filter != "All":
-                label_id = label_name_to_id.get(self.label_filter)
-                if label_id:
-                    label_ok = (label_id in task.labels)
-                else:
-                    label_ok = False
-
-            completed_ok = True
-            if not self.show_completed:
-                completed_ok = not task.completed
-
-            if search_ok and priority_ok and label_ok and completed_ok:
-                filtered_tasks.append(task)
-
-        if 0 <= row < len(filtered_tasks):
-            return filtered_tasks[row].id
-        return None
-
-    def display_filtered_tasks(self, tasks):
-        self.tasks_table.setRowCount(0)
-
-        for row, task in enumerate(tasks):
-            self.tasks_table.add_task_row(
-                row, task, self.manager,
-                self.toggle_task_status,
-                self.edit_task,
-                self.delete_task
-            )
-            item = self.tasks_table.item(row, 2)
-            if item:
-                item.setData(Qt.UserRole, task.id)
+    def display_filtered_tasks(self, tasks, changed_task_ids=None):
+        self.tasks_table.set_tasks(tasks, changed_task_ids)
 
         if self.selected_task_id:
-            for row in range(self.tasks_table.rowCount()):
-                item = self.tasks_table.item(row, 2)
-                if item and item.data(Qt.UserRole) == self.selected_task_id:
-                    self.tasks_table.selectRow(row)
-                    break
+            self.tasks_table.select_task(self.selected_task_id)
 
     def load_tasks_for_project(self, project_id: str):
         self.apply_filters()
@@ -1076,9 +1066,6 @@ class MainWindow(QMainWindow):
         self.on_notify()
         task = self.manager.get_task(task_id)
 
-        scroll_pos = self.tasks_table.verticalScrollBar().value()
-        current_row = self.get_task_row(task_id)
-
         if task:
             task.toggle_complete()
             self.manager.update_task(task_id, completed=task.completed)
@@ -1088,7 +1075,7 @@ class MainWindow(QMainWindow):
                 self.selected_task_id = None
 
             if self.current_project_id:
-                self.apply_filters()
+                self.apply_filters(changed_task_ids=(task_id,))
                 self.update_statistics()
                 self.load_projects()
 
@@ -1098,17 +1085,8 @@ class MainWindow(QMainWindow):
 
         self.update_clear_completed_button()
 
-        self.tasks_table.verticalScrollBar().setValue(scroll_pos)
-
-        if 0 <= current_row < self.tasks_table.rowCount():
-            self.tasks_table.selectRow(current_row)
-
     def get_task_row(self, task_id: str) -> int:
-        for row in range(self.tasks_table.rowCount()):
-            item = self.tasks_table.item(row, 1)
-            if item and item.data(Qt.UserRole) == task_id:
-                return row
-        return -1
+        return self.tasks_table.row_of(task_id)
 
     def create_project(self):
         self.on_notify()
@@ -1232,7 +1210,7 @@ class MainWindow(QMainWindow):
             self.btn_clear_completed.setEnabled(False)
 
             self.tasks_header.setText('Select a project to view tasks')
-            self.tasks_table.setRowCount(0)
+            self.tasks_table.clear_tasks()
 
             self.project_progress_widget.setVisible(False)
 
@@ -1271,9 +1249,10 @@ class MainWindow(QMainWindow):
                     self.selected_task_id = None
 
             deleted_count = 0
-            for task in completed_tasks:
-                if self.manager.delete_task(task.id):
-                    deleted_count += 1
+            with self.manager.batch():
+                for task in completed_tasks:
+                    if self.manager.delete_task(task.id):
+                        deleted_count += 1
 
             if self.current_project_id:
                 self.apply_filters()
@@ -1362,9 +1341,55 @@ class MainWindow(QMainWindow):
             self.label_filter_combo.setCurrentIndex(0)
             self.label_filter = "All"
 
+    def setup_search_worker(self):
+        self.search_generation = 0
+
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(self.SEARCH_DEBOUNCE_MS)
+        self.search_timer.timeout.connect(self.start_search)
+
+        self.search_thread = QThread(self)
+        self.search_worker = SearchWorker(self.manager)
+        self.search_worker.moveToThread(self.search_thread)
+        self.search_requested.connect(self.search_worker.search)
+        self.search_worker.finished.connect(self.on_search_finished)
+        self.search_thread.start()
+
+    def setup_day_timer(self):
+        self.day_timer = QTimer(self)
+        self.day_timer.setSingleShot(True)
+        self.day_timer.timeout.connect(self.on_day_changed)
+        self.schedule_day_timer()
+
+    def schedule_day_timer(self):
+        now = datetime.now()
+        midnight = datetime.combine(now.date() + timedelta(days=1), datetime.min.time())
+        self.day_timer.start(int((midnight - now).total_seconds() * 1000) + 1000)
+
+    def on_day_changed(self):
+        # overdue / due today colouring is cached per day, so repaint once the date rolls over
+        self.schedule_day_timer()
+        self.apply_filters()
+        if self.subtask_panel.isVisible():
+            self.subtask_panel.subtask_model.refresh_all()
+
     def on_search_changed(self, text):
         self.search_text = text.strip().lower()
-        self.apply_filters()
+        self.search_generation += 1
+        self.search_worker.latest_generation = self.search_generation
+        self.search_timer.start()
+
+    def start_search(self):
+        if not self.current_project_id or not self.search_text:
+            self.apply_filters()
+            return
+        self.search_requested.emit(self.search_generation, self.current_project_id, self.search_text)
+
+    def on_search_finished(self, generation, project_id, task_ids):
+        if generation != self.search_generation or project_id != self.current_project_id:
+            return
+        self.apply_filters(matching_task_ids=task_ids)
 
     def on_priority_filter_changed(self, priority):
         self.priority_filter = priority
@@ -1386,6 +1411,7 @@ class MainWindow(QMainWindow):
     def reset_filters(self):
         self.on_notify()
         self.search_input.clear()
+        self.search_timer.stop()
         self.priority_filter_combo.setCurrentIndex(0)
         self.label_filter_combo.setCurrentIndex(0)
         self.show_completed_checkbox.setChecked(True)
@@ -1427,88 +1453,40 @@ class MainWindow(QMainWindow):
     def toggle_statistics_button(self):
         self.toggle_statistics(not self.stats_visible)
 
-    def apply_filters(self):
+    def apply_filters(self, changed_task_ids=None, matching_task_ids=None):
         if not self.current_project_id:
             return
 
-        selected_task_id = None
-        selected_items = self.tasks_table.selectedItems()
-        if selected_items:
-            row = selected_items[0].row()
-            item = self.tasks_table.item(row, 1)
-            if item:
-                selected_task_id = item.data(Qt.UserRole)
-
-        scroll_pos = self.tasks_table.verticalScrollBar().value()
-
-        all_tasks = self.manager.get_tasks_by_project(self.current_project_id)
-
-        project = self.manager.get_project(self.current_project_id)
-
-        filtered_tasks = []
-
         PRIORITY_MAP = {
             "Low": 3,
             "Medium": 2,
             "High": 1,
         }
 
-        all_labels = self.manager.get_all_labels()
-        label_name_to_id = {label.name: label.id for label in all_labels}
-
-        for task in all_tasks:
-            search_ok = True
-            if self.search_text:
-                search_in_title = self.search_text in task.title.lower()
-                search_in_desc = task.description and self.search_text in task.description.lower()
-                search_ok = search_in_title or search_in_desc
-
-            priority_ok = True
-            if self.priority_filter != "All":
-                expected_priority = PRIORITY_MAP.get(self.priority_filter)
-                if expected_priority is not None:
-                    priority_ok = (task.priority == expected_priority)
-
-            label_ok = True
-            if self.label_filter != "All":
-                label_id = label_name_to_id.get(self.label_filter)
-                if label_id:
-                    label_ok = (label_id in task.labels)
-                else:
-                    label_ok = False
-
-            completed_ok = True
-            if not self.show_completed:
-                completed_ok = not task.completed
+        priorities = None
+        if self.priority_filter != "All":
+            expected_priority = PRIORITY_MAP.get(self.priority_filter)
+            if expected_priority is not None:
+                priorities = {expected_priority}
 
-            if search_ok and priority_ok and label_ok and completed_ok:
-                filtered_tasks.append(task)
+        labels_all = None
+        if self.label_filter != "All":
+            label_name_to_id = {label.name: label.id for label in self.manager.get_all_labels()}
+            labels_all = [label_name_to_id.get(self.label_filter)]
 
-        if project and project.task_order:
-            tasks_dict = {task.id: task for task in filtered_tasks}
+        filtered_tasks = list(self.manager.query(
+            project=self.current_project_id,
+            priorities=priorities,
+            labels_all=labels_all,
+            completed=None if self.show_completed else False,
+            text=self.search_text if matching_task_ids is None else None,
+            ids=matching_task_ids,
+        ))
 
-            sorted_tasks = []
-            for task_id in project.task_order:
-                if task_id in tasks_dict:
-                    sorted_tasks.append(tasks_dict.pop(task_id))
-
-            sorted_tasks.extend(tasks_dict.values())
-
-            filtered_tasks = sorted_tasks
-
-        self.display_filtered_tasks(filtered_tasks)
-
-        if selected_task_id:
-            for row in range(self.tasks_table.rowCount()):
-                item = self.tasks_table.item(row, 1)
-                if item and item.data(Qt.UserRole) == selected_task_id:
-                    self.tasks_table.selectRow(row)
-                    break
-
-        self.tasks_table.verticalScrollBar().setValue(scroll_pos)
+        self.display_filtered_tasks(filtered_tasks, changed_task_ids)
 
         filtered_count = len(filtered_tasks)
-        total_count = len(all_tasks)
+        total_count = len(self.manager.get_tasks_by_project(self.current_project_id))
 
         if filtered_count == total_count:
             self.status_bar.showMessage(f'Showing all {total_count} tasks', 2000)
@@ -1568,7 +1546,7 @@ class MainWindow(QMainWindow):
             self.manager.update_task(task.id, **data)
 
             if self.current_project_id:
-                self.apply_filters()
+                self.apply_filters(changed_task_ids=(task.id,))
                 self.update_statistics()
 
                 self.load_projects()
@@ -1633,14 +1611,11 @@ class MainWindow(QMainWindow):
         if not self.current_project_id:
             return
 
-        new_order = self.tasks_table.get_task_order()
-
-        project = self.manager.get_project(self.current_project_id)
-        if not project:
+        task_id = self.tasks_table.task_id_at(to_row)
+        if not task_id:
             return
 
-        project.task_order = new_order
-        self.manager.update_project(project.id, task_order=new_order)
+        self.manager.move_task(task_id, self.tasks_table.task_id_at(to_row - 1), self.tasks_table.task_id_at(to_row + 1))
 
         self.status_bar.showMessage(f'Task order saved', 2000)
 
@@ -1811,7 +1786,7 @@ class MainWindow(QMainWindow):
             self,
             "Import Data",
             home_dir,
-            "JSON Files (*.json);;All Files (*)"
+            "JSON Files (*.json);;Backups (*.manifest);;All Files (*)"
         )
 
         if not file_path:
@@ -1834,8 +1809,6 @@ class MainWindow(QMainWindow):
             result = self.manager.import_data(file_path)
 
             if result['success']:
-                self.manager.load_data()
-
                 self.current_project_id = None
                 self.selected_project_item = None
                 self.btn_delete_project.setEnabled(False)
@@ -1848,7 +1821,7 @@ class MainWindow(QMainWindow):
                 self.btn_clear_completed.setEnabled(False)
 
                 self.tasks_header.setText('Select a project to view tasks')
-                self.tasks_table.setRowCount(0)
+                self.tasks_table.clear_tasks()
                 self.project_progress_widget.setVisible(False)
 
                 self.load_projects()
@@ -1966,14 +1939,18 @@ class MainWindow(QMainWindow):
             )
 
     def cleanup_old_backups_on_start(self):
-        try:
-            stats = self.manager.cleanup_old_backups(days_to_keep=30)
-
-            if stats['deleted'] > 0:
-                print(f"Cleaned up {stats['deleted']} old backups")
-
-        except Exception as e:
-            print(f"Backup cleanup error: {e}")
+        # retention only needs file names and sizes, but a large backup folder still stays off the GUI thread
+        self.cleanup_thread = QThread(self)
+        self.cleanup_worker = BackupCleanupWorker(self.manager)
+        self.cleanup_worker.moveToThread(self.cleanup_thread)
+        self.cleanup_thread.started.connect(self.cleanup_worker.cleanup)
+        self.cleanup_worker.finished.connect(self.on_backups_cleaned)
+        self.cleanup_thread.start()
+
+    def on_backups_cleaned(self, stats):
+        self.cleanup_thread.quit()
+        if stats and stats['deleted'] > 0:
+            print(f"Cleaned up {stats['deleted']} old backups")
 
     def show_backup_manager(self):
         self.on_notify()
@@ -1986,7 +1963,8 @@ class MainWindow(QMainWindow):
                 message += "No backups found."
             else:
                 message += f"Total backups: {info['total']}\n"
-                message += f"Total size: {info['total_size_mb']:.2f} MB\n\n"
+                message += f"Total size: {info['logical_size_mb']:.2f} MB "
+                message += f"({info['physical_size_mb']:.2f} MB on disk)\n\n"
 
                 if info['total'] > 10:
                     message += f"Showing last 10 of {info['total']} backups:\n\n"
@@ -2391,6 +2369,15 @@ class MainWindow(QMainWindow):
         )
 
         if reply == QMessageBox.Yes:
+            self.search_timer.stop()
+            self.search_thread.quit()
+            self.search_thread.wait()
+            self.load_thread.quit()
+            self.load_thread.wait()
+            if self.cleanup_thread is not None:
+                self.cleanup_thread.quit()
+                self.cleanup_thread.wait()
+            self.manager.close()
             event.accept()
         else:
             event.ignore()
@@ -0,0 +1,168 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+from typing import Dict, List, Optional
+
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PyQt5.QtGui import QColor, QFont
+
+from smart_project_manager.core.models.subtask import SubTask
+from smart_project_manager.core.services.due_index import DueIndex
+from smart_project_manager.ui.models.task_table_model import TaskTableModel
+
+
+class SubtaskTableModel(QAbstractTableModel):
+
+    HEADERS = ['Title', 'Priority', 'Status', 'Due Date', 'Labels', 'Edit', 'Delete']
+    TITLE_COLUMN, PRIORITY_COLUMN, STATUS_COLUMN, DUE_COLUMN, \
+        LABELS_COLUMN, EDIT_COLUMN, DELETE_COLUMN = range(7)
+
+    # same role values as the task model so the task delegates can paint subtasks too
+    SubtaskIdRole = TaskTableModel.TaskIdRole
+    PriorityRole = TaskTableModel.PriorityRole
+    LabelsRole = TaskTableModel.LabelsRole
+    CompletedRole = TaskTableModel.CompletedRole
+    DescriptionRole = Qt.UserRole + 5
+
+    DUE_COLORS = {DueIndex.OVERDUE: QColor("#e74c3c"), DueIndex.TODAY: QColor("#f39c12")}
+
+    def __init__(self, manager=None, parent=None):
+        super().__init__(parent)
+        self.manager = manager
+        self.subtask_ids: List[str] = []
+        self._rows: Dict[str, int] = {}
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.subtask_ids)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+    def set_subtasks(self, subtasks: List[SubTask]):
+        self.beginResetModel()
+        self.subtask_ids = [subtask.id for subtask in subtasks]
+        self._reindex()
+        self.endResetModel()
+
+    def clear(self):
+        self.set_subtasks([])
+
+    def add_subtask(self, subtask_id: str):
+        if subtask_id in self._rows:
+            self.refresh_subtask(subtask_id)
+            return
+
+        row = len(self.subtask_ids)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.subtask_ids.append(subtask_id)
+        self._rows[subtask_id] = row
+        self.endInsertRows()
+
+    def remove_subtask(self, subtask_id: str):
+        row = self._rows.get(subtask_id)
+        if row is None:
+            return
+
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self.subtask_ids[row]
+        self._reindex()
+        self.endRemoveRows()
+
+    def refresh_subtask(self, subtask_id: str):
+        row = self._rows.get(subtask_id)
+        if row is not None:
+            self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.HEADERS) - 1))
+
+    def refresh_all(self):
+        if self.subtask_ids:
+            self.dataChanged.emit(self.index(0, 0), self.index(len(self.subtask_ids) - 1, len(self.HEADERS) - 1))
+
+    def _reindex(self):
+        self._rows = {subtask_id: row for row, subtask_id in enumerate(self.subtask_ids)}
+
+    def subtask_id_at(self, row: int) -> Optional[str]:
+        if 0 <= row < len(self.subtask_ids):
+            return self.subtask_ids[row]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or self.manager is None:
+            return None
+
+        subtask = self.manager.get_subtask(self.subtask_ids[index.row()])
+        if subtask is None:
+            return None
+
+        if role == self.SubtaskIdRole:
+            return subtask.id
+        if role == self.CompletedRole:
+            return subtask.completed
+
+        column = index.column()
+
+        if column == self.TITLE_COLUMN:
+            if role == Qt.DisplayRole:
+                return subtask.title
+            if role == self.DescriptionRole:
+                description = subtask.description or ""
+                return description[:50] + "..." if len(description) > 50 else description
+            if role == Qt.ToolTipRole:
+                return subtask.description or None
+            if role == Qt.ForegroundRole:
+                return QColor("#888") if subtask.completed else QColor("#fff")
+            if role == Qt.FontRole and subtask.completed:
+                font = QFont()
+                font.setStrikeOut(True)
+                return font
+
+        elif column == self.PRIORITY_COLUMN:
+            if role == Qt.DisplayRole:
+                return TaskTableModel.PRIORITY_NAMES.get(subtask.priority, "Low")
+            if role == self.PriorityRole:
+                return subtask.priority
+
+        elif column == self.STATUS_COLUMN:
+            if role == Qt.DisplayRole:
+                return "✅ Completed" if subtask.completed else "⏳ Pending"
+
+        elif column == self.DUE_COLUMN:
+            if role == Qt.DisplayRole:
+                return subtask.due_date or "—"
+            if role == Qt.TextAlignmentRole:
+                return Qt.AlignCenter
+            if role in (Qt.ForegroundRole, Qt.FontRole):
+                status = None if subtask.completed else self.manager.get_subtask_due_status(subtask.id)
+                if role == Qt.ForegroundRole:
+                    if not subtask.due_date:
+                        return QColor("#666")
+                    return self.DUE_COLORS.get(status, QColor("#888"))
+                font = QFont()
+                font.setItalic(not subtask.due_date)
+                font.setBold(status in self.DUE_COLORS)
+                return font
+
+        elif column == self.LABELS_COLUMN:
+            if role == self.LabelsRole:
+                labels = (self.manager.get_label(label_id) for label_id in subtask.labels)
+                return [label for label in labels if label]
+            if role == Qt.ToolTipRole:
+                names = [label.name for label in self.data(index, self.LabelsRole)]
+                return ", ".join(names) or None
+
+        elif column == self.EDIT_COLUMN:
+            if role == Qt.DisplayRole:
+                return "✏️ Edit"
+
+        elif column == self.DELETE_COLUMN:
+            if role == Qt.DisplayRole:
+                return "Delete"
+
+        return None
@@ -0,0 +1,257 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+from typing import Dict, Iterable, List, Optional
+
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PyQt5.QtGui import QColor, QFont
+
+from smart_project_manager.core.models.task import Task
+from smart_project_manager.core.services.due_index import DueIndex
+
+
+class TaskTableModel(QAbstractTableModel):
+
+    HEADERS = ['', 'Status', 'Title', 'Priority', 'Progress', 'Due Date', 'Labels', '', '']
+    DRAG_COLUMN, STATUS_COLUMN, TITLE_COLUMN, PRIORITY_COLUMN, PROGRESS_COLUMN, \
+        DUE_COLUMN, LABELS_COLUMN, EDIT_COLUMN, DELETE_COLUMN = range(9)
+    BUTTON_COLUMNS = (DRAG_COLUMN, STATUS_COLUMN, EDIT_COLUMN, DELETE_COLUMN)
+
+    TaskIdRole = Qt.UserRole
+    PriorityRole = Qt.UserRole + 1
+    ProgressRole = Qt.UserRole + 2
+    LabelsRole = Qt.UserRole + 3
+    CompletedRole = Qt.UserRole + 4
+
+    PRIORITY_NAMES = {1: "High", 2: "Medium", 3: "Low"}
+
+    def __init__(self, manager=None, parent=None):
+        super().__init__(parent)
+        self.manager = manager
+        self.task_ids: List[str] = []
+        self._rows: Dict[str, int] = {}
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.task_ids)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemIsDropEnabled
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsDragEnabled
+
+    def supportedDropActions(self):
+        return Qt.MoveAction
+
+    def set_tasks(self, tasks: List[Task], changed_ids: Optional[Iterable[str]] = None):
+        new_ids = [task.id for task in tasks]
+        wanted = set(new_ids)
+
+        row = len(self.task_ids) - 1
+        while row >= 0:
+            if self.task_ids[row] in wanted:
+                row -= 1
+                continue
+            last = row
+            while row >= 0 and self.task_ids[row] not in wanted:
+                row -= 1
+            self.beginRemoveRows(QModelIndex(), row + 1, last)
+            del self.task_ids[row + 1:last + 1]
+            self.endRemoveRows()
+
+        present = set(self.task_ids)
+        kept_order = [task_id for task_id in new_ids if task_id in present]
+        if kept_order != self.task_ids:
+            self._relayout(kept_order)
+
+        row = 0
+        while row < len(new_ids):
+            if row < len(self.task_ids) and self.task_ids[row] == new_ids[row]:
+                row += 1
+                continue
+            end = row
+            while end < len(new_ids) and new_ids[end] not in present:
+                end += 1
+            if end == row:
+                row += 1
+                continue
+            self.beginInsertRows(QModelIndex(), row, end - 1)
+            self.task_ids[row:row] = new_ids[row:end]
+            self.endInsertRows()
+            row = end
+
+        self._reindex()
+
+        if changed_ids is None:
+            if self.task_ids:
+                self.dataChanged.emit(self.index(0, 0), self.index(len(self.task_ids) - 1, len(self.HEADERS) - 1))
+        else:
+            for task_id in changed_ids:
+                self.refresh_task(task_id)
+
+    def refresh_task(self, task_id: str):
+        row = self._rows.get(task_id)
+        if row is not None:
+            self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.HEADERS) - 1))
+
+    def clear(self):
+        self.set_tasks([])
+
+    def _relayout(self, task_ids: List[str]):
+        self.layoutAboutToBeChanged.emit()
+        old_indexes = self.persistentIndexList()
+        old_ids = [(self.task_ids[index.row()], index.column()) for index in old_indexes]
+
+        self.task_ids = task_ids
+        self._reindex()
+
+        self.changePersistentIndexList(
+            old_indexes, [self.index(self._rows[task_id], column) for task_id, column in old_ids]
+        )
+        self.layoutChanged.emit()
+
+    def _reindex(self):
+        self._rows = {task_id: row for row, task_id in enumerate(self.task_ids)}
+
+    def task_id_at(self, row: int) -> Optional[str]:
+        if 0 <= row < len(self.task_ids):
+            return self.task_ids[row]
+        return None
+
+    def row_of(self, task_id: str) -> int:
+        return self._rows.get(task_id, -1)
+
+    def move_row(self, from_row: int, to_row: int) -> bool:
+        if from_row == to_row or not (0 <= from_row < len(self.task_ids)) or not (0 <= to_row < len(self.task_ids)):
+            return False
+
+        destination = to_row + 1 if to_row > from_row else to_row
+        if not self.beginMoveRows(QModelIndex(), from_row, from_row, QModelIndex(), destination):
+            return False
+        self.task_ids.insert(to_row, self.task_ids.pop(from_row))
+        self._reindex()
+        self.endMoveRows()
+        return True
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or self.manager is None:
+            return None
+
+        task = self.manager.get_task(self.task_ids[index.row()])
+        if task is None:
+            return None
+
+        if role == self.TaskIdRole:
+            return task.id
+        if role == self.CompletedRole:
+            return task.completed
+
+        column = index.column()
+
+        if column == self.STATUS_COLUMN:
+            if role == Qt.DisplayRole:
+                return "✅" if task.completed else "⏳"
+            if role == Qt.ToolTipRole:
+                return "Mark as Pending" if task.completed else "Mark as Completed"
+
+        elif column == self.TITLE_COLUMN:
+            if role == Qt.DisplayRole:
+                return task.title
+            if role == Qt.ToolTipRole:
+                return task.description or None
+            if role == self.PriorityRole:
+                return task.priority
+            if role == Qt.ForegroundRole and task.completed:
+                return QColor(100, 100, 100)
+            if role == Qt.FontRole and task.completed:
+                font = QFont()
+                font.setStrikeOut(True)
+                return font
+
+        elif column == self.PRIORITY_COLUMN:
+            if role == Qt.DisplayRole:
+                return self.PRIORITY_NAMES.get(task.priority, "Low")
+            if role == self.PriorityRole:
+                return task.priority
+
+        elif column == self.PROGRESS_COLUMN:
+            progress = self.manager.get_task_progress(task.id)
+            if role == Qt.DisplayRole:
+                return f"{progress:.1f}%"
+            if role == self.ProgressRole:
+                return progress
+
+        elif column == self.DUE_COLUMN:
+            if role == Qt.DisplayRole:
+                return task.due_date or "No due date"
+            if role == Qt.TextAlignmentRole:
+                return Qt.AlignCenter
+            if role == Qt.ForegroundRole and self._is_overdue(task):
+                return QColor(255, 100, 100)
+
+        elif column == self.LABELS_COLUMN:
+            if role == self.LabelsRole:
+                labels = (self.manager.get_label(label_id) for label_id in task.labels)
+                return [label for label in labels if label]
+            if role == Qt.ToolTipRole:
+                names = [label.name for label in self.data(index, self.LabelsRole)]
+                return ", ".join(names) or None
+
+        elif column == self.EDIT_COLUMN:
+            if role == Qt.DisplayRole:
+                return "✏️"
+            if role == Qt.ToolTipRole:
+                return "Edit Task"
+
+        elif column == self.DELETE_COLUMN:
+            if role == Qt.DisplayRole:
+                return "🗑️"
+            if role == Qt.ToolTipRole:
+                return "Delete Task"
+
+        return None
+
+    def _is_overdue(self, task: Task) -> bool:
+        return not task.completed and self.manager.get_task_due_status(task.id) == DueIndex.OVERDUE
+
+    def _sort_key(self, column: int):
+        if column == self.STATUS_COLUMN:
+            return lambda task: task.completed
+        if column == self.TITLE_COLUMN:
+            return lambda task: task.title.casefold()
+        if column == self.PRIORITY_COLUMN:
+            return lambda task: task.priority
+        if column == self.PROGRESS_COLUMN:
+            return lambda task: self.manager.get_task_progress(task.id)
+        if column == self.DUE_COLUMN:
+            return lambda task: task.due_date or ""
+        return None
+
+    @staticmethod
+    def _rank_key(task: Task) -> str:
+        return task.rank or ""
+
+    def is_manual_order(self, column: int) -> bool:
+        return self._sort_key(column) is None
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        if self.manager is None:
+            return
+
+        key = self._sort_key(column)
+        if key is None:
+            if column < 0:
+                # no sort column: the rows stay as they are, e.g. right after a drop
+                return
+            # columns without a sort key show the drag-and-drop order
+            key, order = self._rank_key, Qt.AscendingOrder
+
+        task_ids = sorted(self.task_ids, key=lambda task_id: key(self.manager.get_task(task_id)),
+                          reverse=order == Qt.DescendingOrder)
+        if task_ids != self.task_ids:
+            self._relayout(task_ids)
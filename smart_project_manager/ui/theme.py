@@ -0,0 +1,100 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+from PyQt5.QtWidgets import QApplication, QWidget
+from PyQt5.QtCore import Qt
+
+# Installed once on the application. Widgets created per row only set an objectName and,
+# where their look depends on state, a dynamic property; nothing is parsed per widget.
+# The base rules only reach the main window and what it owns, as when they were set on MainWindow;
+# dialogs keep their own style sheets.
+APP_STYLESHEET = """
+    QMainWindow {
+        background-color: #2d2d2d;
+    }
+    QMainWindow, QMainWindow QWidget {
+        color: #ffffff;
+        font-family: Arial;
+    }
+
+    QLabel#infoKey {
+        color: #aaa;
+        font-size: 13px;
+        min-width: 80px;
+    }
+    QLabel#value_label {
+        color: white;
+        font-size: 13px;
+    }
+    QLabel#value_label[overdue="true"] {
+        color: #e74c3c;
+        font-weight: bold;
+    }
+
+    QFrame#subtaskRow, QFrame#subtaskRow QLabel {
+        background-color: #353535;
+        padding: 8px;
+        border-radius: 3px;
+    }
+    QLabel#subtaskStatus {
+        font-size: 14px;
+        min-width: 20px;
+    }
+    QLabel#subtaskStatus[completed="true"] {
+        color: #2ecc71;
+    }
+    QLabel#subtaskTitle {
+        color: white;
+        font-size: 13px;
+    }
+    QLabel#subtaskTitle[completed="true"] {
+        color: #888;
+        text-decoration: line-through;
+    }
+    QLabel#subtaskDescription {
+        color: #aaa;
+        font-size: 11px;
+    }
+    QLabel#subtaskDue {
+        color: #888;
+        font-size: 11px;
+    }
+    QLabel#subtaskDue[overdue="true"] {
+        color: #e74c3c;
+    }
+    QLabel#subtaskPriority {
+        font-size: 11px;
+        font-weight: bold;
+        min-width: 30px;
+    }
+    QLabel#subtaskPriority[priority="1"] {
+        color: #e74c3c;
+    }
+    QLabel#subtaskPriority[priority="2"] {
+        color: #f39c12;
+    }
+    QLabel#subtaskPriority[priority="3"] {
+        color: #3498db;
+    }
+
+    QLabel#labelDescription {
+        color: #aaa;
+        font-size: 12px;
+    }
+    QLabel#labelColorCode {
+        color: #888;
+        font-size: 11px;
+        font-family: monospace;
+    }
+"""
+
+
+def apply_theme(app: QApplication):
+    app.setStyleSheet(APP_STYLESHEET)
+
+
+def set_style_state(widget: QWidget, name: str, value):
+    widget.setProperty(name, value)
+    # property selectors are only evaluated on polish, so an already styled widget needs a re-polish
+    if widget.testAttribute(Qt.WA_WState_Polished):
+        style = widget.style()
+        style.unpolish(widget)
+        style.polish(widget)
@@ -1,43 +1,31 @@
 # Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+from typing import Optional
+
 from PyQt5.QtWidgets import QWidget
-from PyQt5.QtGui import QColor, QPainter, QFont
-from PyQt5.QtCore import Qt, QRect
+from PyQt5.QtGui import QPainter
+
+from smart_project_manager.ui.label_chips import label_chips
 
 
 class LabelWidget(QWidget):
 
-    def __init__(self, label_name: str, color: str,text_color: str = "#ffffff", parent=None):
+    def __init__(self, label_name: str, color: str,text_color: str = "#ffffff", parent=None,
+                 label_id: Optional[str] = None):
         super().__init__(parent)
+        self.label_id = label_id
         self.label_name = label_name
-        self.color = QColor(color)
-        self.text_color = QColor(text_color)
+        self.color = color
+        self.text_color = text_color
         self.setMinimumHeight(28)
         self.setMinimumWidth(60)
 
     def paintEvent(self, event):
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
-
-        width = self.width()
-        height = self.height()
-
-        painter.setBrush(self.color)
-        painter.setPen(Qt.NoPen)
-        painter.drawRoundedRect(0, 0, width, height, 4, 4)
-
-        painter.setPen(QColor(255, 255, 255, 50))
-        painter.drawRoundedRect(0, 0, width, height, 4, 4)
-
-        painter.setPen(self.text_color)
-        font = QFont("Arial", 9)
-        font.setBold(True)
-        painter.setFont(font)
-
-        text_rect = QRect(0, 0, width, height)
-        painter.drawText(text_rect, Qt.AlignCenter, self.label_name)
+        painter.drawPixmap(0, 0, label_chips.chip(self.label_name, self.color, self.text_color,
+                                                  self.width(), self.height(), self.devicePixelRatioF(), self.label_id))
 
     def set_label(self, label_name: str, color: str, text_color: str = "#ffffff"):
         self.label_name = label_name
-        self.color = QColor(color)
-        self.text_color = QColor(text_color)
+        self.color = color
+        self.text_color = text_color
         self.update()
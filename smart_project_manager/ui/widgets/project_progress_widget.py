@@ -253,17 +253,11 @@ class ProjectProgressWidget(QGroupBox):
         else:
             self.project_url_label.setText("No GitHub URL")
 
-        tasks = manager.get_tasks_by_project(project.id)
-        total_tasks = len(tasks)
-        completed_tasks = sum(1 for task in tasks if task.completed)
-
-        total_subtasks = 0
-        completed_subtasks = 0
-
-        for task in tasks:
-            subtasks = manager.get_subtasks_by_task(task.id)
-            total_subtasks += len(subtasks)
-            completed_subtasks += sum(1 for subtask in subtasks if subtask.completed)
+        counts = manager.get_project_counts(project.id)
+        total_tasks = counts['tasks']
+        completed_tasks = counts['completed_tasks']
+        total_subtasks = counts['subtasks']
+        completed_subtasks = counts['completed_subtasks']
 
         progress = manager.get_project_progress(project.id)
         self.project_progress_bar.setValue(int(progress))
@@ -32,12 +32,9 @@ class ProjectsTreeWidget(QTreeWidget):
         item.setText(0, f"{project.name} v{project.version}")
         item.project_id = project.id
 
-        task_count = len(project.tasks)
-        completed_tasks = sum(1 for task_id in project.tasks
-                             if manager.get_task(task_id) and
-                             manager.get_task(task_id).completed)
+        counts = manager.get_project_counts(project.id)
 
-        progress_text = f" ({completed_tasks}/{task_count})"
+        progress_text = f" ({counts['completed_tasks']}/{counts['tasks']})"
         item.setText(0, f"{project.name} v{project.version}{progress_text}")
 
         if project.description:
@@ -1,29 +1,33 @@
 # Copyright (©) 2026, Alexander Suvorov. All rights reserved.
-from datetime import datetime
-
 from PyQt5.QtWidgets import (
     QWidget,
     QVBoxLayout,
     QHBoxLayout,
     QLabel,
     QPushButton,
-    QTableWidget,
+    QTableView,
+    QAbstractItemView,
     QHeaderView,
     QMessageBox,
     QFrame,
     QDialog
 )
 from PyQt5.QtGui import QFont
-from PyQt5.QtCore import Qt, pyqtSignal
+from PyQt5.QtCore import pyqtSignal
 
+from smart_project_manager.ui.delegates.task_delegates import (
+    LabelsDelegate,
+    PillButtonDelegate,
+    PriorityDelegate,
+    TitleDelegate
+)
 from smart_project_manager.ui.dialogs.subtask_dialog import SubTaskDialog
-from smart_project_manager.ui.widgets.priority_widget import PriorityIndicatorWidget
-from smart_project_manager.ui.widgets.label_widget import LabelWidget
+from smart_project_manager.ui.models.subtask_table_model import SubtaskTableModel
 
 
 class SubtaskPanelWidget(QWidget):
     panel_closed = pyqtSignal()
-    subtask_updated = pyqtSignal()
+    subtask_updated = pyqtSignal(str)
 
     def __init__(self, parent=None, manager=None, sound_manager=None):
         super().__init__(parent)
@@ -94,14 +98,16 @@ class SubtaskPanelWidget(QWidget):
 
         layout.addLayout(button_layout)
 
-        self.subtasks_table = QTableWidget()
-        self.subtasks_table.setColumnCount(7)
-        self.subtasks_table.setHorizontalHeaderLabels(
-            ['Title', 'Priority', 'Status', 'Due Date', 'Labels', 'Edit', 'Delete'])
-        self.subtasks_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.subtask_model = SubtaskTableModel(self.manager, self)
+        self.subtasks_table = QTableView()
+        self.subtasks_table.setModel(self.subtask_model)
+        self.subtasks_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.subtasks_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.subtasks_table.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
         self.subtasks_table.setAlternatingRowColors(True)
+        self.subtasks_table.setMouseTracking(True)
         self.subtasks_table.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 background-color: #2a2a2a;
                 gridline-color: #444;
             }
@@ -112,14 +118,13 @@ class SubtaskPanelWidget(QWidget):
                 font-weight: bold;
             }
         """)
+        self.subtasks_table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.subtasks_table.verticalHeader().setDefaultSectionSize(40)
+
+        self.subtasks_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+        self.subtasks_table.horizontalHeader().setSectionResizeMode(SubtaskTableModel.TITLE_COLUMN, QHeaderView.Stretch)
 
-        self.subtasks_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
-        self.subtasks_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeToContents)
-        self.subtasks_table.horizontalHeader().setSectionResizeMode(2, QHeaderView.ResizeToContents)
-        self.subtasks_table.horizontalHeader().setSectionResizeMode(3, QHeaderView.ResizeToContents)
-        self.subtasks_table.horizontalHeader().setSectionResizeMode(4, QHeaderView.ResizeToContents)
-        self.subtasks_table.horizontalHeader().setSectionResizeMode(5, QHeaderView.ResizeToContents)
-        self.subtasks_table.horizontalHeader().setSectionResizeMode(6, QHeaderView.ResizeToContents)
+        self.setup_delegates()
 
         layout.addWidget(self.subtasks_table)
 
@@ -129,6 +134,24 @@ class SubtaskPanelWidget(QWidget):
         separator.setStyleSheet("background-color: #444; max-height: 1px;")
         layout.addWidget(separator)
 
+    def setup_delegates(self):
+        self.status_delegate = PillButtonDelegate("#ff9800", self, checked_color="#2e7d32", min_width=100)
+        self.status_delegate.clicked.connect(self.toggle_subtask_status)
+        self.edit_delegate = PillButtonDelegate("#ff9800", self)
+        self.edit_delegate.clicked.connect(self.edit_subtask)
+        self.delete_delegate = PillButtonDelegate("#da2a2a", self)
+        self.delete_delegate.clicked.connect(self.delete_subtask)
+
+        table = self.subtasks_table
+        table.setItemDelegateForColumn(SubtaskTableModel.TITLE_COLUMN,
+                                       TitleDelegate(SubtaskTableModel.DescriptionRole, table))
+        table.setItemDelegateForColumn(SubtaskTableModel.PRIORITY_COLUMN, PriorityDelegate(table))
+        table.setItemDelegateForColumn(SubtaskTableModel.STATUS_COLUMN, self.status_delegate)
+        table.setItemDelegateForColumn(SubtaskTableModel.LABELS_COLUMN,
+                                       LabelsDelegate(table, max_labels=3, placeholder="—"))
+        table.setItemDelegateForColumn(SubtaskTableModel.EDIT_COLUMN, self.edit_delegate)
+        table.setItemDelegateForColumn(SubtaskTableModel.DELETE_COLUMN, self.delete_delegate)
+
     def show_for_task(self, task, project_id):
         self.current_task = task
         self.current_project_id = project_id
@@ -139,7 +162,7 @@ class SubtaskPanelWidget(QWidget):
     def hide_panel(self):
         self.current_task = None
         self.current_project_id = None
-        self.subtasks_table.setRowCount(0)
+        self.subtask_model.clear()
         self.hide()
         self.panel_closed.emit()
 
@@ -151,145 +174,7 @@ class SubtaskPanelWidget(QWidget):
         if not self.current_task:
             return
 
-        self.subtasks_table.setRowCount(0)
-        subtasks = self.manager.get_subtasks_by_task(self.current_task.id)
-
-        for row, subtask in enumerate(subtasks):
-            self.subtasks_table.insertRow(row)
-            self.subtasks_table.setRowHeight(row, 40)
-
-            title_widget = QWidget()
-            title_layout = QVBoxLayout(title_widget)
-            title_layout.setContentsMargins(5, 2, 5, 2)
-            title_layout.setSpacing(2)
-
-            title_label = QLabel(subtask.title)
-            if subtask.completed:
-                title_label.setStyleSheet("color: #888; text-decoration: line-through;")
-            else:
-                title_label.setStyleSheet("color: #fff;")
-
-            title_layout.addWidget(title_label)
-
-            if subtask.description:
-                desc_label = QLabel(
-                    subtask.description[:50] + "..." if len(subtask.description) > 50 else subtask.description)
-                desc_label.setStyleSheet("color: #888; font-size: 10px;")
-                title_layout.addWidget(desc_label)
-
-            self.subtasks_table.setCellWidget(row, 0, title_widget)
-
-            priority_widget = PriorityIndicatorWidget(subtask.priority)
-            self.subtasks_table.setCellWidget(row, 1, priority_widget)
-
-            status_button = QPushButton("✅ Completed" if subtask.completed else "⏳ Pending")
-            status_button.setCheckable(True)
-            status_button.setChecked(subtask.completed)
-            status_button.setStyleSheet("""
-                QPushButton {
-                    border-radius: 3px;
-                    padding: 5px 10px;
-                    min-width: 100px;
-                }
-                QPushButton:checked {
-                    background-color: #2e7d32;
-                    color: white;
-                }
-                QPushButton:!checked {
-                    background-color: #ff9800;
-                    color: white;
-                }
-            """)
-            status_button.clicked.connect(lambda checked, sid=subtask.id: self.toggle_subtask_status(sid))
-            self.subtasks_table.setCellWidget(row, 2, status_button)
-
-            due_widget = QWidget()
-            due_layout = QHBoxLayout(due_widget)
-            due_layout.setContentsMargins(5, 0, 5, 0)
-            due_layout.setAlignment(Qt.AlignCenter)
-
-            if subtask.due_date:
-                due_label = QLabel(subtask.due_date)
-                try:
-                    due_date = datetime.fromisoformat(subtask.due_date).date()
-                    today = datetime.now().date()
-                    if due_date < today and not subtask.completed:
-                        due_label.setStyleSheet("color: #e74c3c; font-weight: bold;")
-                    elif due_date == today and not subtask.completed:
-                        due_label.setStyleSheet("color: #f39c12; font-weight: bold;")
-                    else:
-                        due_label.setStyleSheet("color: #888;")
-                except:
-                    due_label.setStyleSheet("color: #888;")
-            else:
-                due_label = QLabel("—")
-                due_label.setStyleSheet("color: #666; font-style: italic;")
-
-            due_layout.addWidget(due_label)
-            self.subtasks_table.setCellWidget(row, 3, due_widget)
-
-            labels_widget = QWidget()
-            labels_layout = QHBoxLayout(labels_widget)
-            labels_layout.setContentsMargins(5, 2, 5, 2)
-            labels_layout.setSpacing(3)
-
-            if subtask.labels:
-                for label_id in subtask.labels[:3]:
-                    label = self.manager.get_label(label_id)
-                    if label:
-                        label_widget = LabelWidget(label.name, label.color, label.text_color)
-                        label_widget.setFixedHeight(24)
-                        labels_layout.addWidget(label_widget)
-
-                if len(subtask.labels) > 3:
-                    more_label = QLabel(f"+{len(subtask.labels) - 3}")
-                    more_label.setStyleSheet("""
-                        color: #888;
-                        font-size: 10px;
-                        padding: 2px 4px;
-                        background-color: #3a3a3a;
-                        border-radius: 3px;
-                    """)
-                    labels_layout.addWidget(more_label)
-            else:
-                no_labels = QLabel("—")
-                no_labels.setStyleSheet("color: #666; font-style: italic; font-size: 10px;")
-                labels_layout.addWidget(no_labels)
-
-            labels_layout.addStretch()
-            self.subtasks_table.setCellWidget(row, 4, labels_widget)
-
-            edit_button = QPushButton("✏️ Edit")
-            edit_button.setStyleSheet("""
-                QPushButton {
-                    background-color: #ff9800;
-                    color: white;
-                    border-radius: 3px;
-                    padding: 5px 10px;
-                    min-width: 80px;
-                }
-                QPushButton:hover {
-                    background-color: #e68900;
-                }
-            """)
-            edit_button.clicked.connect(lambda checked, sid=subtask.id: self.edit_subtask(sid))
-            self.subtasks_table.setCellWidget(row, 5, edit_button)
-
-            delete_button = QPushButton("Delete")
-            delete_button.setStyleSheet("""
-                QPushButton {
-                    background-color: #da2a2a;
-                    color: white;
-                    border-radius: 3px;
-                    padding: 5px 10px;
-                    min-width: 80px;
-                }
-                QPushButton:hover {
-                    background-color: #ca1a1a;
-                }
-            """)
-            delete_button.clicked.connect(lambda checked, sid=subtask.id: self.delete_subtask(sid))
-            self.subtasks_table.setCellWidget(row, 6, delete_button)
+        self.subtask_model.set_subtasks(self.manager.get_subtasks_by_task(self.current_task.id))
 
     def add_subtask(self):
         self.on_notify()
@@ -312,9 +197,9 @@ class SubtaskPanelWidget(QWidget):
                 QMessageBox.warning(self, 'Error', 'Subtask title is required')
                 return
 
-            self.manager.create_subtask(**data)
-            self.load_subtasks()
-            self.subtask_updated.emit()
+            subtask = self.manager.create_subtask(**data)
+            self.subtask_model.add_subtask(subtask.id)
+            self.subtask_updated.emit(self.current_task.id)
 
     def toggle_subtask_status(self, subtask_id: str):
         self.on_notify()
@@ -322,8 +207,8 @@ class SubtaskPanelWidget(QWidget):
         if subtask:
             subtask.toggle_complete()
             self.manager.update_subtask(subtask_id, completed=subtask.completed)
-            self.load_subtasks()
-            self.subtask_updated.emit()
+            self.subtask_model.refresh_subtask(subtask_id)
+            self.subtask_updated.emit(self.current_task.id)
 
             main_window = self.get_main_window()
             if main_window and main_window.current_project_id:
@@ -344,8 +229,11 @@ class SubtaskPanelWidget(QWidget):
                 return
 
             self.manager.update_subtask(subtask_id, **data)
-            self.load_subtasks()
-            self.subtask_updated.emit()
+            if subtask.task_id == self.current_task.id:
+                self.subtask_model.refresh_subtask(subtask_id)
+            else:
+                self.subtask_model.remove_subtask(subtask_id)
+            self.subtask_updated.emit(self.current_task.id)
 
     def delete_subtask(self, subtask_id: str):
         self.on_notify()
@@ -362,8 +250,8 @@ class SubtaskPanelWidget(QWidget):
 
         if reply == QMessageBox.Yes:
             self.manager.delete_subtask(subtask_id)
-            self.load_subtasks()
-            self.subtask_updated.emit()
+            self.subtask_model.remove_subtask(subtask_id)
+            self.subtask_updated.emit(self.current_task.id)
 
     def on_click(self):
         if self.sound_manager:
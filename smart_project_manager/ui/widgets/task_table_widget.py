@@ -1,105 +1,139 @@
 # Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+from typing import Optional
+
 from PyQt5.QtWidgets import (
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QHeaderView,
-    QProgressBar,
-    QWidget,
-    QHBoxLayout,
-    QPushButton,
-    QAbstractItemView,
-    QLabel, QVBoxLayout
+    QAbstractItemView
 )
 from PyQt5.QtGui import QColor, QDrag, QFont, QBrush, QPen, QPainter, QPixmap
-from PyQt5.QtCore import Qt, QMimeData, pyqtSignal, QPoint, QRect, QDate
-from datetime import datetime
-
-from smart_project_manager.ui.widgets.priority_widget import PriorityIndicatorWidget
-from smart_project_manager.ui.widgets.label_widget import LabelWidget
+from PyQt5.QtCore import Qt, QMimeData, pyqtSignal, QPoint, QRect
+
+from smart_project_manager.ui.delegates.task_delegates import (
+    ButtonDelegate,
+    DragHandleDelegate,
+    LabelsDelegate,
+    PriorityDelegate,
+    PRIORITY_COLORS,
+    ProgressDelegate,
+    StatusButtonDelegate
+)
+from smart_project_manager.ui.models.task_table_model import TaskTableModel
 
 
-class TaskTableWidget(QTableWidget):
+class TaskTableWidget(QTableView):
     task_dropped = pyqtSignal(int, int)
     task_clicked = pyqtSignal(str)
     task_double_clicked = pyqtSignal(str)
+    status_clicked = pyqtSignal(str)
+    edit_clicked = pyqtSignal(str)
+    delete_clicked = pyqtSignal(str)
 
     def __init__(self, parent=None):
         super().__init__(parent)
+        self.task_model = TaskTableModel(parent=self)
+        self.setModel(self.task_model)
+
         self.setup_selection_behavior()
         self.setup_table()
+        self.setup_delegates()
         self.setFocusPolicy(Qt.NoFocus)
         self.selected_task_id = None
-        self.manager = None
         self.current_project_id = None
 
         self.drag_indicator_rect = None
         self.drag_item_data = None
         self.setMouseTracking(True)
 
-        self.setDragEnabled(True)
+        self.update_drag_enabled(self.horizontalHeader().sortIndicatorSection())
         self.setAcceptDrops(True)
         self.setDragDropMode(QAbstractItemView.InternalMove)
         self.setDefaultDropAction(Qt.MoveAction)
         self.setDragDropOverwriteMode(False)
 
-        self.task_order = []
+        self.selectionModel().selectionChanged.connect(self.save_selection)
+        self.clicked.connect(self.on_cell_clicked)
+        self.doubleClicked.connect(self.on_cell_double_clicked)
 
-        self.itemSelectionChanged.connect(self.save_selection)
-        self.cellClicked.connect(self.on_cell_clicked)
-        self.cellDoubleClicked.connect(self.on_cell_double_clicked)
+    @property
+    def manager(self):
+        return self.task_model.manager
 
-    def on_cell_clicked(self, row, column):
-        if column in [0, 1, 7, 8]:
+    @manager.setter
+    def manager(self, manager):
+        self.task_model.manager = manager
+
+    def on_cell_clicked(self, index):
+        if index.column() in TaskTableModel.BUTTON_COLUMNS:
             return
 
-        item = self.item(row, 2)
-        if item:
-            task_id = item.data(Qt.UserRole)
-            if task_id:
-                self.task_clicked.emit(task_id)
+        task_id = self.task_model.task_id_at(index.row())
+        if task_id:
+            self.task_clicked.emit(task_id)
 
-    def on_cell_double_clicked(self, row, column):
-        if column in [0, 1, 7, 8]:
+    def on_cell_double_clicked(self, index):
+        if index.column() in TaskTableModel.BUTTON_COLUMNS:
             return
 
-        item = self.item(row, 2)
-        if item:
-            task_id = item.data(Qt.UserRole)
-            if task_id:
-                self.task_double_clicked.emit(task_id)
+        task_id = self.task_model.task_id_at(index.row())
+        if task_id:
+            self.task_double_clicked.emit(task_id)
 
-    def save_selection(self):
-        selected = self.selectedItems()
-        if selected:
-            row = selected[0].row()
-            item = self.item(row, 2)
-            if item:
-                self.selected_task_id = item.data(Qt.UserRole)
+    def rowCount(self) -> int:
+        return self.task_model.rowCount()
 
-    def restore_selection(self):
-        if not self.selected_task_id:
-            return
+    def current_row(self) -> int:
+        rows = self.selectionModel().selectedRows()
+        return rows[0].row() if rows else -1
+
+    def current_task_id(self) -> Optional[str]:
+        return self.task_model.task_id_at(self.current_row())
+
+    def task_id_at(self, row: int) -> Optional[str]:
+        return self.task_model.task_id_at(row)
+
+    def row_of(self, task_id: str) -> int:
+        return self.task_model.row_of(task_id)
+
+    def select_task(self, task_id: Optional[str]) -> bool:
+        row = self.task_model.row_of(task_id) if task_id else -1
+        if row >= 0:
+            self.selectRow(row)
+            return True
+        return False
+
+    def set_tasks(self, tasks, changed_ids=None):
+        self.task_model.set_tasks(tasks, changed_ids)
+        if self.isSortingEnabled():
+            header = self.horizontalHeader()
+            self.task_model.sort(header.sortIndicatorSection(), header.sortIndicatorOrder())
+
+    def refresh_task(self, task_id: str):
+        self.task_model.refresh_task(task_id)
 
-        for row in range(self.rowCount()):
-            item = self.item(row, 2)
-            if item and item.data(Qt.UserRole) == self.selected_task_id:
-                self.selectRow(row)
-                break
+    def clear_tasks(self):
+        self.task_model.clear()
+
+    def save_selection(self, *args):
+        task_id = self.current_task_id()
+        if task_id:
+            self.selected_task_id = task_id
+
+    def restore_selection(self):
+        if self.selected_task_id:
+            self.select_task(self.selected_task_id)
 
     def setup_selection_behavior(self):
         self.setSelectionMode(QAbstractItemView.SingleSelection)
         self.setSelectionBehavior(QAbstractItemView.SelectRows)
 
     def setup_table(self):
-        self.setColumnCount(9)
-        self.setHorizontalHeaderLabels(
-            ['', 'Status', 'Title', 'Priority', 'Progress', 'Due Date', 'Labels', '', '']
-        )
-        self.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.setEditTriggers(QAbstractItemView.NoEditTriggers)
         self.setAlternatingRowColors(True)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
 
         self.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 background-color: #2a2a2a;
                 gridline-color: #444;
             }
@@ -113,351 +147,70 @@ class TaskTableWidget(QTableWidget):
                 background-color: #353535;
                 border: 1px solid #444;
             }
-            QTableWidget::item:selected {
+            QTableView::item:selected {
                 background-color: #2a82da;
                 color: white;
             }
-            QTableWidget::item:selected:!active {
+            QTableView::item:selected:!active {
                 background-color: #3a3a3a;
             }
         """)
 
-        self.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeToContents)
-        self.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeToContents)
-        self.horizontalHeader().setSectionResizeMode(2, QHeaderView.Stretch)
-        self.horizontalHeader().setSectionResizeMode(3, QHeaderView.ResizeToContents)
-        self.horizontalHeader().setSectionResizeMode(4, QHeaderView.ResizeToContents)
-        self.horizontalHeader().setSectionResizeMode(5, QHeaderView.ResizeToContents)
-        self.horizontalHeader().setSectionResizeMode(6, QHeaderView.ResizeToContents)
-        self.horizontalHeader().setSectionResizeMode(7, QHeaderView.ResizeToContents)
-        self.horizontalHeader().setSectionResizeMode(8, QHeaderView.ResizeToContents)
-
+        self.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.verticalHeader().setDefaultSectionSize(40)
+
+        header = self.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.Fixed)
+        header.setSectionResizeMode(TaskTableModel.TITLE_COLUMN, QHeaderView.Stretch)
+        header.setSectionResizeMode(TaskTableModel.DUE_COLUMN, QHeaderView.ResizeToContents)
+        header.setSectionResizeMode(TaskTableModel.LABELS_COLUMN, QHeaderView.ResizeToContents)
+        for column, width in ((TaskTableModel.DRAG_COLUMN, 30),
+                              (TaskTableModel.STATUS_COLUMN, 60),
+                              (TaskTableModel.PRIORITY_COLUMN, 90),
+                              (TaskTableModel.PROGRESS_COLUMN, 100),
+                              (TaskTableModel.EDIT_COLUMN, 40),
+                              (TaskTableModel.DELETE_COLUMN, 40)):
+            self.setColumnWidth(column, width)
+
+        header.sortIndicatorChanged.connect(self.update_drag_enabled)
         self.setSortingEnabled(True)
 
-    def create_drag_handle(self):
-        widget = QWidget()
-        layout = QHBoxLayout(widget)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.setAlignment(Qt.AlignCenter)
-
-        handle_container = QWidget()
-        handle_layout = QVBoxLayout(handle_container)
-        handle_layout.setContentsMargins(0, 0, 0, 0)
-        handle_layout.setSpacing(3)
-
-        for _ in range(2):
-            line = QLabel("—")
-            line.setStyleSheet("""
-                QLabel {
-                    color: #888;
-                    font-size: 14px;
-                    font-weight: bold;
-                    padding: 0px;
-                    margin: -3px 0px;
-                }
-            """)
-            line.setFont(QFont("Arial", 14))
-            line.setAlignment(Qt.AlignCenter)
-            handle_layout.addWidget(line)
-
-        layout.addWidget(handle_container)
-
-        widget.setProperty("is_drag_handle", True)
-
-        return widget
-
-    def add_task_row(self, row, task, manager, status_callback, edit_callback, delete_callback):
-        self.insertRow(row)
-        self.setRowHeight(row, 40)
-
-        drag_handle = self.create_drag_handle()
-        self.setCellWidget(row, 0, drag_handle)
-
-        status_button = self._create_status_button(task.completed)
-        status_button.clicked.connect(lambda checked, tid=task.id: status_callback(tid))
-        self.setCellWidget(row, 1, status_button)
-
-        title_item = QTableWidgetItem(task.title)
-        title_item.setData(Qt.UserRole, task.id)
-        title_item.setData(Qt.UserRole + 1, task.priority)
-        if task.description:
-            title_item.setToolTip(f"{task.description}")
-        if task.completed:
-            title_item.setForeground(QColor(100, 100, 100))
-            font = title_item.font()
-            font.setStrikeOut(True)
-            title_item.setFont(font)
-        self.setItem(row, 2, title_item)
-
-        priority_widget = PriorityIndicatorWidget(task.priority)
-        self.setCellWidget(row, 3, priority_widget)
-
-        progress_bar = self._create_progress_bar(manager.get_task_progress(task.id))
-        self.setCellWidget(row, 4, progress_bar)
-
-        due_item = self._create_due_item(task.due_date, task.completed, task.id)
-        self.setItem(row, 5, due_item)
-
-        labels_widget = self._create_labels_widget(task.labels, manager)
-        self.setCellWidget(row, 6, labels_widget)
-
-        edit_button = self._create_edit_button()
-        edit_button.clicked.connect(lambda checked, tid=task.id: edit_callback(tid))
-        self.setCellWidget(row, 7, edit_button)
-
-        delete_button = self._create_delete_button()
-        delete_button.clicked.connect(lambda checked, tid=task.id: delete_callback(tid))
-        self.setCellWidget(row, 8, delete_button)
-
-        self.update_task_order()
-
-    def _create_status_button(self, completed):
-        button = QPushButton("✅" if completed else "⏳")
-        button.setFixedSize(30, 30)
-        if completed:
-            button.setToolTip("Mark as Pending")
-            button.setStyleSheet("""
-                QPushButton {
-                    background-color: transparent;
-                    border: 1px solid #2e7d32;
-                    border-radius: 4px;
-                    font-size: 14px;
-                    color: #2e7d32;
-                }
-                QPushButton:hover {
-                    background-color: rgba(46, 125, 50, 0.1);
-                }
-            """)
-        else:
-            button.setToolTip("Mark as Completed")
-            button.setStyleSheet("""
-                QPushButton {
-                    background-color: transparent;
-                    border: 2px solid #ff9800;
-                    border-radius: 4px;
-                    font-size: 14px;
-                    color: #ff9800;
-                }
-                QPushButton:hover {
-                    background-color: rgba(255, 152, 0, 0.1);
-                }
-            """)
-        return button
-
-    def _create_progress_bar(self, progress):
-        progress_bar = QProgressBar()
-        progress_bar.setValue(int(progress))
-        progress_bar.setTextVisible(True)
-        progress_bar.setFormat(f"{progress:.1f}%")
-        progress_bar.setFixedHeight(20)
-        progress_bar.setStyleSheet("""
-            QProgressBar {
-                border: 1px solid #444;
-                border-radius: 3px;
-                text-align: center;
-                font-size: 10px;
-            }
-            QProgressBar::chunk {
-                background-color: #2a82da;
-                border-radius: 3px;
-            }
-        """)
-        return progress_bar
-
-    def _create_due_item(self, due_date, completed, task_id=None):
-        due_text = due_date if due_date else "No due date"
-        item = QTableWidgetItem(due_text)
-        item.setTextAlignment(Qt.AlignCenter)
-
-        if task_id:
-            item.setData(Qt.UserRole, task_id)
-
-        if due_date:
-            item.setData(Qt.UserRole + 1, due_date)
-
-        if due_date and not completed:
-            try:
-                due_date_obj = None
-
-                try:
-                    due_date_obj = datetime.fromisoformat(due_date).date()
-                except (ValueError, TypeError):
-                    pass
-
-                if not due_date_obj:
-                    try:
-                        qdate = QDate.fromString(due_date, Qt.ISODate)
-                        if qdate.isValid():
-                            due_date_obj = datetime(qdate.year(), qdate.month(), qdate.day()).date()
-                    except:
-                        pass
-
-                if due_date_obj and due_date_obj < datetime.now().date():
-                    item.setForeground(QColor(255, 100, 100))
-            except Exception as e:
-                print(f"Error parsing date {due_date}: {e}")
-
-        return item
-
-    def _create_labels_widget(self, label_ids, manager):
-        widget = QWidget()
-        layout = QHBoxLayout(widget)
-        layout.setContentsMargins(5, 2, 5, 2)
-        layout.setSpacing(5)
-
-        for label_id in label_ids:
-            label = manager.get_label(label_id)
-            if label:
-                label_widget = LabelWidget(label.name, label.color, label.text_color)
-                label_widget.setMinimumHeight(24)
-                label_widget.setMinimumWidth(60)
-                layout.addWidget(label_widget)
-
-        layout.addStretch()
-        return widget
-
-    def _create_edit_button(self):
-        button = QPushButton("✏️")
-        button.setFixedSize(30, 30)
-        button.setToolTip("Edit Task")
-        button.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                border: 1px solid #ff9800;
-                border-radius: 4px;
-                font-size: 14px;
-                color: #ff9800;
-            }
-            QPushButton:hover {
-                background-color: rgba(255, 152, 0, 0.1);
-            }
-        """)
-        return button
-
-    def _create_delete_button(self):
-        button = QPushButton("🗑️")
-        button.setFixedSize(30, 30)
-        button.setToolTip("Delete Task")
-        button.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                border: 1px solid #e74c3c;
-                border-radius: 4px;
-                font-size: 14px;
-                color: #e74c3c;
-            }
-            QPushButton:hover {
-                background-color: rgba(231, 76, 60, 0.1);
-            }
-        """)
-        return button
-
-    def update_task_order(self):
-        self.task_order = []
-        for row in range(self.rowCount()):
-            item = self.item(row, 2)
-            if item:
-                task_id = item.data(Qt.UserRole)
-                if task_id:
-                    self.task_order.append(task_id)
-
-    def get_task_order(self):
-        self.update_task_order()
-        return self.task_order
+    def update_drag_enabled(self, column: int, order=None):
+        # a drop ranks the task between the rows around it, so it only makes sense in the manual order
+        self.setDragEnabled(self.task_model.is_manual_order(column))
+
+    def setup_delegates(self):
+        self.status_delegate = StatusButtonDelegate(self)
+        self.status_delegate.clicked.connect(self.status_clicked)
+        self.edit_delegate = ButtonDelegate("#ff9800", self)
+        self.edit_delegate.clicked.connect(self.edit_clicked)
+        self.delete_delegate = ButtonDelegate("#e74c3c", self)
+        self.delete_delegate.clicked.connect(self.delete_clicked)
+
+        self.setItemDelegateForColumn(TaskTableModel.DRAG_COLUMN, DragHandleDelegate(self))
+        self.setItemDelegateForColumn(TaskTableModel.STATUS_COLUMN, self.status_delegate)
+        self.setItemDelegateForColumn(TaskTableModel.PRIORITY_COLUMN, PriorityDelegate(self))
+        self.setItemDelegateForColumn(TaskTableModel.PROGRESS_COLUMN, ProgressDelegate(self))
+        self.setItemDelegateForColumn(TaskTableModel.LABELS_COLUMN, LabelsDelegate(self))
+        self.setItemDelegateForColumn(TaskTableModel.EDIT_COLUMN, self.edit_delegate)
+        self.setItemDelegateForColumn(TaskTableModel.DELETE_COLUMN, self.delete_delegate)
 
     def _move_row(self, from_row, to_row):
         if from_row == to_row:
             return
 
-        item = self.item(from_row, 2)
-        if not item:
-            return
-        task_id = item.data(Qt.UserRole)
-
-        main_window = self.get_main_window()
-        if not main_window:
-            return
-
         self.setSortingEnabled(False)
-
-        row_items = {}
-        for col in range(self.columnCount()):
-            if col in [0, 1, 3, 4, 6, 7, 8]:
-                row_items[col] = ('widget', None)
-            else:
-                item = self.item(from_row, col)
-                if item:
-                    new_item = QTableWidgetItem(item.text())
-                    if col == 2:
-                        new_item.setData(Qt.UserRole, item.data(Qt.UserRole))
-                        new_item.setData(Qt.UserRole + 1, item.data(Qt.UserRole + 1))
-                        new_item.setToolTip(item.toolTip())
-                        if item.foreground().color() != Qt.black:
-                            new_item.setForeground(item.foreground())
-                        font = item.font()
-                        new_item.setFont(font)
-                    elif col == 5:
-                        new_item.setTextAlignment(item.textAlignment())
-                        if item.foreground().color() != Qt.black:
-                            new_item.setForeground(item.foreground())
-                    row_items[col] = ('item', new_item)
-
-        self.removeRow(from_row)
-
-        if to_row > from_row:
-            insert_pos = to_row
-        else:
-            insert_pos = to_row
-
-        self.insertRow(insert_pos)
-        self.setRowHeight(insert_pos, 40)
-
-        for col, (data_type, value) in row_items.items():
-            if data_type == 'item' and value:
-                self.setItem(insert_pos, col, value)
-
-        if self.current_project_id and task_id:
-            task = main_window.manager.get_task(task_id)
-            if task:
-                drag_handle = self.create_drag_handle()
-                self.setCellWidget(insert_pos, 0, drag_handle)
-
-                status_button = self._create_status_button(task.completed)
-                status_button.clicked.connect(lambda checked, tid=task_id: main_window.toggle_task_status(tid))
-                self.setCellWidget(insert_pos, 1, status_button)
-
-                priority_widget = PriorityIndicatorWidget(task.priority)
-                self.setCellWidget(insert_pos, 3, priority_widget)
-
-                progress = main_window.manager.get_task_progress(task_id)
-                progress_bar = self._create_progress_bar(progress)
-                self.setCellWidget(insert_pos, 4, progress_bar)
-
-                labels_widget = self._create_labels_widget(task.labels, main_window.manager)
-                self.setCellWidget(insert_pos, 6, labels_widget)
-
-                edit_button = self._create_edit_button()
-                edit_button.clicked.connect(lambda checked, tid=task_id: main_window.edit_task(tid))
-                self.setCellWidget(insert_pos, 7, edit_button)
-
-                delete_button = self._create_delete_button()
-                delete_button.clicked.connect(lambda checked, tid=task_id: main_window.delete_task(tid))
-                self.setCellWidget(insert_pos, 8, delete_button)
-
+        self.task_model.move_row(from_row, to_row)
+        self.horizontalHeader().setSortIndicator(-1, Qt.AscendingOrder)
         self.setSortingEnabled(True)
 
     def startDrag(self, supportedActions):
-        selected = self.selectedItems()
-        if not selected:
+        row = self.current_row()
+        task_id = self.task_model.task_id_at(row)
+        if not task_id:
             return
 
-        row = selected[0].row()
-        item = self.item(row, 2)
-        if not item:
-            return
-
-        task_id = item.data(Qt.UserRole)
-        task_title = item.text()
+        task_title = self.task_model.index(row, TaskTableModel.TITLE_COLUMN).data()
 
         self.drag_item_data = {
             'row': row,
@@ -500,12 +253,12 @@ class TaskTableWidget(QTableWidget):
             insert_above = drop_pos.y() < rect.center().y()
 
             y_pos = rect.top() if insert_above else rect.bottom()
-            self.drag_indicator_rect = QRect(rect.left(), y_pos - 2, rect.width(), 4)
+            self.drag_indicator_rect = QRect(rect.left(), y_pos - 2, self.viewport().width(), 4)
         else:
             last_row = self.rowCount() - 1
             if last_row >= 0:
                 rect = self.visualRect(self.model().index(last_row, 0))
-                self.drag_indicator_rect = QRect(rect.left(), rect.bottom() - 2, rect.width(), 4)
+                self.drag_indicator_rect = QRect(rect.left(), rect.bottom() - 2, self.viewport().width(), 4)
             else:
                 self.drag_indicator_rect = QRect(10, 10, self.width() - 20, 4)
 
@@ -535,29 +288,24 @@ class TaskTableWidget(QTableWidget):
             if not insert_above:
                 target_row += 1
 
-        source_row = -1
-        for row in range(self.rowCount()):
-            item = self.item(row, 2)
-            if item and str(item.data(Qt.UserRole)) == task_id:
-                source_row = row
-                break
+        source_row = self.task_model.row_of(task_id)
 
         if source_row >= 0 and source_row != target_row:
             if source_row < target_row:
                 target_row -= 1
 
-            scroll_pos = self.verticalScrollBar().value()
+            if source_row != target_row:
+                scroll_pos = self.verticalScrollBar().value()
 
-            main_window = self.get_main_window()
-            if main_window:
-                self.current_project_id = main_window.current_project_id
+                main_window = self.get_main_window()
+                if main_window:
+                    self.current_project_id = main_window.current_project_id
 
-            self._move_row(source_row, target_row)
-            self.update_task_order()
-            self.task_dropped.emit(source_row, target_row)
+                self._move_row(source_row, target_row)
+                self.task_dropped.emit(source_row, target_row)
 
-            self.verticalScrollBar().setValue(scroll_pos)
-            self.selectRow(target_row)
+                self.verticalScrollBar().setValue(scroll_pos)
+                self.selectRow(target_row)
 
         self.drag_indicator_rect = None
         self.viewport().update()
@@ -592,7 +340,7 @@ class TaskTableWidget(QTableWidget):
             )
 
     def create_drag_preview(self, row):
-        width = self.columnWidth(2) + self.columnWidth(3) + 40
+        width = self.columnWidth(TaskTableModel.TITLE_COLUMN) + self.columnWidth(TaskTableModel.PRIORITY_COLUMN) + 40
         height = 40
 
         pixmap = QPixmap(width, height)
@@ -605,29 +353,21 @@ class TaskTableWidget(QTableWidget):
         painter.setPen(QPen(QColor(255, 255, 255, 100), 1))
         painter.drawRoundedRect(0, 0, width - 1, height - 1, 5, 5)
 
-        title_item = self.item(row, 2)
+        title_index = self.task_model.index(row, TaskTableModel.TITLE_COLUMN)
 
         painter.setPen(Qt.white)
         painter.setFont(QFont("Arial", 10, QFont.Bold))
-        title_text = title_item.text() if title_item else "Task"
+        title_text = title_index.data() or "Task"
         if len(title_text) > 30:
             title_text = title_text[:27] + "..."
         painter.drawText(10, 5, width - 20, 30, Qt.AlignLeft | Qt.AlignVCenter, title_text)
 
-        if title_item:
-            priority = title_item.data(Qt.UserRole + 1)
-            if priority == 'high':
-                priority_color = QColor(255, 100, 100)
-            elif priority == 'medium':
-                priority_color = QColor(255, 200, 100)
-            elif priority == 'low':
-                priority_color = QColor(100, 200, 100)
-            else:
-                priority_color = QColor(150, 150, 150)
+        priority = title_index.data(TaskTableModel.PriorityRole)
+        priority_color = QColor(PRIORITY_COLORS[priority]) if priority in PRIORITY_COLORS else QColor(150, 150, 150)
 
-            painter.setBrush(QBrush(priority_color))
-            painter.setPen(Qt.NoPen)
-            painter.drawEllipse(width - 30, 12, 16, 16)
+        painter.setBrush(QBrush(priority_color))
+        painter.setPen(Qt.NoPen)
+        painter.drawEllipse(width - 30, 12, 16, 16)
 
         painter.end()
         return pixmap
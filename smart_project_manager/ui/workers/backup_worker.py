@@ -0,0 +1,20 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+from PyQt5.QtCore import QObject, pyqtSignal, pyqtSlot
+
+
+class BackupCleanupWorker(QObject):
+    finished = pyqtSignal(object)
+
+    def __init__(self, manager):
+        super().__init__()
+        self.manager = manager
+
+    @pyqtSlot()
+    def cleanup(self):
+        try:
+            stats = self.manager.cleanup_old_backups()
+        except Exception as e:
+            print(f"Backup cleanup error: {e}")
+            stats = None
+
+        self.finished.emit(stats)
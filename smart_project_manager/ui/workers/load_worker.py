@@ -0,0 +1,23 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+from PyQt5.QtCore import QObject, pyqtSignal, pyqtSlot
+
+
+class LoadWorker(QObject):
+    progress = pyqtSignal(int, int)
+    finished = pyqtSignal()
+    failed = pyqtSignal(str)
+
+    def __init__(self, manager):
+        super().__init__()
+        self.manager = manager
+
+    @pyqtSlot()
+    def load(self):
+        try:
+            # the window stays responsive meanwhile; it does not touch the manager until finished
+            self.manager.load_data(progress=self.progress.emit)
+        except Exception as e:
+            self.failed.emit(str(e))
+            return
+
+        self.finished.emit()
@@ -0,0 +1,22 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+from PyQt5.QtCore import QObject, pyqtSignal, pyqtSlot
+
+
+class SearchWorker(QObject):
+    finished = pyqtSignal(int, str, object)
+
+    def __init__(self, manager):
+        super().__init__()
+        self.manager = manager
+        self.latest_generation = 0
+
+    @pyqtSlot(int, str, str)
+    def search(self, generation: int, project_id: str, text: str):
+        # requests queue up while typing; anything older than the latest one is dropped unseen
+        if generation != self.latest_generation:
+            return
+
+        task_ids = self.manager.search_tasks(project_id, text)
+
+        if generation == self.latest_generation:
+            self.finished.emit(generation, project_id, task_ids)
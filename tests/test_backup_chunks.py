@@ -0,0 +1,80 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import os
+from datetime import datetime, timedelta
+
+from smart_project_manager.core.managers.project_manager import ProjectManager
+from smart_project_manager.core.services.import_export_service import ImportExportService
+
+
+def _digests(backup_path):
+    return {chunk['digest'] for chunk in ImportExportService._read_manifest({'path': backup_path})['chunks']}
+
+
+def _stored_digests(backup_dir):
+    return {name.split('.', 1)[0] for name in os.listdir(os.path.join(backup_dir, ImportExportService.CHUNK_DIR))}
+
+
+def _age(backup_path, days):
+    # backups are dated by name, and a manager makes at most one per second
+    name = (datetime.now() - timedelta(days=days)).strftime(ImportExportService.BACKUP_NAME_FORMAT)
+    aged_path = os.path.join(os.path.dirname(backup_path), name + ImportExportService.MANIFEST_EXTENSION)
+    os.replace(backup_path, aged_path)
+    return aged_path
+
+
+def test_backup_cleanup_and_restore_round_trip(tmp_path):
+    manager = ProjectManager(data_dir=str(tmp_path))
+    backup_dir = os.path.join(manager.data_dir, 'backups')
+    edited = manager.create_project("Edited")
+    untouched = manager.create_project("Untouched")
+    task = manager.create_task("Before", edited.id)
+    kept_task = manager.create_task("Kept", untouched.id)
+    manager.create_subtask("Step", kept_task.id, untouched.id)
+
+    first = _age(manager.create_backup(), 2)
+    manager.update_task(task.id, title="After")
+    recent = _age(manager.create_backup(), 1)
+
+    # the untouched project's chunks are shared, so the second backup only stored what changed
+    shared = _digests(first) & _digests(recent)
+    assert shared and _digests(first) - shared and _digests(recent) - shared
+    assert _stored_digests(backup_dir) == _digests(first) | _digests(recent)
+
+    expired = _age(first, 40)
+    manager.update_task(task.id, title="Latest")
+    latest = manager.create_backup()
+
+    # creating a backup applies retention: the expired manifest goes, and only the chunks nothing else uses
+    assert not os.path.exists(expired)
+    assert _stored_digests(backup_dir) == _digests(recent) | _digests(latest)
+    assert shared <= _stored_digests(backup_dir)
+
+    manager.delete_project(untouched.id)
+    manager.update_task(task.id, title="Lost")
+    result = manager.restore_backup(recent)
+
+    assert result['success'] and result['imported_items']['subtasks'] == 1
+    assert manager.get_task(task.id).title == "After"
+    assert [task.title for task in manager.get_tasks_by_project(untouched.id)] == ["Kept"]
+    manager.close()
+
+    manager = ProjectManager(data_dir=str(tmp_path))
+    assert manager.get_task(task.id).title == "After"
+    manager.close()
+
+
+def test_restore_reports_missing_chunks_without_touching_the_data(tmp_path):
+    manager = ProjectManager(data_dir=str(tmp_path))
+    project = manager.create_project("Project")
+    manager.create_task("Task", project.id)
+    backup = manager.create_backup()
+
+    chunk_dir = os.path.join(os.path.dirname(backup), ImportExportService.CHUNK_DIR)
+    os.remove(os.path.join(chunk_dir, sorted(os.listdir(chunk_dir))[0]))
+    manager.update_task(manager.get_tasks_by_project(project.id)[0].id, title="Edited")
+
+    result = manager.restore_backup(backup)
+
+    assert not result['success'] and "missing" in result['error']
+    assert [task.title for task in manager.get_tasks_by_project(project.id)] == ["Edited"]
+    manager.close()
@@ -0,0 +1,29 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+from datetime import datetime, timedelta
+
+from smart_project_manager.core.managers.project_manager import ProjectManager
+from smart_project_manager.core.services.import_export_service import ImportExportService
+
+
+def _daily_backups(now: datetime, days: int):
+    return [{'path': f"backup_{day}", 'date': now - timedelta(days=day, hours=1)} for day in range(days)]
+
+
+def test_default_retention_keeps_thirty_days():
+    now = datetime(2026, 6, 1, 12)
+    backups = _daily_backups(now, 60)
+
+    keep = ImportExportService.select_backups_to_keep(backups, now, **ProjectManager.BACKUP_RETENTION)
+
+    assert keep == {f"backup_{day}" for day in range(30)}
+
+
+def test_retention_can_also_keep_older_daily_and_weekly_backups():
+    now = datetime(2026, 6, 1, 12)
+    backups = _daily_backups(now, 60)
+
+    keep = ImportExportService.select_backups_to_keep(backups, now, days_to_keep=0, keep_last=3,
+                                                      keep_daily=5, keep_weekly=4)
+
+    # 1 June 2026 is a Monday: the newest backup of each of the last four weeks is 0, 1, 8 and 15 days old
+    assert keep == {f"backup_{day}" for day in (0, 1, 2, 3, 4, 8, 15)}
@@ -0,0 +1,40 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import pytest
+
+from smart_project_manager.core.managers.project_manager import ProjectManager
+
+
+def test_failed_batch_does_not_persist_edits_to_pending_items(tmp_path):
+    manager = ProjectManager(data_dir=str(tmp_path), flush_interval=60.0)
+    project = manager.create_project("ROLLED BACK")
+    assert manager.dirty
+
+    with pytest.raises(RuntimeError):
+        with manager.batch():
+            manager.update_project(project.id, name="renamed")
+            manager.create_project("created in batch")
+            raise RuntimeError("abort")
+
+    assert manager.get_project(project.id).name == "ROLLED BACK"
+    manager.close()
+
+    manager = ProjectManager(data_dir=str(tmp_path))
+    assert [p.name for p in manager.get_all_projects()] == ["ROLLED BACK"]
+    manager.close()
+
+
+def test_failed_batch_restores_items_already_on_disk(tmp_path):
+    manager = ProjectManager(data_dir=str(tmp_path))
+    project = manager.create_project("Project")
+    task = manager.create_task("Task", project.id)
+
+    with pytest.raises(RuntimeError):
+        with manager.batch():
+            manager.update_task(task.id, title="edited")
+            manager.delete_project(project.id)
+            raise RuntimeError("abort")
+    manager.close()
+
+    manager = ProjectManager(data_dir=str(tmp_path))
+    assert [t.title for t in manager.get_tasks_by_project(project.id)] == ["Task"]
+    manager.close()
@@ -0,0 +1,43 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+from smart_project_manager.core.models.label import Label
+from smart_project_manager.core.storage.coalescing_writer import CoalescingWriter
+from smart_project_manager.core.storage.json_storage import JsonStorage
+
+
+class FailingStorage(JsonStorage):
+
+    failing = True
+
+    def write(self, records):
+        if self.failing:
+            raise IOError("disk full")
+        super().write(records)
+
+
+def test_flush_writes_the_item_as_it_was_submitted(tmp_path):
+    storage = JsonStorage(str(tmp_path / "projects.json"), str(tmp_path / "projects.journal"))
+    writer = CoalescingWriter(storage, storage.load, interval=60.0)
+    label = Label(name="Before")
+
+    writer.submit([('labels', label.id, label)])
+    label.name = "edited after submit"
+    writer.flush()
+
+    assert storage.load()['labels'][label.id]['name'] == "Before"
+
+
+def test_failed_background_flush_is_reported_and_retried(tmp_path, capsys):
+    storage = FailingStorage(str(tmp_path / "projects.json"), str(tmp_path / "projects.journal"))
+    writer = CoalescingWriter(storage, storage.load, interval=60.0)
+    label = Label(name="Queued")
+    writer.submit([('labels', label.id, label)])
+
+    writer._flush_later()
+
+    assert "disk full" in capsys.readouterr().out
+    assert writer.dirty
+
+    storage.failing = False
+    writer.flush()
+    assert not writer.dirty
+    assert storage.load()['labels'][label.id]['name'] == "Queued"
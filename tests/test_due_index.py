@@ -0,0 +1,88 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import random
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from smart_project_manager.core.managers.project_manager import ProjectManager
+from smart_project_manager.core.services.due_index import DueIndex
+
+
+TODAY = date(2026, 3, 15)
+
+
+def _brute_force(dates, scope, start, end):
+    return sorted(
+        (due, item_id) for item_id, (item_scope, due) in dates.items()
+        if item_scope == scope and (start is None or due >= start) and (end is None or due < end)
+    )
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_between_is_half_open_and_matches_a_scan(seed):
+    rng = random.Random(seed)
+    index = DueIndex()
+    dates = {}
+
+    for _ in range(300):
+        item_id = f"i{rng.randrange(80)}"
+        scope = rng.choice(["p1", "p2"])
+        if rng.random() < 0.15:
+            index.remove(item_id)
+            dates.pop(item_id, None)
+        elif rng.random() < 0.1:
+            index.add(item_id, scope, None)
+            dates.pop(item_id, None)
+        else:
+            due = TODAY + timedelta(days=rng.randint(-10, 10))
+            index.add(item_id, scope, due.isoformat())
+            dates[item_id] = (scope, due)
+
+    bounds = [None] + [TODAY + timedelta(days=offset) for offset in (-11, -3, 0, 1, 4, 11)]
+    for scope in ("p1", "p2", "p3"):
+        for start in bounds:
+            for end in bounds:
+                expected = [item_id for _, item_id in _brute_force(dates, scope, start, end)]
+                assert index.between(scope, start, end) == expected
+
+
+def test_status_follows_the_day_it_is_asked_for():
+    index = DueIndex()
+    index.add("late", "p1", "2026-03-14")
+    index.add("now", "p1", "2026-03-15T18:30:00")
+    index.add("soon", "p1", "2026-03-16")
+    index.add("never", "p1", "not a date")
+
+    assert [index.status(item_id, TODAY) for item_id in ("late", "now", "soon", "never")] == \
+        [DueIndex.OVERDUE, DueIndex.TODAY, DueIndex.UPCOMING, None]
+    assert index.status("now", TODAY + timedelta(days=1)) == DueIndex.OVERDUE
+
+    index.add("soon", "p1", None)
+    assert index.status("soon", TODAY) is None
+    assert index.between("p1") == ["late", "now"]
+
+
+def test_parse_accepts_dates_datetimes_and_iso_strings():
+    assert DueIndex.parse(datetime(2026, 3, 15, 9)) == TODAY
+    assert DueIndex.parse(TODAY) == TODAY
+    assert DueIndex.parse("2026-03-15") == TODAY
+    assert DueIndex.parse("") is None and DueIndex.parse("15/03/2026") is None
+
+
+def test_manager_due_queries_use_the_right_bounds(tmp_path):
+    manager = ProjectManager(data_dir=str(tmp_path))
+    project = manager.create_project("Project")
+    today = date.today()
+    for offset in (-2, -1, 0, 3, 7, 8):
+        manager.create_task(f"{offset:+d}", project.id, due_date=(today + timedelta(days=offset)).isoformat())
+    done = manager.create_task("done", project.id, due_date=(today - timedelta(days=1)).isoformat())
+    manager.update_task(done.id, completed=True)
+
+    assert [task.title for task in manager.get_overdue_tasks(project.id)] == ["-2", "-1"]
+    assert [task.title for task in manager.get_tasks_due_today(project.id)] == ["+0"]
+    assert [task.title for task in manager.get_tasks_due_within(project.id, 7)] == ["+0", "+3", "+7"]
+
+    manager.update_task(done.id, due_date=None)
+    manager.update_task(done.id, completed=False)
+    assert [task.title for task in manager.get_overdue_tasks(project.id)] == ["-2", "-1"]
+    manager.close()
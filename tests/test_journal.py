@@ -0,0 +1,58 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import os
+
+from smart_project_manager.core.managers.project_manager import ProjectManager
+from smart_project_manager.core.services.journal_service import JournalService
+from smart_project_manager.core.storage.storage_backend import StorageBackend
+
+
+def _truncate_last_line(path: str):
+    with open(path, 'rb') as f:
+        raw = f.read()
+    with open(path, 'wb') as f:
+        f.write(raw[:-10])
+
+
+def test_append_after_torn_line_is_replayed(tmp_path):
+    journal = JournalService(str(tmp_path / "projects.journal"))
+    journal.append([StorageBackend.put_record('labels', {'id': 'a'}),
+                    StorageBackend.put_record('labels', {'id': 'b'})])
+    _truncate_last_line(journal.journal_file)
+
+    data = StorageBackend.empty_data()
+    assert journal.replay(data) == 1
+    journal.append([StorageBackend.put_record('labels', {'id': 'c'})])
+
+    data = StorageBackend.empty_data()
+    assert journal.replay(data) == 2
+    assert set(data['labels']) == {'a', 'c'}
+
+
+def test_record_without_newline_is_kept(tmp_path):
+    journal = JournalService(str(tmp_path / "projects.journal"))
+    journal.append([StorageBackend.put_record('labels', {'id': 'a'})])
+    with open(journal.journal_file, 'rb+') as f:
+        f.truncate(os.path.getsize(journal.journal_file) - 1)
+
+    assert journal.replay(StorageBackend.empty_data()) == 1
+    journal.append([StorageBackend.put_record('labels', {'id': 'b'})])
+
+    data = StorageBackend.empty_data()
+    assert journal.replay(data) == 2
+    assert set(data['labels']) == {'a', 'b'}
+
+
+def test_manager_keeps_changes_made_after_a_torn_journal(tmp_path):
+    manager = ProjectManager(data_dir=str(tmp_path))
+    manager.create_project("Lost in the crash")
+    manager.close()
+    _truncate_last_line(manager.storage.journal.journal_file)
+
+    manager = ProjectManager(data_dir=str(tmp_path))
+    manager.create_project("First")
+    manager.create_project("Second")
+    manager.close()
+
+    manager = ProjectManager(data_dir=str(tmp_path))
+    assert sorted(project.name for project in manager.get_all_projects()) == ["First", "Second"]
+    manager.close()
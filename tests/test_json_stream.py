@@ -0,0 +1,60 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import os
+
+import pytest
+
+from smart_project_manager.core import utils
+from smart_project_manager.core.utils import dumps_json, loads_json, write_json_stream
+
+
+DATA = {
+    'export_date': "2026-06-01T12:00:00",
+    'labels': {},
+    'projects': {"p1": {'name': "Ünïcode \"quoted\"", 'tasks': ["t1", "t2"], 'meta': {'depth': [1, {'x': None}]}}},
+    'tasks': {"t1": {'title': "First", 'labels': []}, "t2": {'title': "Second\nline", 'priority': 2}},
+}
+
+
+@pytest.fixture(params=["orjson", "msgspec", "json"])
+def encoder(request, monkeypatch):
+    if request.param != "orjson":
+        monkeypatch.setattr(utils, 'orjson', None)
+    if request.param == "json":
+        monkeypatch.setattr(utils, 'msgspec', None)
+    return request.param
+
+
+def _sections():
+    return [(section, iter(sorted(DATA[section].items()))) for section in ("labels", "projects", "tasks")]
+
+
+@pytest.mark.parametrize('pretty', [False, True])
+def test_stream_decodes_to_the_same_data(tmp_path, encoder, pretty):
+    path = str(tmp_path / "out" / "export.json")
+    header = {'export_date': DATA['export_date']}
+
+    write_json_stream(path, header, _sections(), pretty=pretty)
+
+    with open(path, 'rb') as f:
+        raw = f.read()
+    assert loads_json(raw) == DATA
+    if pretty:
+        # with keys already in sorted order the stream is byte-for-byte what one dumps call writes
+        assert raw == dumps_json(DATA, pretty=True)
+    else:
+        assert b'\n' not in raw
+
+
+def test_a_failing_section_leaves_no_file_behind(tmp_path):
+    path = tmp_path / "export.json"
+    path.write_bytes(b'{"old": true}')
+
+    def broken():
+        yield "t1", {'title': "First"}
+        raise RuntimeError("source went away")
+
+    with pytest.raises(RuntimeError):
+        write_json_stream(str(path), {'version': "1.0"}, [("tasks", broken())])
+
+    assert path.read_bytes() == b'{"old": true}'
+    assert os.listdir(tmp_path) == ["export.json"]
@@ -0,0 +1,89 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import random
+
+import pytest
+
+from smart_project_manager.core.managers.project_manager import ProjectManager
+
+
+def _assert_index_matches_scan(manager, labels):
+    for label_id in labels:
+        assert set(manager.get_task_ids_by_label(label_id)) == \
+            {task.id for task in manager.tasks.values() if label_id in task.labels}
+        assert set(manager.get_subtask_ids_by_label(label_id)) == \
+            {subtask.id for subtask in manager.subtasks.values() if label_id in subtask.labels}
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_label_index_matches_a_scan(tmp_path, seed):
+    rng = random.Random(seed)
+    manager = ProjectManager(data_dir=str(tmp_path))
+    project = manager.create_project("Project")
+    labels = [manager.create_label(f"label {index}").id for index in range(5)]
+
+    for _ in range(200):
+        action = rng.random()
+        if action < 0.2 or not manager.tasks:
+            manager.create_task("Task", project.id, labels=rng.sample(labels, rng.randint(0, 3)))
+        elif action < 0.3:
+            task_id = rng.choice(list(manager.tasks))
+            manager.create_subtask("Subtask", task_id, project.id, labels=rng.sample(labels, rng.randint(0, 2)))
+        elif action < 0.45:
+            manager.add_label_to_task(rng.choice(list(manager.tasks)), rng.choice(labels))
+        elif action < 0.6:
+            manager.remove_label_from_task(rng.choice(list(manager.tasks)), rng.choice(labels))
+        elif action < 0.7 and manager.subtasks:
+            subtask_id = rng.choice(list(manager.subtasks))
+            if rng.random() < 0.5:
+                manager.add_label_to_subtask(subtask_id, rng.choice(labels))
+            else:
+                manager.update_subtask(subtask_id, labels=rng.sample(labels, rng.randint(0, 2)))
+        elif action < 0.85:
+            manager.update_task(rng.choice(list(manager.tasks)), labels=rng.sample(labels, rng.randint(0, 3)))
+        elif action < 0.92:
+            manager.delete_task(rng.choice(list(manager.tasks)))
+        elif manager.subtasks:
+            manager.delete_subtask(rng.choice(list(manager.subtasks)))
+
+    _assert_index_matches_scan(manager, labels)
+    manager.close()
+
+    manager = ProjectManager(data_dir=str(tmp_path))
+    _assert_index_matches_scan(manager, labels)
+    manager.close()
+
+
+def test_labels_keep_their_order_and_ignore_duplicates(tmp_path):
+    manager = ProjectManager(data_dir=str(tmp_path))
+    project = manager.create_project("Project")
+    red, green, blue = (manager.create_label(name).id for name in ("red", "green", "blue"))
+
+    task = manager.create_task("Task", project.id, labels=[blue, red, "missing"])
+    manager.add_label_to_task(task.id, green)
+    manager.add_label_to_task(task.id, blue)
+    assert list(task.labels) == [blue, red, green]
+
+    manager.update_task(task.id, labels=[green, blue, green])
+    assert list(task.labels) == [green, blue]
+    assert list(manager.get_task_ids_by_label(red)) == []
+    manager.close()
+
+    manager = ProjectManager(data_dir=str(tmp_path))
+    assert list(manager.get_task(task.id).labels) == [green, blue]
+    manager.close()
+
+
+def test_delete_label_strips_it_from_tagged_items_only(tmp_path):
+    manager = ProjectManager(data_dir=str(tmp_path))
+    project = manager.create_project("Project")
+    red, green = (manager.create_label(name).id for name in ("red", "green"))
+    tagged = manager.create_task("Tagged", project.id, labels=[red, green])
+    plain = manager.create_task("Plain", project.id, labels=[green])
+    subtask = manager.create_subtask("Subtask", plain.id, project.id, labels=[red])
+
+    manager.delete_label(red)
+
+    assert list(tagged.labels) == [green] and list(subtask.labels) == []
+    assert manager.get_tasks_by_label(red) == [] and manager.get_subtasks_by_label(red) == []
+    assert manager.get_tasks_by_label(green) == [tagged, plain]
+    manager.close()
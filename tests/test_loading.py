@@ -0,0 +1,36 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import os
+import threading
+
+from smart_project_manager.core.managers.project_manager import ProjectManager
+from smart_project_manager.core.storage.sharded_storage import ShardedStorage
+
+
+def test_deferred_manager_migrates_on_the_loading_thread(tmp_path, monkeypatch):
+    manager = ProjectManager(data_dir=str(tmp_path))
+    project = manager.create_project("Project")
+    manager.create_task("Task", project.id)
+    manager.close()
+
+    migrated_on = []
+    migrate = ShardedStorage._migrate_from_json
+    monkeypatch.setattr(ShardedStorage, '_migrate_from_json',
+                        lambda storage: migrated_on.append(threading.current_thread()) or migrate(storage))
+
+    manager = ProjectManager(data_dir=str(tmp_path), storage="sharded", autoload=False)
+    assert not migrated_on
+    assert not os.path.exists(tmp_path / "shards")
+
+    loader = threading.Thread(target=manager.load_data)
+    loader.start()
+    loader.join()
+
+    assert migrated_on == [loader]
+    assert [task.title for task in manager.get_tasks_by_project(project.id)] == ["Task"]
+    manager.close()
+
+
+def test_closing_an_unloaded_manager_does_not_open_the_store(tmp_path):
+    manager = ProjectManager(data_dir=str(tmp_path / "data"), autoload=False)
+    manager.close()
+    assert not os.path.exists(tmp_path / "data")
@@ -0,0 +1,68 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import random
+
+import pytest
+
+from smart_project_manager.core.managers.project_manager import ProjectManager
+
+
+def _assert_indexes_match_a_scan(manager):
+    for project_id, project in manager.projects.items():
+        expected = {task.id for task in manager.tasks.values() if task.project_id == project_id}
+        assert {task.id for task in manager.get_tasks_by_project(project_id)} == expected
+        assert set(project.tasks) == expected
+    for task_id, task in manager.tasks.items():
+        expected = {subtask.id for subtask in manager.subtasks.values() if subtask.task_id == task_id}
+        assert {subtask.id for subtask in manager.get_subtasks_by_task(task_id)} == expected
+        assert set(task.subtasks) == expected
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_parent_indexes_follow_moves_and_deletes(tmp_path, seed):
+    rng = random.Random(seed)
+    manager = ProjectManager(data_dir=str(tmp_path))
+    for index in range(3):
+        manager.create_project(f"Project {index}")
+
+    for _ in range(200):
+        action = rng.random()
+        if action < 0.25 or not manager.tasks:
+            manager.create_task("Task", rng.choice(list(manager.projects)))
+        elif action < 0.45:
+            task = manager.get_task(rng.choice(list(manager.tasks)))
+            manager.create_subtask("Subtask", task.id, task.project_id)
+        elif action < 0.6:
+            manager.update_task(rng.choice(list(manager.tasks)), project_id=rng.choice(list(manager.projects)))
+        elif action < 0.75 and manager.subtasks:
+            task = manager.get_task(rng.choice(list(manager.tasks)))
+            manager.update_subtask(rng.choice(list(manager.subtasks)), task_id=task.id)
+        elif action < 0.85:
+            manager.delete_task(rng.choice(list(manager.tasks)))
+        elif action < 0.95 and manager.subtasks:
+            manager.delete_subtask(rng.choice(list(manager.subtasks)))
+        elif len(manager.projects) > 1:
+            manager.delete_project(rng.choice(list(manager.projects)))
+            manager.create_project("Replacement")
+
+    _assert_indexes_match_a_scan(manager)
+    manager.close()
+
+    manager = ProjectManager(data_dir=str(tmp_path))
+    _assert_indexes_match_a_scan(manager)
+    manager.close()
+
+
+def test_delete_project_removes_its_tasks_and_subtasks(tmp_path):
+    manager = ProjectManager(data_dir=str(tmp_path))
+    doomed = manager.create_project("Doomed")
+    kept = manager.create_project("Kept")
+    task = manager.create_task("Task", doomed.id)
+    manager.create_subtask("Subtask", task.id, doomed.id)
+    other = manager.create_task("Other", kept.id)
+
+    manager.delete_project(doomed.id)
+
+    assert manager.get_tasks_by_project(doomed.id) == []
+    assert manager.get_subtasks_by_task(task.id) == []
+    assert list(manager.tasks) == [other.id] and manager.subtasks == {}
+    manager.close()
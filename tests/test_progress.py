@@ -0,0 +1,56 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import random
+
+import pytest
+
+from smart_project_manager.core.managers.project_manager import ProjectManager
+
+
+def _brute_force_counts(manager: ProjectManager, project_id: str):
+    tasks = [task for task in manager.tasks.values() if task.project_id == project_id]
+    task_ids = {task.id for task in tasks}
+    subtasks = [subtask for subtask in manager.subtasks.values() if subtask.task_id in task_ids]
+    return {
+        'tasks': len(tasks),
+        'completed_tasks': sum(1 for task in tasks if task.completed),
+        'subtasks': len(subtasks),
+        'completed_subtasks': sum(1 for subtask in subtasks if subtask.completed)
+    }
+
+
+@pytest.mark.parametrize('seed', range(10))
+def test_counters_survive_random_mutations(tmp_path, seed):
+    rng = random.Random(seed)
+    manager = ProjectManager(data_dir=str(tmp_path))
+    projects = [manager.create_project(f"P{index}").id for index in range(3)]
+
+    for step in range(300):
+        tasks = list(manager.tasks)
+        subtasks = list(manager.subtasks)
+        action = rng.randrange(8)
+        if action == 0 or not tasks:
+            project_id = rng.choice(projects)
+            manager.create_task(f"T{step}", project_id)
+        elif action == 1:
+            task = manager.get_task(rng.choice(tasks))
+            manager.create_subtask(f"S{step}", task.id, task.project_id)
+        elif action == 2 and subtasks:
+            subtask = manager.get_subtask(rng.choice(subtasks))
+            manager.update_subtask(subtask.id, completed=not subtask.completed)
+        elif action == 3 and subtasks:
+            manager.update_subtask(rng.choice(subtasks), task_id=rng.choice(tasks))
+        elif action == 4:
+            manager.update_task(rng.choice(tasks), project_id=rng.choice(projects))
+        elif action == 5:
+            task = manager.get_task(rng.choice(tasks))
+            manager.update_task(task.id, completed=not task.completed)
+        elif action == 6 and subtasks:
+            manager.delete_subtask(rng.choice(subtasks))
+        elif action == 7 and rng.random() < 0.3:
+            manager.delete_task(rng.choice(tasks))
+
+        assert manager.verify_progress(), f"step {step}"
+
+    for project_id in projects:
+        assert manager.get_project_counts(project_id) == _brute_force_counts(manager, project_id)
+    manager.close()
@@ -0,0 +1,107 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import random
+from datetime import date, timedelta
+
+import pytest
+
+from smart_project_manager.core.managers.project_manager import ProjectManager
+from smart_project_manager.core.services.search_index import SearchIndex
+
+
+WORDS = ["release", "Login", "bug", "docs", "refactor", "api"]
+START = date(2026, 1, 1)
+
+
+@pytest.fixture(scope="module")
+def store(tmp_path_factory):
+    rng = random.Random(7)
+    manager = ProjectManager(data_dir=str(tmp_path_factory.mktemp("query")))
+    labels = [manager.create_label(name).id for name in ("red", "green", "blue")]
+    projects = [manager.create_project(name).id for name in ("One", "Two")]
+
+    for _ in range(80):
+        due = START + timedelta(days=rng.randrange(30)) if rng.random() < 0.7 else None
+        task = manager.create_task(
+            " ".join(rng.choices(WORDS, k=2)), rng.choice(projects), priority=rng.randint(1, 3),
+            description=rng.choice(WORDS) if rng.random() < 0.3 else None,
+            due_date=due.isoformat() if due else None, labels=rng.sample(labels, rng.randint(0, 2))
+        )
+        if rng.random() < 0.4:
+            manager.update_task(task.id, completed=True)
+        for _ in range(rng.randint(0, 2)):
+            manager.create_subtask(f"{task.title} step", task.id, task.project_id,
+                                   priority=rng.randint(1, 3), labels=rng.sample(labels, rng.randint(0, 1)))
+
+    yield manager, projects, labels
+    manager.close()
+
+
+def _matches(item, project=None, priorities=None, labels_all=None, labels_any=None, due_before=None,
+             due_after=None, completed=None, text=None, ids=None):
+    due = item.due_date[:10] if item.due_date else None
+    return (
+        (project is None or item.project_id == project)
+        and (priorities is None or item.priority in priorities)
+        and (labels_all is None or all(label_id in item.labels for label_id in labels_all))
+        and (labels_any is None or any(label_id in item.labels for label_id in labels_any))
+        and (due_before is None or (due is not None and due < str(due_before)))
+        and (due_after is None or (due is not None and due > str(due_after)))
+        and (completed is None or item.completed == completed)
+        and (not text or text.casefold() in SearchIndex.normalize(item.title, item.description))
+        and (ids is None or item.id in ids)
+    )
+
+
+def _random_filters(rng, projects, labels, manager):
+    filters = {}
+    if rng.random() < 0.6:
+        filters['project'] = rng.choice(projects)
+    if rng.random() < 0.4:
+        filters['priorities'] = rng.sample([1, 2, 3], rng.randint(1, 2))
+    if rng.random() < 0.3:
+        filters['labels_all'] = rng.sample(labels, rng.randint(1, 2))
+    if rng.random() < 0.3:
+        filters['labels_any'] = rng.sample(labels, rng.randint(1, 2))
+    if rng.random() < 0.3:
+        filters['due_before'] = START + timedelta(days=rng.randrange(30))
+    if rng.random() < 0.3:
+        filters['due_after'] = (START + timedelta(days=rng.randrange(30))).isoformat()
+    if rng.random() < 0.4:
+        filters['completed'] = rng.random() < 0.5
+    if rng.random() < 0.3:
+        filters['text'] = rng.choice(WORDS + ["log", "x"])[:rng.randint(1, 6)]
+    if rng.random() < 0.2:
+        filters['ids'] = set(rng.sample(list(manager.tasks), 15))
+    return filters
+
+
+@pytest.mark.parametrize('seed', range(200))
+def test_query_matches_a_brute_force_filter(store, seed):
+    manager, projects, labels = store
+    rng = random.Random(seed)
+    filters = _random_filters(rng, projects, labels, manager)
+
+    expected = [task for task in manager.tasks.values() if _matches(task, **filters)]
+    assert list(manager.query(**filters)) == expected
+
+    order_by = rng.choice(list(ProjectManager.QUERY_ORDERS))
+    ordered = list(manager.query(order_by=order_by, **filters))
+    key = ProjectManager.QUERY_ORDERS[order_by]
+    assert sorted(ordered, key=key) == ordered
+    assert {task.id for task in ordered} == {task.id for task in expected}
+
+
+@pytest.mark.parametrize('seed', range(50))
+def test_query_subtasks_matches_a_brute_force_filter(store, seed):
+    manager, projects, labels = store
+    rng = random.Random(seed)
+    filters = _random_filters(rng, projects, labels, manager)
+    filters.pop('due_before', None)
+    filters.pop('due_after', None)
+    if 'ids' in filters:
+        filters['ids'] = set(rng.sample(list(manager.subtasks), 15))
+    task = rng.choice(list(manager.tasks)) if rng.random() < 0.3 else None
+
+    expected = [subtask for subtask in manager.subtasks.values()
+                if (task is None or subtask.task_id == task) and _matches(subtask, **filters)]
+    assert list(manager.query_subtasks(task=task, **filters)) == expected
@@ -0,0 +1,100 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import pytest
+
+from smart_project_manager.core.managers.project_manager import ProjectManager
+from smart_project_manager.core.utils import rank_between, rank_sequence
+
+
+@pytest.fixture
+def tasks(tmp_path):
+    manager = ProjectManager(data_dir=str(tmp_path))
+    project = manager.create_project("Project")
+    created = {title: manager.create_task(title, project.id) for title in "ABCD"}
+    yield manager, project.id, created
+    manager.close()
+
+
+def _titles(manager: ProjectManager, project_id: str) -> str:
+    return "".join(task.title for task in manager.query(project_id))
+
+
+def test_rank_between_orders_strictly_inside_its_bounds():
+    assert rank_between("i") > "i"
+    assert "i" < rank_between("i", "j") < "j"
+    assert "0" < rank_between(None, "1") < "1"
+    assert "i" < rank_between("i", "i1") < "i1"
+
+    rank = "i"
+    for _ in range(100):
+        following = rank_between(rank, None)
+        assert following > rank and not following.endswith("0")
+        rank = following
+
+
+@pytest.mark.parametrize('before, after', [("b", "b"), ("c", "b")])
+def test_rank_between_rejects_empty_bounds(before, after):
+    with pytest.raises(ValueError):
+        rank_between(before, after)
+
+
+def test_rank_sequence_is_sorted_and_unique():
+    ranks = rank_sequence(1000)
+    assert ranks == sorted(set(ranks))
+    assert not any(rank.endswith("0") for rank in ranks)
+
+
+def test_move_between_neighbours_and_to_either_end(tasks, tmp_path):
+    manager, project_id, created = tasks
+
+    manager.move_task(created["D"].id, created["A"].id, created["B"].id)
+    assert _titles(manager, project_id) == "ADBC"
+    manager.move_task(created["C"].id, None, created["A"].id)
+    assert _titles(manager, project_id) == "CADB"
+    manager.move_task(created["A"].id, created["B"].id, None)
+    assert _titles(manager, project_id) == "CDBA"
+    manager.close()
+
+    manager = ProjectManager(data_dir=str(tmp_path))
+    assert _titles(manager, project_id) == "CDBA"
+
+
+def test_move_between_neighbours_that_share_a_rank(tasks):
+    manager, project_id, created = tasks
+    created["C"].rank = created["B"].rank
+    manager._rebuild_indexes()
+    order = _titles(manager, project_id)
+
+    manager.move_task(created["D"].id, created[order[1]].id, created[order[2]].id)
+
+    assert _titles(manager, project_id) == order[:2] + "D" + order[2:3]
+    ranks = [task.rank for task in manager.query(project_id)]
+    assert ranks == sorted(set(ranks))
+
+
+def test_move_between_inverted_neighbours_is_rejected(tasks):
+    manager, project_id, created = tasks
+
+    manager.move_task(created["A"].id, created["C"].id, created["B"].id)
+
+    assert _titles(manager, project_id) == "ABCD"
+    assert [task.title for task in manager.get_tasks_by_project(project_id)] == list("ABCD")
+
+
+def test_long_ranks_are_spread_out_again(tasks, monkeypatch):
+    manager, project_id, created = tasks
+    monkeypatch.setattr(ProjectManager, 'MAX_RANK_LENGTH', 3)
+    reranks = []
+    rerank = manager._rerank
+    monkeypatch.setattr(manager, '_rerank', lambda *args: reranks.append(args) or rerank(*args))
+
+    # always dropping right after A halves the same gap until the keys get too long
+    for title in "BCDBCDBCDBCD":
+        order = _titles(manager, project_id)
+        following = order[order.index("A") + 1]
+        if following == title:
+            continue
+        manager.move_task(created[title].id, created["A"].id, created[following].id)
+        assert max(len(task.rank) for task in manager.query(project_id)) <= ProjectManager.MAX_RANK_LENGTH
+
+    assert reranks
+    assert _titles(manager, project_id) == "ADCB"
@@ -0,0 +1,51 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import random
+
+import pytest
+
+from smart_project_manager.core.services.search_index import SearchIndex
+
+
+WORDS = ["Fix", "login", "page", "Release", "notes", "Straße", "ÉCLAIR", "api", "refactor", "log"]
+
+
+def _brute_force(texts, project_id, query):
+    query = query.casefold()
+    return {task_id for task_id, (project, text) in texts.items()
+            if project == project_id and query in text}
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_search_matches_a_substring_scan(seed):
+    rng = random.Random(seed)
+    index = SearchIndex()
+    texts = {}
+
+    for step in range(300):
+        task_id = f"t{rng.randrange(60)}"
+        if rng.random() < 0.2:
+            index.remove(task_id)
+            texts.pop(task_id, None)
+            continue
+        project_id = rng.choice(["p1", "p2"])
+        title = " ".join(rng.choices(WORDS, k=rng.randint(1, 3)))
+        description = " ".join(rng.choices(WORDS, k=2)) if rng.random() < 0.5 else None
+        index.add(task_id, project_id, title, description)
+        texts[task_id] = (project_id, SearchIndex.normalize(title, description))
+
+    for query in ["", "l", "lo", "log", "LOGIN", "strasse", "éclair", "api log", "notes\nfix", "missing"]:
+        for project_id in ("p1", "p2", "p3"):
+            assert index.search(project_id, query) == _brute_force(texts, project_id, query), (query, project_id)
+
+
+def test_removing_the_last_task_drops_the_project_postings():
+    index = SearchIndex()
+    index.add("t1", "p1", "Write docs")
+    index.add("t1", "p2", "Write docs")
+    assert index.search("p1", "docs") == set()
+    assert index.search("p2", "docs") == {"t1"}
+
+    index.remove("t1")
+    index.remove("t1")
+    assert index.search("p2", "docs") == set()
+    assert index._postings == {} and index._project_tasks == {}
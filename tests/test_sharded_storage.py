@@ -0,0 +1,168 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import os
+import random
+
+import pytest
+
+from smart_project_manager.core.managers.project_manager import ProjectManager
+from smart_project_manager.core.storage.sharded_storage import ShardedStorage
+
+
+def _open(path) -> ProjectManager:
+    return ProjectManager(data_dir=str(path), storage="sharded")
+
+
+def _file_state(path: str):
+    return (os.stat(path).st_mtime_ns, os.path.getsize(path)) if os.path.exists(path) else None
+
+
+@pytest.fixture
+def store(tmp_path):
+    manager = _open(tmp_path)
+    label = manager.create_label("Urgent")
+    for name in ("A", "B", "C"):
+        project = manager.create_project(name)
+        task = manager.create_task(f"{name}1", project.id, labels=[label.id])
+        manager.create_subtask(f"{name}1.1", task.id, project.id)
+    manager.close()
+    return tmp_path, label.id
+
+
+def test_unscoped_queries_see_every_project_after_reopen(store):
+    path, label_id = store
+    manager = _open(path)
+
+    assert manager.get_statistics()['tasks'] == 3
+    assert sorted(task.title for task in manager.query()) == ["A1", "B1", "C1"]
+    assert len(list(manager.query(labels_all=[label_id]))) == 3
+    assert len(manager.get_tasks_by_label(label_id)) == 3
+    assert len(list(manager.query_subtasks())) == 3
+    manager.close()
+
+
+def test_rolled_back_project_delete_keeps_its_shard_loaded(store):
+    path, _ = store
+    manager = _open(path)
+    project = next(p for p in manager.get_all_projects() if p.name == "A")
+    assert [task.title for task in manager.query(project.id)] == ["A1"]
+
+    with pytest.raises(RuntimeError):
+        with manager.batch():
+            manager.delete_project(project.id)
+            raise RuntimeError("abort")
+
+    assert [task.title for task in manager.query(project.id)] == ["A1"]
+    manager.close()
+
+    manager = _open(path)
+    assert [task.title for task in manager.query(project.id)] == ["A1"]
+    manager.close()
+
+
+def test_edits_are_journaled_instead_of_rewriting_the_shard(store):
+    path, _ = store
+    manager = _open(path)
+    project = next(p for p in manager.get_all_projects() if p.name == "B")
+    task = next(manager.query(project.id))
+    shard_file = manager.storage._shard_file(project.id)
+    journal = manager.storage._shard_journal(project.id)
+    before = _file_state(shard_file), journal.size()
+
+    manager.update_task(task.id, completed=True)
+    manager.flush()
+
+    assert _file_state(shard_file) == before[0]
+    assert 0 < journal.size() - before[1] < 1024
+    manager.close()
+
+    manager = _open(path)
+    assert manager.get_project_counts(project.id)['completed_tasks'] == 1
+    assert next(manager.query(project.id)).completed
+    manager.close()
+
+
+def test_shard_journal_is_merged_once_it_grows(store, monkeypatch):
+    path, _ = store
+    monkeypatch.setattr(ShardedStorage, 'SHARD_JOURNAL_SIZE', 1)
+    manager = _open(path)
+    project = next(p for p in manager.get_all_projects() if p.name == "C")
+    task = next(manager.query(project.id))
+
+    manager.update_task(task.id, title="C1 renamed")
+    manager.create_task("C2", project.id)
+
+    journal = manager.storage._shard_journal(project.id)
+    assert os.path.exists(manager.storage._shard_file(project.id))
+    assert journal.size() == 0
+    manager.close()
+
+    manager = _open(path)
+    assert [t.title for t in manager.query(project.id)] == ["C1 renamed", "C2"]
+    assert manager.get_statistics()['tasks'] == 4
+    manager.close()
+
+
+def test_subtask_moved_to_another_project_before_a_flush(tmp_path):
+    manager = ProjectManager(data_dir=str(tmp_path), storage="sharded", flush_interval=60.0)
+    first = manager.create_project("First")
+    second = manager.create_project("Second")
+    task = manager.create_task("T1", first.id)
+    subtask = manager.create_subtask("S1", task.id, first.id)
+    manager.flush()
+
+    other = manager.create_task("T2", second.id)
+    manager.update_subtask(subtask.id, task_id=other.id)
+    manager.close()
+
+    manager = _open(tmp_path)
+    assert manager.get_project_counts(first.id)['subtasks'] == 0
+    assert manager.get_project_counts(second.id)['subtasks'] == 1
+    manager.get_tasks_by_project(second.id)
+    assert [s.title for s in manager.get_subtasks_by_task(other.id)] == ["S1"]
+    manager.get_tasks_by_project(first.id)
+    assert manager.get_subtasks_by_task(task.id) == []
+    manager.close()
+
+
+@pytest.mark.parametrize('seed', range(15))
+def test_counters_match_the_shards_after_deferred_flushes(tmp_path, monkeypatch, seed):
+    monkeypatch.setattr(ProjectManager, 'SHARD_BUDGET', 6)
+    rng = random.Random(seed)
+    manager = ProjectManager(data_dir=str(tmp_path), storage="sharded", flush_interval=60.0)
+    projects = [manager.create_project(f"P{index}").id for index in range(4)]
+
+    for step in range(200):
+        project_id = rng.choice(projects)
+        tasks = manager.get_tasks_by_project(project_id)
+        action = rng.randrange(6)
+        if action == 0 or not tasks:
+            manager.create_task(f"T{step}", project_id)
+            continue
+        task = rng.choice(tasks)
+        subtasks = manager.get_subtasks_by_task(task.id)
+        if action == 1:
+            manager.create_subtask(f"S{step}", task.id, project_id)
+        elif action == 2 and subtasks:
+            other = rng.choice(list(manager.tasks.values()))
+            manager.update_subtask(rng.choice(subtasks).id, task_id=other.id)
+        elif action == 3:
+            manager.update_task(task.id, project_id=rng.choice(projects))
+        elif action == 4 and subtasks:
+            subtask = rng.choice(subtasks)
+            manager.update_subtask(subtask.id, completed=not subtask.completed)
+        elif action == 5:
+            manager.delete_task(task.id)
+
+    statistics = manager.get_statistics()
+    manager.close()
+
+    manager = _open(tmp_path)
+    assert manager.get_statistics() == statistics
+    counts = {project_id: manager.get_project_counts(project_id) for project_id in projects}
+    monkeypatch.setattr(ProjectManager, 'SHARD_BUDGET', 10 ** 6)
+    list(manager.query())
+    assert manager.get_statistics() == statistics
+    for project_id in projects:
+        assert manager.get_project_counts(project_id) == counts[project_id]
+    assert manager.verify_progress()
+    manager.close()